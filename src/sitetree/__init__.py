@@ -1,3 +1,20 @@
 VERSION = "1.18.0"
 
 default_app_config = 'sitetree.apps.SitetreeConfig'
+
+
+def warm(aliases=None, languages=None, workers=None):
+    """Loads the given trees (all known trees by default) into cache without a request.
+    See `sitetree.sitetreeapp.warm()`.
+
+    :param aliases: Trees to load.
+    :param languages: Language codes to load internationalized trees for.
+    :param workers: Max number of threads to build trees in. Defaults to SITETREE_WARMUP_WORKERS setting.
+
+    """
+    from .sitetreeapp import warm as warm_  # noqa: PLC0415
+
+    if workers is None:
+        return warm_(aliases, languages)
+
+    return warm_(aliases, languages, workers)
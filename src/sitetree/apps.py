@@ -1,4 +1,9 @@
+import gc
+import warnings
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.db import DatabaseError, connections
 from django.utils.translation import gettext_lazy as _
 
 
@@ -8,3 +13,42 @@ class SitetreeConfig(AppConfig):
     name: str = 'sitetree'
     verbose_name: str = _('Site Trees')
     default_auto_field = 'django.db.models.AutoField'
+
+    warmed: bool = False
+    """Whether trees are warmed up in this process (see `.warm()`)."""
+
+    def ready(self):
+        from .settings import WARMUP  # noqa: PLC0415
+
+        if WARMUP and 'sitetree.middleware.SitetreeMiddleware' not in settings.MIDDLEWARE:
+            warnings.warn(
+                'SITETREE_WARMUP requires `sitetree.middleware.SitetreeMiddleware` to be active.', stacklevel=2)
+
+    def warm(self) -> bool:
+        """Loads trees (e.g. in a master process before workers are forked)
+        and moves all objects into a permanent GC generation,
+        so that memory pages stay shared between forked workers.
+
+        Called by `SitetreeMiddleware` on application handler creation
+        (not on management commands) if `SITETREE_WARMUP` is set.
+
+        Returns boolean whether trees are loaded.
+
+        """
+        from .sitetreeapp import warm  # noqa: PLC0415
+
+        try:
+            warm()
+
+        except DatabaseError as e:
+            # E.g. DB is not yet migrated.
+            warnings.warn(f'Unable to warm up sitetrees: {e}', stacklevel=2)
+            return False
+
+        # Forked workers should not inherit DB connections.
+        connections.close_all()
+        gc.freeze()
+
+        self.warmed = True
+
+        return True
@@ -0,0 +1,213 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from django.template.context import Context
+from jinja2 import pass_context
+from jinja2.ext import Extension
+from jinja2.runtime import Context as JinjaContext
+from markupsafe import Markup
+
+from .sitetreeapp import BranchesSelector, Literal, get_sitetree
+
+if False:  # pragma: nocover
+    from jinja2 import Environment  # noqa
+    from .models import TreeItemBase  # noqa
+
+
+class SitetreeExtension(Extension):
+    """Jinja2 extension exposing sitetree navigation functions to templates.
+
+    Add it to Jinja2 template backend options:
+
+        TEMPLATES = [{
+            'BACKEND': 'django.template.backends.jinja2.Jinja2',
+            'APP_DIRS': True,
+            'OPTIONS': {'extensions': ['sitetree.jinja.SitetreeExtension']},
+        }]
+
+    Use in templates:
+
+        {{ sitetree_menu('mytree', 'trunk,topmenu') }}
+        {{ sitetree_tree('mytree', template='sitetree/mytree.html') }}
+        {{ sitetree_breadcrumbs('mytree') }}
+        {{ sitetree_children(item, 'menu', 'sitetree/menu.html') }}
+        {{ sitetree_url(item) }}
+        {{ sitetree_page_title('mytree') }}
+
+    Items are rendered with Jinja2 templates (bundled ones are
+    in `sitetree/jinja2/sitetree/`) available as `sitetree_items`.
+
+    """
+    def __init__(self, environment: 'Environment'):
+        super().__init__(environment)
+        environment.globals.update(
+            sitetree_tree=sitetree_tree,
+            sitetree_children=sitetree_children,
+            sitetree_breadcrumbs=sitetree_breadcrumbs,
+            sitetree_menu=sitetree_menu,
+            sitetree_url=sitetree_url,
+            sitetree_page_title=sitetree_page_title,
+            sitetree_page_description=sitetree_page_description,
+            sitetree_page_hint=sitetree_page_hint,
+        )
+
+
+@pass_context
+def sitetree_tree(context: JinjaContext, tree_alias: str, template: str = 'sitetree/tree.html') -> Markup:
+    """Renders tree items from the given site tree.
+
+    :param context:
+    :param tree_alias:
+    :param template:
+
+    """
+    tree_items = get_sitetree().tree(Literal(tree_alias), get_context(context))
+    return render(context, tree_items, template)
+
+
+@pass_context
+def sitetree_children(context: JinjaContext, tree_item: 'TreeItemBase', navigation_type: str, template: str) -> Markup:
+    """Renders children of the given site tree item.
+
+    :param context:
+    :param tree_item:
+    :param navigation_type: menu, sitetree
+    :param template:
+
+    """
+    tree_items = get_sitetree().children_items(Literal(tree_item), navigation_type, get_context(context))
+    return render(context, tree_items, template)
+
+
+@pass_context
+def sitetree_breadcrumbs(
+        context: JinjaContext,
+        tree_alias: str,
+        template: str = 'sitetree/breadcrumbs.html'
+) -> Markup:
+    """Renders breadcrumb trail items from the given site tree.
+
+    :param context:
+    :param tree_alias:
+    :param template:
+
+    """
+    tree_items = get_sitetree().breadcrumbs(Literal(tree_alias), get_context(context))
+    return render(context, tree_items, template)
+
+
+@pass_context
+def sitetree_menu(
+        context: JinjaContext,
+        tree_alias: str,
+        tree_branches: str,
+        template: str = 'sitetree/menu.html'
+) -> Markup:
+    """Renders menu items from the given site tree.
+
+    :param context:
+    :param tree_alias:
+    :param tree_branches: Branches specification. E.g.: `trunk,1,level3`.
+    :param template:
+
+    """
+    tree_items = get_sitetree().menu(
+        Literal(tree_alias), Literal(get_branches_selector(tree_branches)), get_context(context))
+    return render(context, tree_items, template)
+
+
+@pass_context
+def sitetree_url(context: JinjaContext, tree_item: 'TreeItemBase') -> str:
+    """Returns resolved URL of the given site tree item.
+
+    :param context:
+    :param tree_item:
+
+    """
+    return get_sitetree().url(tree_item, get_context(context))
+
+
+@pass_context
+def sitetree_page_title(context: JinjaContext, tree_alias: str) -> str:
+    """Returns a title for current page, resolved against the given site tree.
+
+    :param context:
+    :param tree_alias:
+
+    """
+    return get_sitetree().get_current_page_title(Literal(tree_alias), get_context(context))
+
+
+@pass_context
+def sitetree_page_description(context: JinjaContext, tree_alias: str) -> str:
+    """Returns a description for current page, resolved against the given site tree.
+
+    :param context:
+    :param tree_alias:
+
+    """
+    return get_sitetree().get_current_page_attr('description', Literal(tree_alias), get_context(context))
+
+
+@pass_context
+def sitetree_page_hint(context: JinjaContext, tree_alias: str) -> str:
+    """Returns a hint for current page, resolved against the given site tree.
+
+    :param context:
+    :param tree_alias:
+
+    """
+    return get_sitetree().get_current_page_attr('hint', Literal(tree_alias), get_context(context))
+
+
+@lru_cache(maxsize=256)
+def get_branches_selector(tree_branches: str) -> BranchesSelector:
+    """Returns parsed branches specification. Specifications are parsed once.
+
+    :param tree_branches:
+
+    """
+    return BranchesSelector(tree_branches)
+
+
+def get_context(context: JinjaContext) -> Context:
+    """Returns Django context for sitetree handler.
+
+    Context is created once per request (with Jinja2 context variables
+    available for items titles) and is reused by subsequent calls.
+
+    :param context:
+
+    """
+    request = context.get('request')
+    sitetree = get_sitetree()
+
+    if request is None:
+        # Sitetree handler will complain.
+        return Context(context.get_all())
+
+    if id(request) == id(sitetree.current_request):
+        return sitetree.current_page_context
+
+    django_context = sitetree.init_request(request)
+    django_context.update(context.get_all())
+
+    return django_context
+
+
+def render(context: JinjaContext, tree_items: Optional[List['TreeItemBase']], template: str) -> Markup:
+    """Renders tree items with the given Jinja2 template.
+
+    Much like `include` the template is rendered with the current context,
+    with tree items available as `sitetree_items`.
+
+    :param context:
+    :param tree_items:
+    :param template:
+
+    """
+    template_obj = context.environment.get_template(template)
+    template_context = template_obj.new_context(
+        context.get_all(), shared=True, locals={'sitetree_items': tree_items or []})
+
+    return Markup(''.join(template_obj.root_render_func(template_context)))
@@ -4,7 +4,7 @@ from django.db import DEFAULT_DB_ALIAS
 from sitetree.compat import CommandOption, options_getter
 from sitetree.settings import APP_MODULE_NAME
 from sitetree.sitetreeapp import Cache
-from sitetree.utils import get_tree_model, import_project_sitetree_modules
+from sitetree.utils import get_permissions_ids, get_tree_model, import_project_sitetree_modules
 
 MODEL_TREE_CLASS = get_tree_model()
 
@@ -64,7 +64,8 @@ class Command(BaseCommand):
                             # Copy permissions to M2M field once `item`
                             # has been saved
                             if hasattr(item.access_permissions, 'set'):
-                                item.access_permissions.set(item.permissions)
+                                # Dynamic items hold permissions as given (names or IDs).
+                                item.access_permissions.set(get_permissions_ids(item.permissions))
 
                             else:
                                 item.access_permissions = item.permissions
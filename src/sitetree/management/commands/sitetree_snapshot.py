@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sitetree.compat import CommandOption, options_getter
+from sitetree.settings import DYNAMIC_ONLY, SNAPSHOT_PATH
+from sitetree.sitetreeapp import (
+    _IDX_ORPHAN_TREES,
+    compose_dynamic_tree,
+    get_dynamic_trees,
+    get_sitetree_builder,
+    register_dynamic_trees,
+)
+from sitetree.snapshot import Snapshot, dump_snapshot
+from sitetree.utils import get_tree_model, import_project_sitetree_modules
+
+MODEL_TREE_CLASS = get_tree_model()
+
+
+get_options = options_getter((
+    CommandOption(
+        '--output', action='store', dest='output', default=SNAPSHOT_PATH,
+        help='Snapshot file path. Defaults to SITETREE_SNAPSHOT_PATH setting value.'),
+))
+
+
+class Command(BaseCommand):
+
+    option_list = get_options()
+    help = (
+        'Compiles sitetrees from database and project applications '
+        '(defined in `app_name.sitetrees` modules or files) into a snapshot file.')
+    args = '[tree_alias tree_alias ...]'
+
+    def add_arguments(self, parser):
+        parser.add_argument('args', metavar='tree', nargs='*', help='Tree aliases.', default=[])
+        get_options(parser.add_argument)
+
+    def handle(self, *aliases, **options):
+
+        output = options.get('output') or SNAPSHOT_PATH
+
+        if not output:
+            raise CommandError('Snapshot file path is not set. Use --output or SITETREE_SNAPSHOT_PATH setting.')
+
+        # Trees defined in apps are considered only if they are not in DB.
+        apps_trees = [
+            tree
+            for module in import_project_sitetree_modules()
+            for tree in getattr(module, 'sitetrees', None) or []
+        ]
+
+        db_aliases = set() if DYNAMIC_ONLY else set(MODEL_TREE_CLASS.objects.values_list('alias', flat=True))
+        dynamic_aliases = set(get_dynamic_trees().get(_IDX_ORPHAN_TREES, {}))
+
+        register_dynamic_trees(compose_dynamic_tree([
+            tree for tree in apps_trees
+            if tree.alias not in db_aliases and tree.alias not in dynamic_aliases
+        ]))
+
+        if not aliases:
+            aliases = sorted(db_aliases | dynamic_aliases | {tree.alias for tree in apps_trees})
+
+        builder = get_sitetree_builder()
+
+        trees = {}
+
+        for alias in aliases:
+            builder.get_sitetree(alias)
+            # Items supplied by dynamic providers are not included into snapshot.
+            items = builder.cache.get_entry('sitetrees', alias)
+
+            if not items:
+                self.stdout.write(f'  Tree `{alias}` is not found. Skipped.\n')
+                continue
+
+            self.stdout.write(f'  Tree `{alias}`: {len(items)} item(s).\n')
+            trees[alias] = items
+
+        snapshot = dump_snapshot(trees)
+
+        Path(output).write_bytes(snapshot)
+
+        self.stdout.write(f'Snapshot {Snapshot(snapshot).version} is written into {output}.\n')
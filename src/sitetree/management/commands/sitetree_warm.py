@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from sitetree.compat import CommandOption, options_getter
+from sitetree.settings import WARMUP_WORKERS
+from sitetree.sitetreeapp import warm
+
+get_options = options_getter((
+    CommandOption(
+        '--language', action='append', dest='languages', default=None,
+        help='Language code to load internationalized trees for. Could be given several times. '
+             'Defaults to languages from LANGUAGES setting.'),
+    CommandOption(
+        '--workers', action='store', dest='workers', type=int, default=WARMUP_WORKERS,
+        help='Max number of threads to build trees in. Defaults to SITETREE_WARMUP_WORKERS setting value.'),
+))
+
+
+class Command(BaseCommand):
+
+    option_list = get_options()
+    help = 'Loads sitetrees into cache, so that no request pays for it.'
+    args = '[tree_alias tree_alias ...]'
+
+    def add_arguments(self, parser):
+        parser.add_argument('args', metavar='tree', nargs='*', help='Tree aliases.', default=[])
+        get_options(parser.add_argument)
+
+    def handle(self, *aliases, **options):
+
+        loaded = warm(aliases or None, options.get('languages'), options.get('workers') or WARMUP_WORKERS)
+
+        for alias in loaded:
+            self.stdout.write(f'  Tree `{alias}` is loaded.\n')
+
+        self.stdout.write(f'Trees loaded: {len(loaded)}.\n')
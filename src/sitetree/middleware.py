@@ -0,0 +1,126 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.apps import apps
+from django.http import HttpRequest, HttpResponse
+from django.utils.functional import cached_property
+
+from .settings import WARMUP
+from .sitetreeapp import Literal, get_sitetree
+
+if False:  # pragma: nocover
+    from .models import TreeItemBase  # noqa
+    from .sitetreeapp import SiteTree  # noqa
+
+
+class TreeNavigation:
+    """Lazily resolved navigation data of a certain tree for a request.
+
+    Nothing is computed until an attribute is accessed.
+
+    """
+    def __init__(self, request: HttpRequest, tree_alias: str):
+        self.request = request
+        self.tree_alias = tree_alias
+
+    def _get_tree(self) -> Tuple['SiteTree', Optional[str]]:
+        sitetree = get_sitetree()
+        # Alias is not to be resolved as a context variable.
+        tree_alias, _ = sitetree.init_tree(Literal(self.tree_alias), sitetree.init_request(self.request))
+        return sitetree, tree_alias
+
+    @cached_property
+    def current_item(self) -> Optional['TreeItemBase']:
+        """Item resolved as current for the request or None."""
+        sitetree, tree_alias = self._get_tree()
+
+        if tree_alias is None:
+            return None
+
+        return sitetree.get_tree_current_item(tree_alias)
+
+    @cached_property
+    def ancestors(self) -> List['TreeItemBase']:
+        """Ancestors of the current item (from root), current item excluded."""
+        current_item = self.current_item
+
+        if current_item is None:
+            return []
+
+        sitetree, tree_alias = self._get_tree()
+        get_item_by_id = sitetree.get_item_by_id
+
+        ancestors = []
+        parent = current_item.parent
+
+        while parent is not None:
+            parent = get_item_by_id(tree_alias, parent.id)
+            ancestors.append(parent)
+            parent = parent.parent
+
+        ancestors.reverse()
+
+        return ancestors
+
+    @cached_property
+    def breadcrumbs(self) -> List['TreeItemBase']:
+        """Breadcrumb trail items."""
+        sitetree = get_sitetree()
+        return sitetree.breadcrumbs(Literal(self.tree_alias), sitetree.init_request(self.request))
+
+    @cached_property
+    def title(self) -> str:
+        """Resolved title of the current item. Empty string if no current item."""
+        current_item = self.current_item
+
+        if current_item is None:
+            return ''
+
+        return f'{current_item.title_resolved}'
+
+
+class RequestNavigation:
+    """Lazy sitetree navigation data for a request.
+    Available as `request.sitetree` if `SitetreeMiddleware` is active.
+
+    Navigation for a certain tree is addressed by the tree alias:
+
+        request.sitetree['main'].title
+        {{ request.sitetree.main.breadcrumbs }}
+
+    """
+    def __init__(self, request: HttpRequest):
+        self.request = request
+        self._trees: Dict[str, TreeNavigation] = {}
+
+    def __getitem__(self, tree_alias: str) -> TreeNavigation:
+        navigation = self._trees.get(tree_alias)
+
+        if navigation is None:
+            navigation = TreeNavigation(self.request, tree_alias)
+            self._trees[tree_alias] = navigation
+
+        return navigation
+
+
+class SitetreeMiddleware:
+    """Attaches lazy navigation data object to request as `request.sitetree`.
+
+    Views, context processors and templates may reuse it instead of computing
+    current item, breadcrumbs, etc. on their own. No sitetree work is done
+    for requests (e.g. API calls, redirects) not accessing this object.
+
+    Also warms up trees on application handler creation if `SITETREE_WARMUP` is set.
+
+    """
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+        if WARMUP:
+            config = apps.get_app_config('sitetree')
+
+            if not config.warmed:
+                config.warm()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        request.sitetree = RequestNavigation(request)
+        return self.get_response(request)
@@ -0,0 +1,333 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from django.template.base import render_value_in_context
+from django.template.context import Context
+
+if False:  # pragma: nocover
+    from .models import TreeItemBase  # noqa
+    from .sitetreeapp import SiteTree  # noqa
+
+TypeRenderer = Callable[['SiteTree', Context, List['TreeItemBase']], str]
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+"""Directory with bundled templates."""
+
+RENDERERS: Dict[str, TypeRenderer] = {}
+"""Python-native renderers for bundled templates indexed by template names."""
+
+
+def renderer(template_name: str) -> Callable[[TypeRenderer], TypeRenderer]:
+    """Registers a Python-native renderer for the given bundled template.
+
+    Renderer is expected to produce the same markup as the template does.
+
+    :param template_name:
+
+    """
+    def register(func: TypeRenderer) -> TypeRenderer:
+        RENDERERS[template_name] = func
+        return func
+
+    return register
+
+
+def get_renderer(template: Any) -> Optional[TypeRenderer]:
+    """Returns a Python-native renderer for the given template object
+    if it is a bundled template not overridden by the project. Returns None otherwise.
+
+    :param template: A template object as returned by `get_template()`.
+
+    """
+    origin = getattr(getattr(template, 'template', template), 'origin', None)
+
+    if origin is None:
+        return None
+
+    return _get_renderer(origin.name, origin.template_name)
+
+
+@lru_cache(maxsize=128)
+def _get_renderer(path: str, template_name: Optional[str]) -> Optional[TypeRenderer]:
+    func = RENDERERS.get(template_name)
+
+    if func is None or Path(path) != TEMPLATES_DIR / template_name:
+        return None
+
+    return func
+
+
+def get_string_if_invalid(context: Context, name: str) -> str:
+    """Returns a value for a variable missing in context,
+    as the template engine does.
+
+    :param context:
+    :param name:
+
+    """
+    template = context.template
+
+    if template is None:
+        return ''
+
+    string_if_invalid = template.engine.string_if_invalid
+
+    if '%s' in string_if_invalid:
+        return string_if_invalid % name
+
+    return string_if_invalid
+
+
+def render_children(
+        sitetree: 'SiteTree',
+        context: Context,
+        item: 'TreeItemBase',
+        navigation_type: str,
+        template_name: str
+) -> str:
+    """Renders children of the given item as `sitetree_children` tag does.
+    The item is available in context as `item` as it is within `for` loop.
+
+    :param sitetree:
+    :param context:
+    :param item:
+    :param navigation_type:
+    :param template_name:
+
+    """
+    with context.push(item=item):
+        return sitetree.children(item, navigation_type, template_name, context)
+
+
+@renderer('sitetree/menu.html')
+def render_menu(sitetree: 'SiteTree', context: Context, tree_items: List['TreeItemBase']) -> str:
+    url = sitetree.url
+    out = ['\n<ul>\n\t']
+
+    for item in tree_items:
+        hint = item.hint
+        is_current = item.is_current
+        in_current_branch = item.in_current_branch
+
+        out.append('\n\t<li>\n        <a href="')
+        out.append(url(item, context))
+        out.append('" ')
+
+        if hint:
+            out.append(f'title="{render_value_in_context(hint, context)}"')
+
+        out.append(' ')
+
+        if is_current or in_current_branch:
+            out.append('class="')
+            out.append('current_item ' if is_current else '')
+            out.append('current_branch' if in_current_branch else '')
+            out.append('"')
+
+        out.append('>')
+        out.append(render_value_in_context(item.title_resolved, context))
+        out.append('</a>\n\t\t')
+
+        if item.has_children:
+            out.append('\n\t\t\t')
+            out.append(render_children(sitetree, context, item, 'menu', 'sitetree/menu.html'))
+            out.append('\n\t\t')
+
+        out.append('\n\t</li>\n\t')
+
+    out.append('\n</ul>')
+
+    return ''.join(out)
+
+
+@renderer('sitetree/tree.html')
+def render_tree(sitetree: 'SiteTree', context: Context, tree_items: List['TreeItemBase']) -> str:
+
+    if not tree_items:
+        return '\n'
+
+    url = sitetree.url
+    out = ['\n\n<ul>\n\t']
+
+    for item in tree_items:
+        out.append('\n\t\t')
+
+        if item.insitetree:
+            hint = item.hint
+
+            out.append('\n\t\t\t<li>\n\t\t\t\t<a href="')
+            out.append(url(item, context))
+            out.append('" ')
+
+            if hint:
+                out.append(f'title="{render_value_in_context(hint, context)}"')
+
+            out.append('>')
+            out.append(render_value_in_context(item.title_resolved, context))
+            out.append('</a>\n\t\t\t\t')
+
+            if item.has_children:
+                out.append('\n\t\t\t\t\t')
+                out.append(render_children(sitetree, context, item, 'sitetree', 'sitetree/tree.html'))
+                out.append('\n\t\t\t\t')
+
+            out.append('\n\t\t\t</li>\n\t\t')
+
+        out.append('\n\t')
+
+    out.append('\n</ul>\n')
+
+    return ''.join(out)
+
+
+@renderer('sitetree/breadcrumbs.html')
+def render_breadcrumbs(sitetree: 'SiteTree', context: Context, tree_items: List['TreeItemBase']) -> str:
+
+    if len(tree_items) == 1:
+        return '\n\n'
+
+    url = sitetree.url
+    last = len(tree_items) - 1
+    out = ['\n\n<ul>\n\t']
+
+    for idx, item in enumerate(tree_items):
+        out.append('\n\t\t')
+
+        if idx != last:
+            hint = item.hint
+
+            out.append('\n\t\t\t<li><a href="')
+            out.append(url(item, context))
+            out.append('" ')
+
+            if hint:
+                out.append(f'title="{render_value_in_context(hint, context)}"')
+
+            out.append('>')
+            out.append(render_value_in_context(item.title_resolved, context))
+            out.append('</a></li>\n\t\t\t<li>&gt;</li>\n\t\t')
+
+        else:
+            out.append('\n\t\t\t<li>')
+            out.append(render_value_in_context(item.title_resolved, context))
+            out.append('</li>\n\t\t')
+
+        out.append('\n\t')
+
+    out.append('\n</ul>\n')
+
+    return ''.join(out)
+
+
+@renderer('sitetree/breadcrumbs_bootstrap4.html')
+def render_breadcrumbs_bootstrap4(sitetree: 'SiteTree', context: Context, tree_items: List['TreeItemBase']) -> str:
+
+    if len(tree_items) == 1:
+        return '\n\n'
+
+    url = sitetree.url
+    last = len(tree_items) - 1
+    out = ['\n\n<nav aria-label="breadcrumb" role="navigation">\n    <ol class="breadcrumb">\n        ']
+
+    for idx, item in enumerate(tree_items):
+        out.append('\n            ')
+
+        if idx != last:
+            out.append('\n                <li class="breadcrumb-item"><a href="')
+            out.append(url(item, context))
+            out.append('">')
+            out.append(render_value_in_context(item.title_resolved, context))
+            out.append('</a></li>\n            ')
+
+        else:
+            out.append('\n                <li class="breadcrumb-item active">')
+            out.append(render_value_in_context(item.title_resolved, context))
+            out.append('</li>\n            ')
+
+        out.append('\n        ')
+
+    out.append('\n    </ol>\n</nav>\n')
+
+    return ''.join(out)
+
+
+@renderer('sitetree/menu_bootstrap5.html')
+def render_menu_bootstrap5(sitetree: 'SiteTree', context: Context, tree_items: List['TreeItemBase']) -> str:
+    url = sitetree.url
+
+    try:
+        extra_class_ul = render_value_in_context(context['extra_class_ul'], context)
+
+    except KeyError:
+        extra_class_ul = get_string_if_invalid(context, 'extra_class_ul')
+
+    out = [f'\n<ul class="navbar-nav mr-auto {extra_class_ul}">\n    ']
+
+    for item in tree_items:
+        has_children = item.has_children
+
+        out.append('\n        <li class="nav-item ')
+        out.append('dropdown' if has_children else '')
+        out.append('">\n            <a href="')
+        out.append('#' if has_children else url(item, context))
+        out.append('" class="nav-link ')
+        out.append('active' if item.is_current or item.in_current_branch else '')
+        out.append(' ')
+
+        if has_children:
+            out.append('dropdown-toggle" aria-haspopup="true" id="navitem-')
+            out.append(render_value_in_context(item.id, context))
+            out.append('" data-bs-toggle="dropdown')
+
+        out.append('">\n                ')
+        out.append(render_value_in_context(item.title_resolved, context))
+        out.append('\n            </a>\n            ')
+
+        if has_children:
+            out.append('\n                ')
+            out.append(render_children(sitetree, context, item, 'menu', 'sitetree/menu_bootstrap5_dropdown.html'))
+            out.append('\n            ')
+
+        out.append('\n        </li>\n    ')
+
+    out.append('\n</ul>\n')
+
+    return ''.join(out)
+
+
+@renderer('sitetree/menu_bootstrap5_dropdown.html')
+def render_menu_bootstrap5_dropdown(
+        sitetree: 'SiteTree',
+        context: Context,
+        tree_items: List['TreeItemBase']
+) -> str:
+    url = sitetree.url
+
+    try:
+        parent_id = render_value_in_context(context['item'].id, context)
+
+    except (KeyError, AttributeError):
+        parent_id = get_string_if_invalid(context, 'item.id')
+
+    out = [f'\n<div class="dropdown-menu" aria-labelledby="navitem-{parent_id}">\n    ']
+
+    for item in tree_items:
+        hint = item.hint
+
+        out.append('\n        <a class="dropdown-item ')
+        out.append('active' if item.is_current or item.in_current_branch else '')
+        out.append('" href="')
+        out.append(url(item, context))
+        out.append('" ')
+
+        if hint:
+            out.append(f'title="{render_value_in_context(hint, context)}"')
+
+        out.append('>')
+        out.append(render_value_in_context(item.title_resolved, context))
+        out.append('</a>\n    ')
+
+    out.append('\n</div>\n')
+
+    return ''.join(out)
@@ -33,12 +33,74 @@ Cache is only invalidated on sitetree or sitetree item change.
 
 """
 
+CACHE_COMPRESS: bool = getattr(settings, 'SITETREE_CACHE_COMPRESS', True)
+"""Whether to compress sitetree data stored in Django cache (lz4 is used if installed, zlib otherwise)."""
+
+CACHE_CHUNK_SIZE: int = getattr(settings, 'SITETREE_CACHE_CHUNK_SIZE', 900 * 1024)
+"""Max size (in bytes) of a value stored in Django cache. Larger sitetree data is split
+into chunks stored under separate keys (e.g. Memcached rejects values over 1 MB by default).
+Zero disables chunking.
+
+"""
+
+CACHE_FAILURES_THRESHOLD: int = getattr(settings, 'SITETREE_CACHE_FAILURES_THRESHOLD', 3)
+"""Number of consecutive failed Django cache calls after which sitetree stops
+calling cache backend for SITETREE_CACHE_RETRY_TIMEOUT seconds and uses
+a process-local copy of trees data (or builds trees from DB) instead.
+
+"""
+
+CACHE_RETRY_TIMEOUT: int = getattr(settings, 'SITETREE_CACHE_RETRY_TIMEOUT', 30)
+"""Seconds after which a call is made to probe whether failed cache backend is back."""
+
+CACHE_CALL_TIMEOUT: float = getattr(settings, 'SITETREE_CACHE_CALL_TIMEOUT', 0.5)
+"""Seconds after which a Django cache call is considered failed.
+A call is not interrupted, so set also short socket timeouts in cache backend options.
+
+"""
+
 CACHE_NAME: str = getattr(settings, 'SITETREE_CACHE_NAME', 'default')
 """Sitetree cache name to use (Defined in django CACHES hash)."""
 
 ADMIN_APP_NAME: str = getattr(settings, 'SITETREE_ADMIN_APP_NAME', 'admin')
 """Admin application name. In cases custom admin application is used."""
 
+REVERSE_CACHE_SIZE: int = getattr(settings, 'SITETREE_REVERSE_CACHE_SIZE', 4096)
+"""Max number of reversed URLs (for items with URL as pattern) to be kept in process memory."""
+
+CURRENT_ITEM_PREFIX_MATCH: bool = getattr(settings, 'SITETREE_CURRENT_ITEM_PREFIX_MATCH', False)
+"""Whether to consider an item with the longest URL being a prefix of the current URL
+as current, if no item URL equals to the current one.
+
+"""
+
+NATIVE_RENDERERS: bool = getattr(settings, 'SITETREE_NATIVE_RENDERERS', True)
+"""Whether to render bundled templates (if not overridden by the project)
+with Python-native renderers producing the same markup.
+
+"""
+
+NAVIGATION_STREAM_THRESHOLD: int = getattr(settings, 'SITETREE_NAVIGATION_STREAM_THRESHOLD', 1000)
+"""Number of tree items starting from which navigation JSON (see `sitetree.views.navigation()`)
+is streamed instead of being rendered at once.
+
+"""
+
+WARMUP: bool = getattr(settings, 'SITETREE_WARMUP', False)
+"""Whether to load trees on application start (see `sitetree.sitetreeapp.warm()`)
+and freeze them in garbage collector, so that memory pages are shared by forked processes.
+
+"""
+
+WARMUP_WORKERS: int = getattr(settings, 'SITETREE_WARMUP_WORKERS', 4)
+"""Max number of threads to build trees in on warm up."""
+
+SNAPSHOT_PATH: str = getattr(settings, 'SITETREE_SNAPSHOT_PATH', '')
+"""Path to a trees snapshot file compiled with `sitetree_snapshot` command.
+If set, trees are loaded from this file instead of DB and Django cache.
+
+"""
+
 
 # Reserved tree items aliases.
 ALIAS_TRUNK = 'trunk'
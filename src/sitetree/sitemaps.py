@@ -0,0 +1,124 @@
+from collections.abc import Sequence
+from itertools import islice
+from typing import Iterator, List, Optional, Union
+
+from django.contrib.sitemaps import Sitemap
+from django.http import HttpRequest
+
+from .sitetreeapp import Literal, get_sitetree_guest
+
+SITEMAP_LIMIT: int = 50000
+"""Max number of URLs in a sitemap file (as per sitemaps protocol)."""
+
+
+def get_sitemap_urls(tree_alias: str, request: Optional[HttpRequest] = None) -> Iterator[str]:
+    """Yields unique site URLs of the given tree items to be listed in a sitemap.
+
+    Cached tree is walked in tree order the same way as for `sitetree_tree` tag
+    for an anonymous user: hidden items, items not shown in site tree
+    and items not accessible to guests are skipped along with their children.
+    Items with URLs not being site paths (e.g. external or unresolved) are skipped.
+    Nothing is yielded for unknown trees.
+
+    :param tree_alias:
+    :param request: Request to resolve items for. If not set, a blank request is used.
+
+    """
+    sitetree = get_sitetree_guest(request)
+    context = sitetree.current_page_context
+
+    # Alias may come from URL: unknown trees are not to be fetched and cached.
+    if not sitetree.tree_exists(tree_alias):
+        return
+
+    tree_alias, sitetree_items = sitetree.init_tree(Literal(tree_alias), context)
+
+    if not sitetree_items:
+        return
+
+    get_children = sitetree.get_children
+    filter_items = sitetree.filter_items
+    url = sitetree.url
+
+    seen = set()
+    stack = list(reversed(filter_items(get_children(tree_alias, None), 'sitetree')))
+
+    while stack:
+        item = stack.pop()
+        item_url = url(item, context)
+
+        if item_url.startswith('/') and not item_url.startswith('//') and item_url not in seen:
+            seen.add(item_url)
+            yield item_url
+
+        stack.extend(reversed(filter_items(get_children(tree_alias, item), 'sitetree')))
+
+
+class SitemapUrls(Sequence):
+    """Lazy sequence of site URLs of the given tree (see `get_sitemap_urls()`).
+
+    URLs are walked anew on every access instead of being kept in memory,
+    so that `django.contrib.sitemaps` paginator holds only URLs of a requested page.
+
+    """
+    def __init__(self, tree_alias: str, request: Optional[HttpRequest] = None):
+        self.tree_alias = tree_alias
+        self.request = request
+        self._length = None
+
+    def __iter__(self) -> Iterator[str]:
+        return get_sitemap_urls(self.tree_alias, self.request)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+
+        if isinstance(index, slice):
+            if (index.start or 0) < 0 or (index.stop or 0) < 0 or (index.step or 1) < 0:
+                return list(self)[index]
+
+            return list(islice(self, index.start, index.stop, index.step))
+
+        if index < 0:
+            index += len(self)
+
+        url = next(islice(self, index, None), None) if index >= 0 else None
+
+        if url is None:
+            raise IndexError('Sitemap URL index out of range.')
+
+        return url
+
+
+class SitetreeSitemap(Sitemap):
+    """Sitemap for `django.contrib.sitemaps` listing URLs of tree items (see `get_sitemap_urls()`).
+
+    Either pass a tree alias:
+
+        sitemaps = {'main': SitetreeSitemap('main')}
+
+    or subclass:
+
+        class MainSitemap(SitetreeSitemap):
+            tree_alias = 'main'
+
+    Items are a lazy sequence (see `SitemapUrls`), so that only URLs of a requested page
+    are kept in memory (unless `i18n` is set, since the latter requires a list of all items).
+
+    """
+    tree_alias: str = ''
+    """Alias of a tree to list URLs from."""
+
+    def __init__(self, tree_alias: Optional[str] = None):
+        if tree_alias is not None:
+            self.tree_alias = tree_alias
+
+    def items(self) -> SitemapUrls:
+        return SitemapUrls(self.tree_alias)
+
+    def location(self, item: str) -> str:
+        return item
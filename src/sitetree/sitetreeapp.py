@@ -1,24 +1,45 @@
+import pickle
 import warnings
 from collections import defaultdict
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from copy import copy, deepcopy
+from functools import lru_cache
+from hashlib import blake2b
+from importlib import import_module
 from inspect import getfullargspec
 from sys import exc_info
-from threading import local
+from threading import Lock, local
+from time import monotonic
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
 
 from django.conf import settings
 from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.db import connections
 from django.db.models import QuerySet, signals
-from django.template.base import VARIABLE_TAG_START, FilterExpression, Lexer, Parser, Variable, VariableDoesNotExist
+from django.http import HttpRequest
+from django.template.base import (
+    VARIABLE_TAG_START,
+    FilterExpression,
+    Lexer,
+    NodeList,
+    Parser,
+    Template,
+    Variable,
+    VariableDoesNotExist,
+)
 from django.template.context import Context
 from django.template.loader import get_template
-from django.urls import NoReverseMatch, reverse
+from django.urls import NoReverseMatch, get_resolver, get_script_prefix, get_urlconf, reverse
 from django.utils import module_loading
 from django.utils.encoding import iri_to_uri
-from django.utils.translation import get_language
+from django.utils.translation import get_language, override
 
 from .compat import TOKEN_TEXT, TOKEN_VAR
 from .exceptions import SiteTreeError
+from .renderers import get_renderer
 from .settings import (
     ADMIN_APP_NAME,
     ALIAS_THIS_ANCESTOR_CHILDREN,
@@ -26,21 +47,43 @@ from .settings import (
     ALIAS_THIS_PARENT_SIBLINGS,
     ALIAS_THIS_SIBLINGS,
     ALIAS_TRUNK,
+    CACHE_CALL_TIMEOUT,
+    CACHE_CHUNK_SIZE,
+    CACHE_COMPRESS,
+    CACHE_FAILURES_THRESHOLD,
     CACHE_NAME,
+    CACHE_RETRY_TIMEOUT,
     CACHE_TIMEOUT,
+    CURRENT_ITEM_PREFIX_MATCH,
     DYNAMIC_ONLY,
+    NATIVE_RENDERERS,
     RAISE_ITEMS_ERRORS_ON_DEBUG,
+    REVERSE_CACHE_SIZE,
     SITETREE_CLS,
+    SNAPSHOT_PATH,
     UNRESOLVED_ITEM_MARKER,
+    WARMUP_WORKERS,
+)
+from .snapshot import get_snapshot_entries, read_snapshot
+from .utils import (
+    aresolve_permissions,
+    assign_dynamic_ids,
+    compress,
+    decompress,
+    get_tree_item_model,
+    get_tree_model,
+    import_app_sitetree_module,
+    resolve_permissions,
 )
-from .utils import generate_id_for, get_tree_item_model, get_tree_model, import_app_sitetree_module
+from .utils import tree as create_tree
 
 if False:  # pragma: nocover
     from django.contrib.auth.models import User  # noqa
+    from django.urls import ResolverMatch, URLResolver  # noqa
     from .models import TreeItemBase, TreeBase
 
 TypeDynamicTrees = Dict[str, Union[Dict[str, List['TreeBase']], List['TreeBase']]]
-TypeStrExpr = Union[str, FilterExpression]
+TypeStrExpr = Union[str, FilterExpression, 'Literal']
 
 MODEL_TREE_CLASS = get_tree_model()
 MODEL_TREE_ITEM_CLASS = get_tree_item_model()
@@ -64,27 +107,136 @@ _IDX_ORPHAN_TREES: str = 'orphans'
 _IDX_TPL: str = '%s|:|%s'
 """Name template used as dictionary index in `_DYNAMIC_TREES`."""
 
-_THREAD_LOCAL = local()
-_THREAD_SITETREE: str = 'sitetree'
+_DYNAMIC_PROVIDERS: Dict[str, List['DynamicProvider']] = {}
+"""Holds dynamic items providers indexed by target tree alias."""
+
+_CONTEXT_SITETREE: ContextVar[Optional['SiteTree']] = ContextVar('sitetree', default=None)
+"""Holds sitetree handler for the current context (thread or asynchronous task)."""
+
 _UNSET = set()  # Sentinel
 
-cache = caches[CACHE_NAME]
+_CACHE_LOCAL: Dict[str, bytes] = {}
+"""Process-local copy of sitetree data packed for cache. Used when cache is unavailable."""
+
+_THREAD_DECODED = local()
+"""Sitetree data last decoded in a thread along with packed data it is decoded from (see `Cache.unpack()`)."""
 
 
 def get_sitetree() -> 'SiteTree':
-    """Returns SiteTree (thread-singleton) object, implementing utility methods.
+    """Returns SiteTree (context-singleton) object, implementing utility methods.
     This can return the built-in or a customized (see SITETREE_CLS setting) sitetree handler.
 
+    Handler is bound to the current context, so that threads and asynchronous tasks
+    (e.g. concurrent requests served by an ASGI application) get their own handlers.
+
     """
-    sitetree = getattr(_THREAD_LOCAL, _THREAD_SITETREE, None)
+    sitetree = _CONTEXT_SITETREE.get()
 
     if sitetree is None:
         sitetree = _SITETREE_CLS()
-        setattr(_THREAD_LOCAL, _THREAD_SITETREE, sitetree)
+        _CONTEXT_SITETREE.set(sitetree)
+
+    return sitetree
+
+
+async def aget_sitetree() -> 'SiteTree':
+    """Async variant of `get_sitetree()`.
+
+    A new handler makes no blocking cache calls: its data is loaded
+    using async Django cache API on first use (e.g. by `SiteTree.amenu()`).
+
+    """
+    sitetree = _CONTEXT_SITETREE.get()
+
+    if sitetree is None:
+        sitetree = _SITETREE_CLS(init=False)
+        _CONTEXT_SITETREE.set(sitetree)
 
     return sitetree
 
 
+def render_items(context: Context, tree_items: List['TreeItemBase'], template: Any) -> str:
+    """Renders the given tree items with the given template object.
+
+    Items are pushed onto the existing context (available as `sitetree_items`)
+    instead of flattening it into a new one.
+
+    Bundled templates not overridden by the project are rendered
+    with Python-native renderers (see `SITETREE_NATIVE_RENDERERS` setting).
+
+    :param context:
+    :param tree_items:
+    :param template: A template object as returned by `get_template()`.
+
+    """
+    if NATIVE_RENDERERS:
+        renderer = get_renderer(template)
+
+        if renderer is not None:
+            return renderer(get_sitetree(), context, tree_items)
+
+    base_template = getattr(template, 'template', template)
+
+    with context.push(sitetree_items=tree_items):
+
+        if isinstance(base_template, Template):
+            return base_template.render(context)
+
+        # Not a Django template engine. Fall back to a dictionary.
+        return template.render(context.flatten())
+
+
+def reverse_url(view_path: str, args: Sequence, current_app: str) -> Optional[str]:
+    """Reverses URL for the given view path (URL pattern name) and arguments.
+    Returns None if unable to reverse.
+
+    Results for simple arguments (strings and numbers) are cached in process memory
+    per URL resolver, so that they are not reused after `django.urls.clear_url_caches()`
+    (e.g. on URLconf reload).
+
+    :param view_path:
+    :param args:
+    :param current_app:
+
+    """
+    if all(isinstance(arg, (str, int)) for arg in args):
+        # Types are a part of a cache key since e.g. `1 == True`.
+        return _reverse_url_cached(
+            view_path, tuple(args), tuple(map(type, args)),
+            current_app, get_language(), get_resolver(get_urlconf()), get_script_prefix())
+
+    return _reverse_url(view_path, args, current_app)
+
+
+def _reverse_url(view_path: str, args: Sequence, current_app: str) -> Optional[str]:
+    try:
+        return reverse(view_path, args=args, current_app=current_app)
+
+    except NoReverseMatch:
+        return None
+
+
+@lru_cache(maxsize=REVERSE_CACHE_SIZE)
+def _reverse_url_cached(
+        view_path: str,
+        args: tuple,
+        types: tuple,
+        current_app: str,
+        language: Optional[str],
+        resolver: 'URLResolver',
+        script_prefix: str,
+) -> Optional[str]:
+    return _reverse_url(view_path, args, current_app)
+
+
+def _on_setting_changed(setting: str, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _reverse_url_cached.cache_clear()
+
+
+setting_changed.connect(_on_setting_changed)
+
+
 def register_items_hook(func: Callable):
     """Registers a hook callable to process tree items right before they are passed to templates.
 
@@ -243,6 +395,145 @@ def get_dynamic_trees() -> TypeDynamicTrees:
     return _DYNAMIC_TREES
 
 
+def get_tree_aliases() -> List[str]:
+    """Returns aliases of all known trees: from DB (unless `SITETREE_DYNAMIC_ONLY` is set),
+    from a snapshot (if `SITETREE_SNAPSHOT_PATH` is set) and registered dynamic trees.
+
+    """
+    aliases = set(_DYNAMIC_TREES.get(_IDX_ORPHAN_TREES, {}))
+
+    if SNAPSHOT_PATH:
+        aliases.update(read_snapshot(SNAPSHOT_PATH).trees)
+
+    elif not DYNAMIC_ONLY:
+        aliases.update(MODEL_TREE_CLASS.objects.values_list('alias', flat=True))
+
+    return sorted(aliases)
+
+
+def warm(
+        aliases: Optional[Sequence[str]] = None,
+        languages: Optional[Sequence[str]] = None,
+        workers: int = WARMUP_WORKERS
+) -> List[str]:
+    """Loads the given trees into cache without a request: builds trees and their indexes,
+    compiles items titles and resolves URLs of items with URL patterns having no arguments.
+
+    Internationalized trees (see `register_i18n_trees()`) are loaded for every given language.
+
+    URLconf is imported beforehand, since dynamic and internationalized trees
+    are usually registered there.
+
+    Trees are built concurrently and are written into cache at once.
+
+    Returns aliases of loaded trees.
+
+    :param aliases: Trees to load. If not set, all known trees are loaded.
+
+    :param languages: Language codes to load internationalized trees for.
+        If not set, languages from LANGUAGES setting are used.
+
+    :param workers: Max number of threads to build trees in.
+
+    """
+    import_module(settings.ROOT_URLCONF)
+
+    if aliases is None:
+        aliases = get_tree_aliases()
+
+    if languages is None:
+        languages = [code for code, _ in settings.LANGUAGES] if _I18N_TREES else [get_language()]
+
+    tasks = [
+        (alias, language)
+        for idx, language in enumerate(languages)
+        for alias in aliases
+        # Not internationalized trees are loaded only once.
+        if not idx or alias in _I18N_TREES
+    ]
+
+    if workers > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda task: _warm_tree(*task, in_thread=True), tasks))
+
+    else:
+        results = [_warm_tree(*task) for task in tasks]
+
+    cache_ = Cache()
+    loaded = []
+
+    for tree_alias, entries in results:
+
+        for entry_name, entry in entries.items():
+            cache_.cache.setdefault(entry_name, {}).update(entry)
+
+        if tree_alias is not None and tree_alias not in loaded:
+            loaded.append(tree_alias)
+
+    cache_.save()
+
+    return loaded
+
+
+def _warm_tree(alias: str, language: str, *, in_thread: bool = False) -> Tuple[Optional[str], dict]:
+    """Builds the given tree for warm up. Returns (resolved alias or None if no tree, cache entries) tuple.
+
+    :param alias:
+    :param language:
+    :param in_thread: Whether called in a pool thread.
+
+    """
+    try:
+        with override(language):
+            sitetree = get_sitetree_builder()
+            tree_alias, items = sitetree.get_sitetree(alias)
+            url = sitetree.url
+
+            for item in items:
+                title = item.title
+
+                if VARIABLE_TAG_START in title:
+                    compile_title(title)
+
+                if item.urlaspattern and not item.url_compiled[1]:
+                    url(item)
+
+            return (tree_alias if items else None), sitetree.cache.cache
+
+    finally:
+        if in_thread:
+            # Thread DB connections are not reused.
+            connections.close_all()
+
+
+def get_sitetree_builder() -> 'SiteTree':
+    """Returns a new SiteTree object not bound to Django cache (see `BuildCache`)
+    initialized to build trees without a request.
+
+    """
+    sitetree = _SITETREE_BUILDER_CLS()
+    sitetree.init(Context({'request': HttpRequest()}))
+    return sitetree
+
+
+def get_sitetree_guest(request: Optional[HttpRequest] = None) -> 'SiteTree':
+    """Returns a new SiteTree object initialized to resolve navigation
+    for an anonymous user. Trees data is taken from cache.
+
+    :param request: Request to copy (with user replaced). If not set, a blank request is used.
+
+    """
+    from django.contrib.auth.models import AnonymousUser  # noqa: PLC0415
+
+    guest_request = copy(request) if request is not None else HttpRequest()
+    guest_request.user = AnonymousUser()
+
+    sitetree = _SITETREE_CLS()
+    sitetree.init_context(Context({'request': guest_request}))
+
+    return sitetree
+
+
 def compose_dynamic_tree(
         src: Union[str, Sequence['TreeBase'], Sequence['TreeItemBase']],
         target_tree_alias: str = None,
@@ -287,6 +578,148 @@ def compose_dynamic_tree(
     return result(src)
 
 
+def register_dynamic_provider(
+        provider: Callable[[], Sequence['TreeItemBase']],
+        target_tree_alias: str,
+        parent_tree_item_alias: str = None,
+        *,
+        timeout: int = CACHE_TIMEOUT,
+        key: str = None
+) -> 'DynamicProvider':
+    """Registers a callable providing dynamic items for a static tree on demand.
+
+    Provided items are cached apart from the tree, so that they are refreshed
+    on timeout or invalidation without the static tree being rebuilt.
+
+    Example::
+
+        def get_categories():
+            return [
+                item(category.title, category.get_absolute_url(), url_as_pattern=False)
+                for category in Category.objects.order_by('-rating')[:50]
+            ]
+
+        categories = register_dynamic_provider(
+            get_categories, 'main', 'categories', timeout=300, key='main_categories')
+
+        # Later, e.g. on a category change.
+        categories.invalidate()
+
+    :param provider: A callable returning tree items created by `sitetree.toolbox.item()`.
+
+    :param target_tree_alias: Static tree alias to attach provided items to.
+
+    :param parent_tree_item_alias: Tree item alias from a static tree to attach provided items to.
+        If not set, items are attached to the tree root.
+
+    :param timeout: Number of seconds provided items are cached for.
+
+    :param key: Cache key for provided items. Should be unique among providers.
+        If not set, it is generated from the provider name and its target.
+
+    """
+    dynamic_provider = DynamicProvider(
+        provider,
+        target_tree_alias=target_tree_alias,
+        parent_tree_item_alias=parent_tree_item_alias,
+        timeout=timeout,
+        key=key,
+    )
+
+    _DYNAMIC_PROVIDERS.setdefault(target_tree_alias, []).append(dynamic_provider)
+
+    return dynamic_provider
+
+
+class DynamicProvider:
+    """Supplies dynamic items for a static tree on demand
+    and caches them apart from the tree.
+
+    """
+    def __init__(
+            self,
+            provider: Callable[[], Sequence['TreeItemBase']],
+            *,
+            target_tree_alias: str,
+            parent_tree_item_alias: Optional[str],
+            timeout: int,
+            key: Optional[str]
+    ):
+        self.provider = provider
+        self.target_tree_alias = target_tree_alias
+        self.parent_tree_item_alias = parent_tree_item_alias
+        self.timeout = timeout
+
+        if key is None:
+            key = _IDX_TPL % (
+                _IDX_TPL % (target_tree_alias, parent_tree_item_alias),
+                f'{provider.__module__}.{provider.__qualname__}')
+
+        self.key = key
+        self.cache_key = f'sitetrees_provider|{key}'
+
+    def get_stamp(self) -> Optional[str]:
+        """Returns a stamp of items currently cached for this provider.
+        Items are (re)generated if they are not cached.
+
+        Returns None if cache is unavailable (see `CacheBreaker`).
+
+        """
+        stamp = cache.get(self.cache_key)
+
+        if stamp is None:
+
+            if cache.is_open:
+                # Cache is unavailable: items already provided are considered unchanged.
+                return None
+
+            stamp, _ = self.refresh()
+
+        return stamp
+
+    def get_items(self) -> List['TreeItemBase']:
+        """Returns provided items. Uses cached items if available."""
+        stamp_items = cache.get(f'{self.cache_key}|items')
+
+        if stamp_items is None:
+            stamp_items = self.refresh()
+
+        return stamp_items[1]
+
+    def refresh(self) -> Tuple[str, List['TreeItemBase']]:
+        """Calls the provider and caches items it returns. Returns (stamp, items) tuple."""
+        dynamic_tree = create_tree(self.target_tree_alias, items=list(self.provider() or []))
+        items = dynamic_tree.dynamic_items
+        assign_dynamic_ids(items, self.key)
+
+        # Permissions are resolved before caching.
+        SiteTree.set_dynamic_permissions(items, resolve_permissions(SiteTree.get_dynamic_permissions(items)))
+
+        stamp_items = (uuid4().hex, items)
+        timeout = self.timeout
+
+        cache.set_many({self.cache_key: stamp_items[0], f'{self.cache_key}|items': stamp_items}, timeout)
+
+        return stamp_items
+
+    def invalidate(self):
+        """Drops cached items, so that they are regenerated on the next access."""
+        cache.delete_many([self.cache_key, f'{self.cache_key}|items'])
+
+
+@lru_cache(maxsize=4096)
+def compile_title(title: str) -> NodeList:
+    """Compiles the given item title into template nodes.
+    Compiled titles are cached in process memory.
+
+    :param title:
+
+    """
+    # Deliberately strip off template tokens that are not text or variable.
+    tokens = [token for token in Lexer(title).tokenize() if token.token_type in (TOKEN_TEXT, TOKEN_VAR)]
+    return Parser(tokens).parse()
+
+
 class LazyTitle:
     """Lazily resolves any variable found in a title of an item.
     Produces resolved title as unicode representation.
@@ -296,25 +729,279 @@ class LazyTitle:
         self.title = title
 
     def __str__(self):
-        my_lexer = Lexer(self.title)
-        my_tokens = my_lexer.tokenize()
+        context = get_sitetree().current_page_context
+        nodelist = compile_title(self.title)
+
+        if context.template is None:
+            # Context is not bound to a template, e.g. one made by `SiteTree.init_request()`.
+            with context.bind_template(_get_blank_template()):
+                return nodelist.render(context)
 
-        # Deliberately strip off template tokens that are not text or variable.
-        for my_token in my_tokens:
-            if my_token.token_type not in (TOKEN_TEXT, TOKEN_VAR):
-                my_tokens.remove(my_token)
+        return nodelist.render(context)
 
-        my_parser = Parser(my_tokens)
-        return my_parser.parse().render(get_sitetree().current_page_context)
+    def __html__(self):
+        # Variables are already escaped on title rendering.
+        return self.__str__()
 
     def __eq__(self, other):
         return self.__str__() == other
 
 
+@lru_cache(maxsize=1)
+def _get_blank_template() -> Template:
+    return Template('')
+
+
+class LazyUrl:
+    """Lazily resolves URL of an item.
+    Produces resolved URL as unicode representation.
+
+    """
+    __slots__ = ('item',)
+
+    def __init__(self, item: 'TreeItemBase'):
+        self.item = item
+
+    def __str__(self):
+        return get_sitetree().url(self.item)
+
+    def __eq__(self, other):
+        return self.__str__() == other
+
+
+class Literal:
+    """Holds a template tag argument value known at template compile time,
+    so that it is not resolved again on every render.
+
+    Mimics `FilterExpression` interface.
+
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def resolve(self, context: Context, ignore_failures: bool = False) -> Any:  # noqa: FBT001, FBT002
+        return self.value
+
+
+class BranchesSelector:
+    """Parsed tree branches specification used by `sitetree_menu` tag
+    (see its `include` clause). E.g.: `trunk,this-children,10,footer`.
+
+    Specification is parsed once and resolved against current item on render.
+
+    """
+    reserved_aliases = {
+        ALIAS_THIS_CHILDREN,
+        ALIAS_THIS_SIBLINGS,
+        ALIAS_THIS_ANCESTOR_CHILDREN,
+        ALIAS_THIS_PARENT_SIBLINGS,
+    }
+
+    def __init__(self, spec: str):
+        self.spec = spec
+
+        self.trunk: bool = False
+        """Whether root items are selected."""
+
+        self.ids: List[int] = []
+        """Parent items identifiers."""
+
+        self.aliases: List[str] = []
+        """Parent items aliases."""
+
+        self.reserved: List[str] = []
+        """Reserved aliases (e.g. `this-children`) to be resolved against current item."""
+
+        reserved_aliases = self.reserved_aliases
+
+        for branch_id in spec.split(','):
+            branch_id = branch_id.strip()
+
+            if branch_id == ALIAS_TRUNK:
+                self.trunk = True
+
+            elif branch_id in reserved_aliases:
+                self.reserved.append(branch_id)
+
+            elif branch_id.isdigit():
+                self.ids.append(int(branch_id))
+
+            else:
+                self.aliases.append(branch_id)
+
+    def __str__(self):
+        return self.spec
+
+
+class CacheBreaker:
+    """Circuit breaker guarding Django cache calls, so that slow
+    or unavailable cache backend does not take pages down.
+
+    After a number of consecutive failed calls (errors or calls slower than `call_timeout`)
+    the circuit opens: no calls are made to cache backend and fallback values are returned instead.
+    Once in `retry_timeout` seconds a call is let through to probe whether backend is back.
+
+    """
+    def __init__(
+            self,
+            backend: Any,
+            *,
+            threshold: int = CACHE_FAILURES_THRESHOLD,
+            retry_timeout: float = CACHE_RETRY_TIMEOUT,
+            call_timeout: float = CACHE_CALL_TIMEOUT,
+    ):
+        self.backend = backend
+        self.threshold = threshold
+        self.retry_timeout = retry_timeout
+        self.call_timeout = call_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether cache backend calls are skipped."""
+        return self.failures >= self.threshold and monotonic() - self.opened_at < self.retry_timeout
+
+    def call(self, method: str, *args, fallback: Any = None, **kwargs) -> Any:
+        """Calls the given cache backend method. Returns fallback value
+        if circuit is open or the call fails.
+
+        :param method: Cache backend method name.
+        :param args:
+        :param fallback: Value to return if backend is not called or the call fails.
+        :param kwargs:
+
+        """
+        if not self.allow():
+            return fallback
+
+        started = monotonic()
+
+        try:
+            result = getattr(self.backend, method)(*args, **kwargs)
+
+        except Exception as e:  # noqa: BLE001
+            self.fail(f'{e.__class__.__name__}: {e}')
+            return fallback
+
+        self.done(started)
+
+        return result
+
+    async def acall(self, method: str, *args, fallback: Any = None, **kwargs) -> Any:
+        """Async variant of `.call()`.
+
+        :param method: Async cache backend method name.
+        :param args:
+        :param fallback: Value to return if backend is not called or the call fails.
+        :param kwargs:
+
+        """
+        if not self.allow():
+            return fallback
+
+        started = monotonic()
+
+        try:
+            result = await getattr(self.backend, method)(*args, **kwargs)
+
+        except Exception as e:  # noqa: BLE001
+            self.fail(f'{e.__class__.__name__}: {e}')
+            return fallback
+
+        self.done(started)
+
+        return result
+
+    def allow(self) -> bool:
+        """Returns boolean whether a call to cache backend could be made."""
+        with self.lock:
+            if self.failures >= self.threshold:
+                if monotonic() - self.opened_at < self.retry_timeout:
+                    return False
+
+                # Let this call probe the backend, others keep away.
+                self.opened_at = monotonic()
+
+        return True
+
+    def done(self, started: float):
+        """Registers a completed call.
+
+        :param started: Call start time.
+
+        """
+        if monotonic() - started > self.call_timeout:
+            # Result is still usable, but the backend is considered failing.
+            self.fail('call timed out')
+            return
+
+        self.failures = 0
+
+    def fail(self, reason: str):
+        """Registers a failed call.
+
+        :param reason:
+
+        """
+        with self.lock:
+            self.failures += 1
+
+            if self.failures == self.threshold:
+                warnings.warn(
+                    f'Sitetree cache backend is failing ({reason}). '
+                    f'Cache calls are suspended for {self.retry_timeout} seconds.', stacklevel=2)
+
+            if self.failures >= self.threshold:
+                self.opened_at = monotonic()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.call('get', key, default, fallback=default)
+
+    def get_many(self, keys: Sequence[str]) -> dict:
+        return self.call('get_many', keys, fallback={})
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None):
+        self.call('set', key, value, timeout)
+
+    def set_many(self, data: dict, timeout: Optional[int] = None):
+        self.call('set_many', data, timeout)
+
+    def delete(self, key: str):
+        self.call('delete', key)
+
+    def delete_many(self, keys: Sequence[str]):
+        self.call('delete_many', keys)
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        return await self.acall('aget', key, default, fallback=default)
+
+    async def aget_many(self, keys: Sequence[str]) -> dict:
+        return await self.acall('aget_many', keys, fallback={})
+
+    async def aset(self, key: str, value: Any, timeout: Optional[int] = None):
+        await self.acall('aset', key, value, timeout)
+
+    async def aset_many(self, data: dict, timeout: Optional[int] = None):
+        await self.acall('aset_many', data, timeout)
+
+    async def adelete_many(self, keys: Sequence[str]):
+        await self.acall('adelete_many', keys)
+
+
+cache = CacheBreaker(caches[CACHE_NAME])
+
+
 class Cache:
     """Contains cache-related stuff."""
 
-    def __init__(self):
+    keys: List[str] = ['sitetrees_reset', 'sitetrees']
+    """Django cache keys read on initialization."""
+
+    def __init__(self, *, init: bool = True):
         self.cache: dict = {}
 
         cache_empty = self.empty
@@ -325,7 +1012,14 @@ class Cache:
         # Listen to the changes in item permissions table.
         signals.m2m_changed.connect(cache_empty, sender=MODEL_TREE_ITEM_CLASS.access_permissions)
 
-        self.init()
+        init and self.init()
+
+    @classmethod
+    async def acreate(cls) -> 'Cache':
+        """Async variant of constructor: local cache is initialized using async Django cache API."""
+        cache_ = cls(init=False)
+        await cache_.ainit()
+        return cache_
 
     @classmethod
     def reset(cls):
@@ -339,23 +1033,194 @@ class Cache:
     def init(self):
         """Initializes local cache from Django cache."""
 
-        # Drop cache flag set by .reset() method.
-        cache.get('sitetrees_reset') and self.empty(init=False)
+        values = cache.call('get_many', self.keys)
+        chunks_keys = self.get_chunks_keys(values)
+
+        if chunks_keys:
+            values.update(cache.get_many(chunks_keys))
+
+        if values and values.get('sitetrees_reset'):
+            # Drop cache flag set by .reset() method.
+            self.empty(init=False)
+            values = {}
+
+        self.load(values, reuse=True)
 
-        self.cache = cache.get(
-            'sitetrees', {'sitetrees': {}, 'parents': {}, 'items_by_ids': {}, 'tree_aliases': {}})
+    async def ainit(self):
+        """Async variant of `.init()`."""
+
+        values = await cache.acall('aget_many', self.keys)
+        chunks_keys = self.get_chunks_keys(values)
+
+        if chunks_keys:
+            values.update(await cache.aget_many(chunks_keys))
+
+        if values and values.get('sitetrees_reset'):
+            # Drop cache flag set by .reset() method.
+            await self.aempty(init=False)
+            values = {}
+
+        self.load(values)
+
+    @staticmethod
+    def get_chunks_keys(values: Optional[dict]) -> List[str]:
+        """Returns Django cache keys of chunks sitetree data is stored in (see `.save()`).
+
+        :param values: Values got from Django cache.
+
+        """
+        manifest = (values or {}).get('sitetrees')
+
+        if not isinstance(manifest, tuple):
+            return []
+
+        version, chunks_count = manifest
+
+        return [f'sitetrees|{version}|{idx}' for idx in range(chunks_count)]
+
+    def load(self, values: Optional[dict], *, reuse: bool = False):
+        """Initializes local cache from the given values got from Django cache.
+
+        :param values: None if cache is unavailable.
+        :param reuse: Whether data already decoded in this thread could be reused (see `.unpack()`).
+
+        """
+        if values is None:
+            # Cache is unavailable: use process-local copy if any,
+            # otherwise trees are built from DB.
+            data = self.unpack(_CACHE_LOCAL.get('sitetrees'), reuse=reuse)
+
+        else:
+            data = self.unpack(values.get('sitetrees'), values, reuse=reuse)
+
+        self.cache = data or {
+            'sitetrees': {}, 'parents': {}, 'positions': {},
+            'items_by_ids': {}, 'items_by_aliases': {}, 'tree_aliases': {},
+        }
+
+    @classmethod
+    def unpack(cls, value: Any, chunks: Optional[dict] = None, *, reuse: bool = False) -> Optional[dict]:
+        """Returns sitetree data from the given Django cache value.
+        Returns None if data is not available.
+
+        Value is either packed data (see `.save()`) or a manifest of chunks
+        in which such data is stored.
+
+        :param value:
+        :param chunks: Chunks got from Django cache indexed by keys.
+
+        :param reuse: Whether data already decoded in this thread from the same packed data
+            could be returned instead of decoding it anew. Requests handled by a thread
+            one after another may share such data (e.g. data loaded on warm up
+            before workers are forked), since request-related state is reset on tree preparation.
+
+        """
+        if isinstance(value, tuple):
+            chunks = chunks or {}
+            keys = cls.get_chunks_keys({'sitetrees': value})
+
+            if any(key not in chunks for key in keys):
+                # Some chunks are already evicted.
+                return None
+
+            value = b''.join(chunks[key] for key in keys)
+
+        if isinstance(value, bytes):
+            _CACHE_LOCAL['sitetrees'] = value
+
+            if reuse:
+                decoded = getattr(_THREAD_DECODED, 'decoded', None)
+
+                if decoded is not None and decoded[0] == value:
+                    return decoded[1]
+
+            data = pickle.loads(decompress(value))
+
+            if reuse:
+                _THREAD_DECODED.decoded = (value, data)
+
+            return data
+
+        return value
+
+    def pack(self) -> Tuple[Any, dict]:
+        """Packs sitetree data to be stored in Django cache.
+        Returns (value, chunks indexed by keys) tuple.
+
+        Data is compressed (see `SITETREE_CACHE_COMPRESS` setting) and,
+        if too large, is split into chunks stored under separate keys
+        (see `SITETREE_CACHE_CHUNK_SIZE` setting). In this case
+        value is a manifest of chunks.
+
+        """
+        payload = compress(pickle.dumps(self.cache, protocol=pickle.HIGHEST_PROTOCOL), enabled=CACHE_COMPRESS)
+        chunk_size = CACHE_CHUNK_SIZE
+        _CACHE_LOCAL['sitetrees'] = payload
+
+        if not chunk_size or len(payload) <= chunk_size:
+            return payload, {}
+
+        # Chunks are versioned not to be mixed up with those of concurrent writers.
+        version = uuid4().hex
+        chunks = {
+            f'sitetrees|{version}|{idx}': payload[offset:offset + chunk_size]
+            for idx, offset in enumerate(range(0, len(payload), chunk_size))
+        }
+
+        return (version, len(chunks)), chunks
 
     def save(self):
-        """Saves sitetree data to Django cache."""
-        cache.set('sitetrees', self.cache, CACHE_TIMEOUT)
+        """Saves sitetree data to Django cache.
+
+        Chunks of previously saved data are deleted.
+
+        """
+        value, chunks = self.pack()
+        # Saved data is reused by the next requests handled by this thread.
+        _THREAD_DECODED.decoded = (_CACHE_LOCAL['sitetrees'], self.cache)
+
+        stale = self.get_chunks_keys({'sitetrees': cache.get('sitetrees')})
+
+        if chunks:
+            cache.set_many(chunks, CACHE_TIMEOUT)
+
+        cache.set('sitetrees', value, CACHE_TIMEOUT)
+
+        if stale:
+            cache.delete_many(stale)
+
+    async def asave(self):
+        """Async variant of `.save()`."""
+        value, chunks = self.pack()
+
+        stale = self.get_chunks_keys({'sitetrees': await cache.aget('sitetrees')})
+
+        if chunks:
+            await cache.aset_many(chunks, CACHE_TIMEOUT)
+
+        await cache.aset('sitetrees', value, CACHE_TIMEOUT)
+
+        if stale:
+            await cache.adelete_many(stale)
 
     def empty(self, **kwargs):
-        """Empties cached sitetree data."""
-        cache.delete('sitetrees')
-        cache.delete('sitetrees_reset')
+        """Empties cached sitetree data (including chunks)."""
+        stale = self.get_chunks_keys({'sitetrees': cache.get('sitetrees')})
+        cache.delete_many(['sitetrees', 'sitetrees_reset', *stale])
+        _CACHE_LOCAL.clear()
+        _THREAD_DECODED.decoded = None
 
         kwargs.get('init', True) and self.init()
 
+    async def aempty(self, **kwargs):
+        """Async variant of `.empty()`."""
+        stale = self.get_chunks_keys({'sitetrees': await cache.aget('sitetrees')})
+        await cache.adelete_many(['sitetrees', 'sitetrees_reset', *stale])
+        _CACHE_LOCAL.clear()
+        _THREAD_DECODED.decoded = None
+
+        kwargs.get('init', True) and await self.ainit()
+
     def get_entry(self, entry_name: str, key) -> Any:
         """Returns cache entry parameter value by its name.
 
@@ -363,7 +1228,7 @@ class Cache:
         :param key:
 
         """
-        return self.cache[entry_name].get(key, False)
+        return self.cache.get(entry_name, {}).get(key, False)
 
     def update_entry_value(self, entry_name: str, key: str, value: Any):
         """Updates cache entry parameter with new data.
@@ -373,10 +1238,12 @@ class Cache:
         :param value:
 
         """
-        if key not in self.cache[entry_name]:
-            self.cache[entry_name][key] = {}
+        entry = self.cache.setdefault(entry_name, {})
 
-        self.cache[entry_name][key].update(value)
+        if key not in entry:
+            entry[key] = {}
+
+        entry[key].update(value)
 
     def set_entry(self, entry_name: str, key: str, value: Any):
         """Replaces entire cache entry parameter data by its name with new data.
@@ -386,16 +1253,88 @@ class Cache:
         :param value:
 
         """
-        self.cache[entry_name][key] = value
+        self.cache.setdefault(entry_name, {})[key] = value
+
+
+class BuildCache(Cache):
+    """Cache not bound to Django cache, so that trees are built from scratch."""
+
+    def init(self):
+        self.cache = {}
+
+    async def ainit(self):
+        self.init()
+
+    def save(self):
+        """Built trees are not saved to Django cache."""
+
+    async def asave(self):
+        """Built trees are not saved to Django cache."""
+
+
+class SnapshotCache(Cache):
+    """Contains cache-related stuff. Trees data is loaded
+    from a snapshot file (see `SITETREE_SNAPSHOT_PATH` setting)
+    instead of Django cache.
+
+    Snapshot data is not invalidated on trees changes.
+
+    """
+    def __init__(self, *, init: bool = True):
+        self.cache: dict = {}
+        init and self.init()
+
+    def init(self):
+        """Initializes local cache from a snapshot."""
+        self.snapshot = read_snapshot(SNAPSHOT_PATH)
+        self.cache = get_snapshot_entries(SNAPSHOT_PATH)
+
+    async def ainit(self):
+        """Snapshot is read without Django cache."""
+        self.init()
+
+    def get_entry(self, entry_name: str, key) -> Any:
+        """Returns cache entry parameter value by its name.
+        Trees are decoded from the snapshot on first access.
+
+        :param entry_name:
+        :param key:
+
+        """
+        value = super().get_entry(entry_name, key)
+
+        if value is False and entry_name in {'sitetrees', 'items_by_ids'}:
+            if self.snapshot.load_tree(self.cache, key):
+                value = super().get_entry(entry_name, key)
+
+        return value
+
+    def save(self):
+        """Snapshot data is not saved to Django cache."""
+
+    async def asave(self):
+        """Snapshot data is not saved to Django cache."""
+
+    def empty(self, **kwargs):
+        """Snapshot data is not emptied."""
+
+    async def aempty(self, **kwargs):
+        """Snapshot data is not emptied."""
 
 
 class SiteTree:
     """Main logic handler."""
 
-    cache_cls = Cache  # Allow customizations.
+    cache_cls = SnapshotCache if SNAPSHOT_PATH else Cache  # Allow customizations.
+
+    def __init__(self, *, init: bool = True):
+        if init:
+            self.init(context=None)
 
-    def __init__(self):
-        self.init(context=None)
+        else:
+            # Data is loaded on demand (see `aget_sitetree()`).
+            self.cache = self.cache_cls(init=False)
+            self.init_context(None)
 
     def init(self, context: Optional[Context]):
         """Initializes sitetree to handle new request.
@@ -404,7 +1343,26 @@ class SiteTree:
 
         """
         self.cache = self.cache_cls()
+        self.init_context(context)
+
+    async def ainit(self, context: Optional[Context]):
+        """Async variant of `.init()`: sitetree data is loaded using async Django cache API.
+
+        :param context:
+
+        """
+        self.cache = await self.cache_cls.acreate()
+        self.init_context(context)
+
+    def init_context(self, context: Optional[Context]):
+        """Initializes context (request) related state
+        keeping data already loaded from cache.
+
+        :param context:
+
+        """
         self.current_page_context = context
+        self._context_provisional = False
         self.current_lang = get_language()
 
         request = context.get('request', None) if context else None
@@ -419,9 +1377,43 @@ class SiteTree:
 
         self._current_app_is_admin = current_app == ADMIN_APP_NAME
         self._current_app = current_app
+        self._current_user = _UNSET
         self._current_user_permissions = _UNSET
         self._items_urls = {}  # Resolved urls are cache for a request.
         self._current_items = {}
+        self._prepared_trees = {}  # Trees items lists prepared for a request.
+        self._providers_stamps = {}  # Dynamic providers stamps read for a request.
+        self._results = {}  # Navigation structures memoized for a request.
+
+    def bind_context(self, context: Context):
+        """Binds a page context for the request already being handled
+        (e.g. replacing a provisional context set by `.init_request()`).
+
+        Trees prepared, current items and navigation structures memoized
+        for the request are kept, while URLs resolved against the previous context are dropped.
+
+        :param context:
+
+        """
+        self.current_page_context = context
+        self._context_provisional = False
+        self._items_urls = {}
+
+    def init_request(self, request: 'HttpRequest') -> Context:
+        """Initializes sitetree to handle the given request outside of templates
+        (e.g. in views or middleware). Returns context to be passed into other methods.
+
+        Such a provisional context contains only request, so it is replaced
+        with a page context as soon as sitetree template tags are rendered for the request.
+
+        :param request:
+
+        """
+        if id(request) != id(self.current_request):
+            self.init(Context({'request': request}))
+            self._context_provisional = True
+
+        return self.current_page_context
 
     def resolve_tree_i18n_alias(self, alias: str) -> str:
         """Resolves internationalized tree alias.
@@ -447,6 +1439,21 @@ class SiteTree:
 
         return alias
 
+    async def aresolve_tree_i18n_alias(self, alias: str) -> str:
+        """Async variant of `.resolve_tree_i18n_alias()`.
+
+        :param alias:
+
+        """
+        if alias in _I18N_TREES:
+            i18n_tree_alias = f'{alias}_{self.current_lang}'
+
+            if self.cache.get_entry('tree_aliases', i18n_tree_alias) is False:
+                trees_count = await MODEL_TREE_CLASS.objects.filter(alias=i18n_tree_alias).acount()
+                self.cache.set_entry('tree_aliases', i18n_tree_alias, trees_count)
+
+        return self.resolve_tree_i18n_alias(alias)
+
     @staticmethod
     def attach_dynamic_tree_items(
             tree_alias: str,
@@ -462,107 +1469,358 @@ class SiteTree:
         if not _DYNAMIC_TREES:
             return list(src_tree_items)
 
-        # This guarantees that a dynamic source stays intact,
+        items = list(src_tree_items)
+
+        # Copying guarantees that a dynamic source stays intact,
         # no matter how dynamic sitetrees are attached.
-        trees = deepcopy(_DYNAMIC_TREES)
 
-        items = []
-        if not src_tree_items:
-            if _IDX_ORPHAN_TREES in trees and tree_alias in trees[_IDX_ORPHAN_TREES]:
-                for tree in trees[_IDX_ORPHAN_TREES][tree_alias]:
-                    items.extend(tree.dynamic_items)
-        else:
+        if not items:
+            for idx, tree in enumerate(deepcopy(_DYNAMIC_TREES.get(_IDX_ORPHAN_TREES, {}).get(tree_alias, []))):
+                assign_dynamic_ids(tree.dynamic_items, tree_alias, '', idx)
+                items.extend(tree.dynamic_items)
+
+            return items
+
+        idx_root = _IDX_TPL % (tree_alias, None)
+        idx_prefix = _IDX_TPL % (tree_alias, '')
+
+        items_by_aliases = None
+        grafts = {}
+
+        # Tree item attachment by alias.
+        for idx, trees in _DYNAMIC_TREES.items():
+
+            if idx == idx_root or not idx.startswith(idx_prefix):
+                continue
 
-            # TODO Seems to be underoptimized %)
+            if items_by_aliases is None:
+                items_by_aliases = {item.alias: item for item in reversed(items) if item.alias}
 
-            # Tree item attachment by alias.
-            for static_item in list(src_tree_items):
+            static_item = items_by_aliases.get(idx[len(idx_prefix):])
+
+            if static_item is None:
+                continue
+
+            attached = grafts.setdefault(id(static_item), [])
+
+            for tree_idx, tree in enumerate(deepcopy(trees)):
+                tree.alias = tree_alias
+
+                # Unique IDs are required for the same trees attached
+                # to different parents.
+                assign_dynamic_ids(tree.dynamic_items, idx, tree_idx)  # noqa dynamic attr
+
+                for dyn_item in tree.dynamic_items:  # noqa dynamic attr
+                    if dyn_item.parent is None:
+                        dyn_item.parent = static_item
+                    attached.append(dyn_item)
+
+        if grafts:
+            items_static = items
+            items = []
+
+            for static_item in items_static:
                 items.append(static_item)
-                if not static_item.alias:
-                    continue
+                items.extend(grafts.get(id(static_item), ()))
+
+        # Tree root attachment.
+        if idx_root in _DYNAMIC_TREES:
+            for tree_idx, tree in enumerate(deepcopy(_DYNAMIC_TREES[idx_root])):
+                tree.alias = tree_alias
+                assign_dynamic_ids(tree.dynamic_items, idx_root, tree_idx)  # noqa dynamic attr
+                items.extend(tree.dynamic_items)  # noqa dynamic attr
+
+        return items
 
-                idx = _IDX_TPL % (tree_alias, static_item.alias)
-                if idx not in trees:
+    @staticmethod
+    def attach_provided_tree_items(
+            src_tree_items: List['TreeItemBase'],
+            dynamic_providers: List[DynamicProvider]
+    ) -> List['TreeItemBase']:
+        """Attaches items supplied by dynamic providers registered with `register_dynamic_provider()`
+        to an initial (source) items list.
+
+        :param src_tree_items:
+        :param dynamic_providers:
+
+        """
+        items_by_aliases = {item.alias: item for item in reversed(src_tree_items) if item.alias}
+
+        grafts = {}
+        items_root = []
+
+        for dynamic_provider in dynamic_providers:
+            parent_alias = dynamic_provider.parent_tree_item_alias
+
+            if parent_alias is None:
+                static_item = None
+                attached = items_root
+
+            else:
+                static_item = items_by_aliases.get(parent_alias)
+
+                if static_item is None:
                     continue
 
-                for tree in trees[idx]:
-                    tree.alias = tree_alias
-
-                    for dyn_item in tree.dynamic_items:  # noqa dynamic attr
-                        if dyn_item.parent is None:
-                            dyn_item.parent = static_item
-                        # Unique IDs are required for the same trees attached
-                        # to different parents.
-                        dyn_item.id = generate_id_for(dyn_item)
-                        items.append(dyn_item)
-
-            # Tree root attachment.
-            idx = _IDX_TPL % (tree_alias, None)
-            if idx in _DYNAMIC_TREES:
-                trees = deepcopy(_DYNAMIC_TREES)
-                for tree in trees[idx]:
-                    tree.alias = tree_alias
-                    items.extend(tree.dynamic_items)  # noqa dynamic attr
+                attached = grafts.setdefault(id(static_item), [])
+
+            for dyn_item in dynamic_provider.get_items():
+                if dyn_item.parent is None:
+                    dyn_item.parent = static_item
+                attached.append(dyn_item)
+
+        items = []
+
+        for static_item in src_tree_items:
+            items.append(static_item)
+            items.extend(grafts.get(id(static_item), ()))
+
+        items.extend(items_root)
 
         return items
 
-    def current_app_is_admin(self) -> bool:
-        """Returns boolean whether current application is Admin contrib."""
-        warnings.warn(
-            'Accessing .current_app_is_admin() is deprecated.',
-            DeprecationWarning, 2)
-        return self._current_app_is_admin
+    def current_app_is_admin(self) -> bool:
+        """Returns boolean whether current application is Admin contrib."""
+        warnings.warn(
+            'Accessing .current_app_is_admin() is deprecated.',
+            DeprecationWarning, 2)
+        return self._current_app_is_admin
+
+    def get_sitetree(self, alias: str) -> Tuple[str, List['TreeItemBase']]:
+        """Gets site tree items from the given site tree.
+        Caches result to dictionary.
+        Returns (tree alias, tree items) tuple.
+
+        :param alias:
+
+        """
+        if not self.cache.cache:
+            # Handler is created without data.
+            self.cache.init()
+
+        if not self._current_app_is_admin:
+            # We do not need i18n for a tree rendered in Admin dropdown.
+            alias = self.resolve_tree_i18n_alias(alias)
+
+        sitetree = self.cache.get_entry('sitetrees', alias)
+        fetched = not sitetree
+
+        if fetched:
+            sitetree = self.fetch_sitetree(alias)
+
+            if not sitetree and not _DYNAMIC_PROVIDERS.get(alias):
+                # Unknown (or empty) trees are not cached not to bloat cache.
+                return alias, sitetree
+
+        sitetree, caching_required = self.prepare_sitetree(alias, sitetree, fetched=fetched)
+
+        # Save sitetree data into cache if needed.
+        if caching_required:
+            self.cache.save()
+
+        return alias, sitetree
+
+    async def aget_sitetree(self, alias: str) -> Tuple[str, List['TreeItemBase']]:
+        """Async variant of `.get_sitetree()`. Tree items missing in cache
+        are fetched with async ORM and cached with async Django cache API.
+
+        Dynamic providers (see `register_dynamic_provider()`) are called
+        in a thread using `sync_to_async`.
+
+        :param alias:
+
+        """
+        if not self.cache.cache:
+            # Handler is created without data (see `aget_sitetree()`).
+            await self.cache.ainit()
+
+        if not self._current_app_is_admin:
+            alias = await self.aresolve_tree_i18n_alias(alias)
+
+        sitetree = self.cache.get_entry('sitetrees', alias)
+        fetched = not sitetree
+
+        if fetched:
+            sitetree = await self.afetch_sitetree(alias)
+
+            if not sitetree and not _DYNAMIC_PROVIDERS.get(alias):
+                return alias, sitetree
+
+        if _DYNAMIC_PROVIDERS.get(alias):
+            # Providers make blocking calls (Django cache, provider callables, DB).
+            from asgiref.sync import sync_to_async  # noqa: PLC0415
+            sitetree, caching_required = await sync_to_async(self.prepare_sitetree)(alias, sitetree, fetched=fetched)
+
+        else:
+            sitetree, caching_required = self.prepare_sitetree(alias, sitetree, fetched=fetched)
+
+        if caching_required:
+            await self.cache.asave()
+
+        return alias, sitetree
+
+    def tree_exists(self, alias: str) -> bool:
+        """Returns boolean whether a tree with the given alias is known,
+        e.g. to verify an alias coming from a request before tree initialization.
+
+        Cached trees are checked first, so that no DB query is made for them.
+
+        :param alias: Tree alias (not resolved for a language).
+
+        """
+        return bool(self.cache.get_entry('sitetrees', alias)) or alias in get_tree_aliases()
+
+    def get_sitetree_queryset(self, alias: str) -> QuerySet:
+        """Returns a queryset of items of the given tree.
+
+        :param alias:
+
+        """
+        return (
+            MODEL_TREE_ITEM_CLASS.objects.
+            select_related('parent', 'tree').
+            prefetch_related('access_permissions__content_type').
+            filter(tree__alias__exact=alias).
+            order_by('parent__sort_order', 'sort_order'))
+
+    def fetch_sitetree(self, alias: str) -> List['TreeItemBase']:
+        """Fetches items of the given tree from DB and attaches dynamic items to them.
+
+        :param alias:
+
+        """
+        sitetree = self.attach_dynamic_tree_items(alias, [] if DYNAMIC_ONLY else self.get_sitetree_queryset(alias))
+        self.set_dynamic_permissions(sitetree, resolve_permissions(self.get_dynamic_permissions(sitetree)))
+        return sitetree
+
+    async def afetch_sitetree(self, alias: str) -> List['TreeItemBase']:
+        """Async variant of `.fetch_sitetree()`.
+
+        :param alias:
+
+        """
+        items = [] if DYNAMIC_ONLY else [item async for item in self.get_sitetree_queryset(alias)]
+        sitetree = self.attach_dynamic_tree_items(alias, items)
+        self.set_dynamic_permissions(sitetree, await aresolve_permissions(self.get_dynamic_permissions(sitetree)))
+        return sitetree
+
+    @staticmethod
+    def get_dynamic_permissions(items: Sequence['TreeItemBase']) -> List[Any]:
+        """Returns permissions (as given) of dynamic items with restricted access.
+
+        :param items:
+
+        """
+        return [
+            permission
+            for item in items if item.access_restricted and getattr(item, 'is_dynamic', False)
+            for permission in item.permissions
+        ]
+
+    @staticmethod
+    def set_dynamic_permissions(items: Sequence['TreeItemBase'], resolved: Dict[Any, str]):
+        """Sets resolved permissions for dynamic items with restricted access.
+
+        :param items:
+        :param resolved: See `resolve_permissions()`.
 
-    def get_sitetree(self, alias: str) -> Tuple[str, List['TreeItemBase']]:
-        """Gets site tree items from the given site tree.
-        Caches result to dictionary.
-        Returns (tree alias, tree items) tuple.
+        """
+        for item in items:
+            if item.access_restricted and getattr(item, 'is_dynamic', False):
+                item.perms = {resolved[permission] for permission in item.permissions}
 
-        :param alias:
+    def prepare_sitetree(
+            self,
+            alias: str,
+            sitetree: List['TreeItemBase'],
+            *,
+            fetched: bool = False
+    ) -> Tuple[List['TreeItemBase'], bool]:
+        """Indexes tree items and prepares them for the current request.
+        Returns (tree items, whether caching required) tuple.
+
+        :param alias: Resolved tree alias.
+        :param sitetree: Tree items.
+        :param fetched: Whether items are just fetched (see `.fetch_sitetree()`), not taken from cache.
 
         """
         cache_ = self.cache
         get_cache_entry = cache_.get_entry
         set_cache_entry = cache_.set_entry
 
-        caching_required = False
+        caching_required = fetched
 
-        if not self._current_app_is_admin:
-            # We do not need i18n for a tree rendered in Admin dropdown.
-            alias = self.resolve_tree_i18n_alias(alias)
+        if fetched:
+            set_cache_entry('sitetrees', alias, sitetree)
+            # Changes every time tree items are fetched anew (see `.get_tree_generation()`).
+            set_cache_entry('generations', alias, uuid4().hex)
+
+        reindex = False
+
+        dynamic_providers = _DYNAMIC_PROVIDERS.get(alias)
+
+        if dynamic_providers:
+            stamps = self._providers_stamps.get(alias)
+
+            if stamps is None:
+                # Stamps are read from cache once per request.
+                stamps = [dynamic_provider.get_stamp() for dynamic_provider in dynamic_providers]
+                self._providers_stamps[alias] = stamps
+
+            stamps_cached = get_cache_entry('providers_stamps', alias)
 
-        sitetree = get_cache_entry('sitetrees', alias)
+            if stamps_cached and len(stamps_cached) == len(stamps):
+                # Unknown stamps (cache is unavailable) are considered unchanged.
+                stamps = [
+                    stamp_cached if stamp is None else stamp
+                    for stamp, stamp_cached in zip(stamps, stamps_cached)]
 
-        if not sitetree:
-            if DYNAMIC_ONLY:
-                sitetree = []
+            if caching_required or stamps_cached != stamps:
+                sitetree = self.attach_provided_tree_items(sitetree, dynamic_providers)
+                set_cache_entry('sitetrees_provided', alias, sitetree)
+                set_cache_entry('providers_stamps', alias, stamps)
+                caching_required = True
+                reindex = True
 
             else:
-                sitetree = (
-                    MODEL_TREE_ITEM_CLASS.objects.
-                    select_related('parent', 'tree').
-                    prefetch_related('access_permissions__content_type').
-                    filter(tree__alias__exact=alias).
-                    order_by('parent__sort_order', 'sort_order'))
-
-            sitetree = self.attach_dynamic_tree_items(alias, sitetree)
-            set_cache_entry('sitetrees', alias, sitetree)
-            caching_required = True
+                sitetree = get_cache_entry('sitetrees_provided', alias)
 
         parents = get_cache_entry('parents', alias)
-        if not parents:
+        if reindex or not parents or get_cache_entry('items_by_names', alias) is False:
+            compile_url = self.compile_url
             parents = defaultdict(list)
-            for item in sitetree:
+            positions = {}
+            items_by_aliases = {}
+            items_by_names = defaultdict(list)
+            items_by_urls = defaultdict(list)
+            for position, item in enumerate(sitetree):
                 parent = item.parent
                 parents[parent].append(item)
+                positions[item] = position
+                item_alias = item.alias
+                if item_alias and item_alias not in items_by_aliases:
+                    items_by_aliases[item_alias] = item
+                if item.urlaspattern:
+                    item.url_compiled = compile_url(item)
+                    items_by_names[item.url_compiled[0]].append(item)
+                else:
+                    items_by_urls[f'{item.url}'].append(item)
             set_cache_entry('parents', alias, parents)
+            set_cache_entry('positions', alias, positions)
+            set_cache_entry('items_by_aliases', alias, items_by_aliases)
+            set_cache_entry('items_by_names', alias, dict(items_by_names))
+            set_cache_entry('items_by_urls', alias, dict(items_by_urls))
+            # URLs trie is rebuilt from new indexes on demand.
+            cache_.cache.get('urls_trie', {}).pop(alias, None)
 
         # Prepare items by ids cache if needed.
         if caching_required:
             # We need this extra pass to avoid future problems on items depth calculation.
-            cache_update = cache_.update_entry_value
-            for item in sitetree:
-                cache_update('items_by_ids', alias, {item.id: item})
+            set_cache_entry('items_by_ids', alias, {item.id: item for item in sitetree})
+
+        if self._prepared_trees.get(alias) is sitetree:
+            # Items are already prepared for the current request.
+            return sitetree, caching_required
 
         url = self.url
         calculate_item_depth = self.calculate_item_depth
@@ -576,15 +1834,14 @@ class SiteTree:
                 item.depth_range = range(item.depth)
 
                 # Resolve item permissions.
-                if item.access_restricted:
-                    permissions_src = (
-                        item.permissions if getattr(item, 'is_dynamic', False)
-                        else item.access_permissions.all())
-
-                    item.perms = {f'{perm.content_type.app_label}.{perm.codename}' for perm in permissions_src}
+                # Dynamic items permissions are resolved in bulk beforehand.
+                if item.access_restricted and not getattr(item, 'is_dynamic', False):
+                    item.perms = {
+                        f'{perm.content_type.app_label}.{perm.codename}'
+                        for perm in item.access_permissions.all()}
 
             # Contextual properties.
-            item.url_resolved = url(item)
+            item.url_resolved = LazyUrl(item) if item.urlaspattern else url(item)
             item.title_resolved = LazyTitle(item.title) if VARIABLE_TAG_START in item.title else item.title
             item.is_current = False
             item.in_current_branch = False
@@ -592,11 +1849,40 @@ class SiteTree:
         # Get current item for the given sitetree.
         self.get_tree_current_item(alias)
 
-        # Save sitetree data into cache if needed.
-        if caching_required:
-            cache_.save()
+        self._prepared_trees[alias] = sitetree
 
-        return alias, sitetree
+        return sitetree, caching_required
+
+    def get_memoized(self, key: tuple) -> Optional[List['TreeItemBase']]:
+        """Returns navigation structure (items list) memoized for the current request
+        with `.memoize()` or None if not found.
+
+        :param key:
+
+        """
+        memoized = self._results.get(key)
+
+        if memoized is None:
+            return None
+
+        items, has_children = memoized
+
+        # `has_children` might have been updated for a different navigation type.
+        for item, item_has_children in zip(items, has_children):
+            item.has_children = item_has_children
+
+        return list(items)
+
+    def memoize(self, key: tuple, items: List['TreeItemBase']) -> List['TreeItemBase']:
+        """Memoizes navigation structure (items list) for the current request.
+        Returns the items.
+
+        :param key:
+        :param items:
+
+        """
+        self._results[key] = (list(items), [item.has_children for item in items])
+        return items
 
     def calculate_item_depth(self, tree_alias: str, item_id: int, depth: int = 0):
         """Calculates depth of the item in the tree.
@@ -626,6 +1912,16 @@ class SiteTree:
         """
         return self.cache.get_entry('items_by_ids', tree_alias)[item_id]
 
+    def get_item_by_alias(self, tree_alias: str, item_alias: str) -> Optional['TreeItemBase']:
+        """Get the item from the tree by its alias.
+        Returns None if there is no such item.
+
+        :param tree_alias:
+        :param item_alias:
+
+        """
+        return (self.cache.get_entry('items_by_aliases', tree_alias) or {}).get(item_alias)
+
     def get_tree_current_item(self, tree_alias: str) -> Optional['TreeItemBase']:
         """Resolves current tree item of 'tree_alias' tree matching current
         request path against URL of given tree item.
@@ -648,26 +1944,145 @@ class SiteTree:
             self._current_items[tree_alias] = current_item
             return None
 
-        current_url = self.current_request.path
+        request = self.current_request
+        current_url = request.path
 
         if current_url:
             # url quote is an attempt to support non-ascii in url.
             current_url = iri_to_uri(current_url)
 
-        for url_item, url in self._items_urls.items():
-            # Iterate each as this dict may contains "current" items for various trees.
-            if url != current_url:
-                continue
+        get_cache_entry = self.cache.get_entry
 
-            url_item.is_current = True
-            if url_item.tree.alias == tree_alias:
-                current_item = url_item
+        # Items with exact URLs are looked up by path.
+        items = list((get_cache_entry('items_by_urls', tree_alias) or {}).get(current_url, ()))
 
-        if current_item is not None:
-            self._current_items[tree_alias] = current_item
+        items_by_names = get_cache_entry('items_by_names', tree_alias) or {}
+        resolver_match = getattr(request, 'resolver_match', None)
+
+        if resolver_match is None:
+            # Unable to match by URL pattern name. Resolve URLs of all pattern items.
+            url = self.url
+            items.extend(
+                item
+                for names_items in items_by_names.values()
+                for item in names_items
+                if url(item) == current_url
+            )
+
+        else:
+            # Items with URL patterns are looked up by URL pattern name
+            # matched for the request, so that no URL reversal is required.
+            match_url_arguments = self.match_url_arguments
+            items.extend(
+                item
+                for item in items_by_names.get(resolver_match.view_name, ())
+                if match_url_arguments(item, resolver_match, current_url)
+            )
+
+        if not items and CURRENT_ITEM_PREFIX_MATCH:
+            items = self.get_items_by_url_prefix(tree_alias, current_url)
+
+        if items:
+            positions = get_cache_entry('positions', tree_alias) or {}
+
+            for item in items:
+                item.is_current = True
+
+            # The last one in tree order wins.
+            current_item = max(items, key=lambda item: positions.get(item, 0))
+
+        self._current_items[tree_alias] = current_item
 
         return current_item
 
+    def get_urls_trie(self, tree_alias: str) -> dict:
+        """Returns URL path segments trie built from static URLs of the given tree items.
+        Items with URL patterns having no arguments are included with their resolved URLs.
+
+        Each trie node is a dictionary of child nodes keyed by path segments,
+        with items having URL ending on the node stored under `None` key.
+
+        :param tree_alias:
+
+        """
+        urls_trie = self.cache.get_entry('urls_trie', tree_alias)
+
+        if urls_trie is False:
+            urls_trie = {}
+            # Lists are copied not to alter `items_by_urls` index.
+            items_by_urls = defaultdict(list, {
+                url: list(items)
+                for url, items in (self.cache.get_entry('items_by_urls', tree_alias) or {}).items()
+            })
+            resolve_url = self.url
+
+            for names_items in (self.cache.get_entry('items_by_names', tree_alias) or {}).values():
+                for item in names_items:
+                    if not item.url_compiled[1]:
+                        items_by_urls[resolve_url(item)].append(item)
+
+            for url, items in items_by_urls.items():
+
+                if not url.startswith('/') or '?' in url or '#' in url:
+                    # Only site paths are taken into account.
+                    continue
+
+                node = urls_trie
+                for segment in url.strip('/').split('/'):
+                    node = node.setdefault(segment, {})
+
+                node.setdefault(None, []).extend(items)
+
+            self.cache.set_entry('urls_trie', tree_alias, urls_trie)
+
+        return urls_trie
+
+    def get_items_by_url_prefix(self, tree_alias: str, url: str) -> List['TreeItemBase']:
+        """Returns items with the longest URL being a prefix of the given URL.
+        Site root URL is not considered a prefix.
+
+        :param tree_alias:
+        :param url:
+
+        """
+        items = []
+        node = self.get_urls_trie(tree_alias)
+
+        for segment in url.strip('/').split('/'):
+            node = node.get(segment)
+
+            if node is None:
+                break
+
+            items = node.get(None, items)
+
+        return list(items)
+
+    def match_url_arguments(self, sitetree_item: 'TreeItemBase', resolver_match: 'ResolverMatch', url: str) -> bool:
+        """Checks whether URL pattern arguments of the given item
+        are the same as the ones captured for the request by URL resolver.
+
+        :param sitetree_item:
+        :param resolver_match:
+        :param url: Current URL to compare with item URL if unable to match by arguments.
+
+        """
+        _, view_arguments = sitetree_item.url_compiled
+
+        captured = resolver_match.args or tuple(
+            getattr(resolver_match, 'captured_kwargs', resolver_match.kwargs).values())
+
+        if len(captured) != len(view_arguments):
+            # Defaults might be mixed into captured arguments. Compare URLs.
+            return self.url(sitetree_item) == url
+
+        resolve_var = self.resolve_var
+
+        return all(
+            f'{resolve_var(view_argument)}' == f'{value}'
+            for view_argument, value in zip(view_arguments, captured)
+        )
+
     def url(self, sitetree_item: Union['TreeItemBase', FilterExpression], context: Context = None) -> str:
         """Resolves item's URL.
 
@@ -689,25 +2104,20 @@ class SiteTree:
 
         # Resolve only if item's URL is marked as pattern.
         if sitetree_item.urlaspattern:
-            url = sitetree_item.url
-            view_path = url
-            all_arguments = []
+            url_compiled = getattr(sitetree_item, 'url_compiled', None)
 
-            if ' ' in url:
-                view_path = url.split(' ')
-                # We should try to resolve URL parameters from site tree item.
-                all_arguments.extend(resolve_var(view_argument) for view_argument in view_path[1:])
+            if url_compiled is None:
+                url_compiled = self.compile_url(sitetree_item)
+                sitetree_item.url_compiled = url_compiled
 
-                view_path = view_path[0].strip('"\' ')
+            view_path, view_arguments = url_compiled
 
-            try:
-                resolved_url = reverse(
-                    view_path,
-                    args=all_arguments,
-                    current_app=self._current_app
-                )
+            # We should try to resolve URL parameters from site tree item.
+            all_arguments = [resolve_var(view_argument) for view_argument in view_arguments]
 
-            except NoReverseMatch:
+            resolved_url = reverse_url(view_path, all_arguments, self._current_app)
+
+            if resolved_url is None:
                 resolved_url = UNRESOLVED_ITEM_MARKER
 
         else:
@@ -717,6 +2127,21 @@ class SiteTree:
 
         return resolved_url
 
+    @staticmethod
+    def compile_url(sitetree_item: 'TreeItemBase') -> Tuple[str, Tuple[Variable, ...]]:
+        """Parses URL pattern of an item (e.g. `article-detail article.slug page`)
+        into a view path (URL pattern name) and a tuple of argument variables.
+
+        :param sitetree_item:
+
+        """
+        view_path, *view_arguments = sitetree_item.url.split(' ')
+
+        return (
+            view_path.strip('"\' '),
+            tuple(Variable(view_argument) for view_argument in view_arguments if view_argument)
+        )
+
     def init_tree(
             self,
             tree_alias: str,
@@ -749,6 +2174,10 @@ class SiteTree:
         if id(request) != id(self.current_request):
             self.init(context)
 
+        elif self._context_provisional and context is not self.current_page_context:
+            # Provisional context set by `.init_request()` is replaced with a page context.
+            self.bind_context(context)
+
         # Resolve tree_alias from the context.
         tree_alias = self.resolve_var(tree_alias)
         tree_alias, sitetree_items = self.get_sitetree(tree_alias)
@@ -758,6 +2187,41 @@ class SiteTree:
 
         return tree_alias, sitetree_items
 
+    async def ainit_tree(
+            self,
+            tree_alias: str,
+            context: Context
+    ) -> Tuple[Optional[str], Optional[List['TreeItemBase']]]:
+        """Async variant of `.init_tree()`.
+
+        Tree data, current user and their permissions (if required by tree items)
+        are loaded asynchronously, so that no blocking calls are made afterwards
+        by methods building navigation structures.
+
+        :param tree_alias:
+        :param context:
+
+        """
+        request = context.get('request', None)
+
+        if request is not None:
+
+            if id(request) != id(self.current_request):
+                await self.ainit(context)
+
+            _, sitetree_items = await self.aget_sitetree(self.resolve_var(tree_alias, context))
+
+            if self._current_user is _UNSET:
+                auser = getattr(request, 'auser', None)
+                self._current_user = await auser() if auser else getattr(request, 'user', None)
+
+            restricted = next((item for item in sitetree_items if item.access_restricted), None)
+
+            if restricted is not None and self._current_user_permissions is _UNSET:
+                self._current_user_permissions = await self.aget_permissions(self.get_current_user(), restricted)
+
+        return self.init_tree(tree_alias, context)
+
     def get_current_page_title(self, tree_alias: TypeStrExpr, context: Context) -> str:
         """Returns resolved from sitetree title for current page.
 
@@ -803,6 +2267,22 @@ class SiteTree:
 
         return self.get_ancestor_level(current_item.parent, depth=depth-1)
 
+    async def amenu(
+            self,
+            tree_alias: TypeStrExpr,
+            tree_branches: TypeStrExpr,
+            context: Context
+    ) -> List['TreeItemBase']:
+        """Async variant of `.menu()`.
+
+        :param tree_alias:
+        :param tree_branches:
+        :param context:
+
+        """
+        await self.ainit_tree(tree_alias, context)
+        return self.menu(tree_alias, tree_branches, context)
+
     def menu(self, tree_alias: TypeStrExpr, tree_branches: TypeStrExpr, context: Context) -> List['TreeItemBase']:
         """Builds and returns menu structure for 'sitetree_menu' tag.
 
@@ -818,58 +2298,80 @@ class SiteTree:
 
         tree_branches = self.resolve_var(tree_branches)
 
-        parent_isnull = False
-        parent_ids = []
-        parent_aliases = []
+        memo_key = ('menu', tree_alias, f'{tree_branches}')
+        menu_items = self.get_memoized(memo_key)
+
+        if menu_items is not None:
+            return menu_items
+
+        if not isinstance(tree_branches, BranchesSelector):
+            tree_branches = BranchesSelector(tree_branches)
+
+        parent_ids = list(tree_branches.ids)
+        parent_aliases = tree_branches.aliases
 
         current_item = self.get_tree_current_item(tree_alias)
         self.tree_climber(tree_alias, current_item)
 
-        # Support item addressing both through identifiers and aliases.
-        for branch_id in tree_branches.split(','):
-            branch_id = branch_id.strip()
+        if current_item is not None:
 
-            if branch_id == ALIAS_TRUNK:
-                parent_isnull = True
+            for branch_id in tree_branches.reserved:
 
-            elif branch_id == ALIAS_THIS_CHILDREN and current_item is not None:
-                branch_id = current_item.id
-                parent_ids.append(branch_id)
+                if branch_id == ALIAS_THIS_CHILDREN:
+                    parent_ids.append(current_item.id)
 
-            elif branch_id == ALIAS_THIS_ANCESTOR_CHILDREN and current_item is not None:
-                branch_id = self.get_ancestor_item(tree_alias, current_item).id
-                parent_ids.append(branch_id)
+                elif branch_id == ALIAS_THIS_ANCESTOR_CHILDREN:
+                    parent_ids.append(self.get_ancestor_item(tree_alias, current_item).id)
 
-            elif branch_id == ALIAS_THIS_SIBLINGS and current_item is not None and current_item.parent is not None:
-                branch_id = current_item.parent.id
-                parent_ids.append(branch_id)
+                elif branch_id == ALIAS_THIS_SIBLINGS:
+                    if current_item.parent is not None:
+                        parent_ids.append(current_item.parent.id)
 
-            elif branch_id == ALIAS_THIS_PARENT_SIBLINGS and current_item is not None:
-                branch_id = self.get_ancestor_level(current_item, depth=2).id
-                parent_ids.append(branch_id)
+                elif branch_id == ALIAS_THIS_PARENT_SIBLINGS:
+                    parent_ids.append(self.get_ancestor_level(current_item, depth=2).id)
 
-            elif branch_id.isdigit():
-                parent_ids.append(int(branch_id))
+        # Support item addressing both through identifiers and aliases.
+        get_cache_entry = self.cache.get_entry
+        items_by_ids = get_cache_entry('items_by_ids', tree_alias)
 
-            else:
-                parent_aliases.append(branch_id)
+        parents = [items_by_ids.get(item_id) for item_id in parent_ids]
 
+        if parent_aliases:
+            get_item_by_alias = self.get_item_by_alias
+            parents.extend(get_item_by_alias(tree_alias, item_alias) for item_alias in parent_aliases)
+
+        parents = [parent for parent in parents if parent is not None]
+
+        if tree_branches.trunk:
+            parents.insert(0, None)
+
+        children = get_cache_entry('parents', tree_alias)
         check_access = self.check_access
 
         menu_items = []
-        for item in sitetree_items:
-            if not item.hidden and item.inmenu and check_access(item, context):
-                if item.parent is None:
-                    if parent_isnull:
-                        menu_items.append(item)
-                else:
-                    if item.parent.id in parent_ids or item.parent.alias in parent_aliases:
-                        menu_items.append(item)
+        groups_count = 0
+
+        # Go straight to children of selected parents.
+        for parent in dict.fromkeys(parents):
+            items = children.get(parent)
+
+            if not items:
+                continue
+
+            groups_count += 1
+            menu_items.extend(
+                item for item in items
+                if not item.hidden and item.inmenu and check_access(item, context))
+
+        if groups_count > 1:
+            # Keep items in tree order.
+            positions = get_cache_entry('positions', tree_alias) or {}
+            menu_items.sort(key=lambda item: positions.get(item, 0))
 
         menu_items = self.apply_hook(menu_items, 'menu')
         self.update_has_children(tree_alias, menu_items, 'menu')
 
-        return menu_items
+        return self.memoize(memo_key, menu_items)
 
     def apply_hook(self, items: List['TreeItemBase'], sender: str) -> List['TreeItemBase']:
         """Applies a custom items processing hook to items supplied, and returns processed list.
@@ -900,7 +2402,7 @@ class SiteTree:
         :param context:
 
         """
-        authenticated = self.current_request.user.is_authenticated
+        authenticated = self.get_current_user().is_authenticated
 
         if callable(authenticated):
             authenticated = authenticated()
@@ -924,7 +2426,7 @@ class SiteTree:
             user_perms = self._current_user_permissions
 
             if user_perms is _UNSET:
-                user_perms = self.get_permissions(self.current_request.user, item)
+                user_perms = self.get_permissions(self.get_current_user(), item)
                 self._current_user_permissions = user_perms
 
             perms = item.perms  # noqa dynamic attr
@@ -981,6 +2483,107 @@ class SiteTree:
         """
         return user.get_all_permissions()
 
+    async def aget_permissions(self, user: 'User', item: 'TreeItemBase') -> set:
+        """Async variant of `.get_permissions()`.
+
+        :param user:
+        :param item:
+
+        """
+        aget_all_permissions = getattr(user, 'aget_all_permissions', None)
+
+        if aget_all_permissions is None:  # Django < 5.2
+            from asgiref.sync import sync_to_async  # noqa: PLC0415
+            return await sync_to_async(self.get_permissions)(user, item)
+
+        return await aget_all_permissions()
+
+    def get_current_user(self) -> Optional['User']:
+        """Returns a user of the current request."""
+        user = self._current_user
+
+        if user is _UNSET:
+            user = self._current_user = getattr(self.current_request, 'user', None)
+
+        return user
+
+    def get_tree_generation(self, tree_alias: str) -> str:
+        """Returns generation of the given tree items: an identifier changing
+        every time the tree is rebuilt (e.g. on items changes) or its dynamic
+        providers stamps change. Returns an empty string if unknown.
+
+        :param tree_alias: Resolved tree alias.
+
+        """
+        generation = self.cache.get_entry('generations', tree_alias)
+
+        if not generation:
+            return ''
+
+        stamps = self.cache.get_entry('providers_stamps', tree_alias)
+
+        if stamps:
+            generation = '|'.join((generation, *stamps))
+
+        return generation
+
+    def get_access_signature(self, tree_alias: str) -> str:
+        """Returns a signature of the current user access to items of the given tree,
+        so that users with the same signature are granted access to the same items.
+
+        Signature is made of user authentication state, user permissions
+        relevant to the tree and dynamic access checks results.
+
+        :param tree_alias: Resolved tree alias initialized for the current request (see `.init_tree()`).
+
+        """
+        user = self.get_current_user()
+        authenticated = getattr(user, 'is_authenticated', False)
+
+        if callable(authenticated):
+            authenticated = authenticated()
+
+        context = self.current_page_context
+        check_access_dyn = self.check_access_dyn
+
+        restricted = None
+        perms = set()
+        checks = []
+
+        for item in self._prepared_trees.get(tree_alias) or []:
+
+            if getattr(item, 'access_check', None):
+                checks.append(f'{item.id}:{check_access_dyn(item, context)}')
+
+            elif item.access_restricted:
+                restricted = item
+                perms.update(item.perms)  # noqa dynamic attr
+
+        if restricted is not None and user is not None:
+            user_perms = self._current_user_permissions
+
+            if user_perms is _UNSET:
+                user_perms = self._current_user_permissions = self.get_permissions(user, restricted)
+
+            perms.intersection_update(user_perms)
+
+        else:
+            perms.clear()
+
+        signature = f"{int(bool(authenticated))}|{','.join(sorted(perms))}|{','.join(checks)}"
+
+        return blake2b(signature.encode(), digest_size=16).hexdigest()
+
+    async def abreadcrumbs(self, tree_alias: TypeStrExpr, context: Context) -> List['TreeItemBase']:
+        """Async variant of `.breadcrumbs()`.
+
+        :param tree_alias:
+        :param context:
+
+        """
+        await self.ainit_tree(tree_alias, context)
+        return self.breadcrumbs(tree_alias, context)
+
     def breadcrumbs(self, tree_alias: TypeStrExpr, context: Context) -> List['TreeItemBase']:
         """Builds and returns breadcrumb trail structure for 'sitetree_breadcrumbs' tag.
 
@@ -993,6 +2596,12 @@ class SiteTree:
         if not sitetree_items:
             return []
 
+        memo_key = ('breadcrumbs', tree_alias)
+        items = self.get_memoized(memo_key)
+
+        if items is not None:
+            return items
+
         current_item = self.get_tree_current_item(tree_alias)
 
         breadcrumbs = []
@@ -1020,7 +2629,7 @@ class SiteTree:
         items = self.apply_hook(breadcrumbs, 'breadcrumbs')
         self.update_has_children(tree_alias, items, 'breadcrumbs')
 
-        return items
+        return self.memoize(memo_key, items)
 
     def tree(self, tree_alias: TypeStrExpr, context:  Context) -> List['TreeItemBase']:
         """Builds and returns tree structure for 'sitetree_tree' tag.
@@ -1034,47 +2643,131 @@ class SiteTree:
         if not sitetree_items:
             return []
 
+        memo_key = ('sitetree', tree_alias)
+        tree_items = self.get_memoized(memo_key)
+
+        if tree_items is not None:
+            return tree_items
+
         tree_items = self.filter_items(self.get_children(tree_alias, None), 'sitetree')
         tree_items = self.apply_hook(tree_items, 'sitetree')
         self.update_has_children(tree_alias, tree_items, 'sitetree')
 
-        return tree_items
+        return self.memoize(memo_key, tree_items)
 
     def children(
             self,
-            parent_item: Union[str, 'TreeItemBase'],
+            parent_item: Union[str, Variable, 'TreeItemBase'],
             navigation_type: str,
-            use_template: str,
+            use_template: Any,
             context: Context
     ) -> str:
         """Builds and returns site tree item children structure for 'sitetree_children' tag.
 
         :param parent_item:
         :param navigation_type: menu, sitetree
-        :param use_template:
+        :param use_template: Template name or template object.
+        :param context:
+
+        """
+        tree_items = self.children_items(parent_item, navigation_type, context)
+
+        if isinstance(use_template, str):
+            use_template = get_template(use_template)
+
+        return render_items(context, tree_items, use_template)
+
+    def children_items(
+            self,
+            parent_item: Union[str, Variable, 'TreeItemBase'],
+            navigation_type: str,
+            context: Context
+    ) -> List['TreeItemBase']:
+        """Returns site tree item children to be rendered for the given navigation type.
+
+        :param parent_item:
+        :param navigation_type: menu, sitetree
         :param context:
 
         """
         # Resolve parent item and current tree alias.
         parent_item = self.resolve_var(parent_item, context)
-        tree_alias, tree_items = self.get_sitetree(parent_item.tree.alias)
 
-        # Mark path to current item.
+        # Children may be already prepared by `.attach_children()`.
+        tree_items = getattr(parent_item, 'children', None)
+
+        if tree_items is None:
+            tree_alias, tree_items = self.get_sitetree(parent_item.tree.alias)
+
+            memo_key = (f'{navigation_type}.children', tree_alias, parent_item.id)
+            tree_items = self.get_memoized(memo_key)
+
+            if tree_items is None:
+                # Mark path to current item.
+                self.tree_climber(tree_alias, self.get_tree_current_item(tree_alias))
+
+                tree_items = self.get_children(tree_alias, parent_item)
+                tree_items = self.filter_items(tree_items, navigation_type)
+                tree_items = self.apply_hook(tree_items, f'{navigation_type}.children')
+                self.update_has_children(tree_alias, tree_items, navigation_type)
+                self.memoize(memo_key, tree_items)
+
+        return tree_items
+
+    def attach_children(
+            self,
+            tree_alias: str,
+            tree_items: List['TreeItemBase'],
+            navigation_type: str,
+            depth: int
+    ):
+        """Attaches filtered children lists to tree items inplace (`children` attribute)
+        down to the given depth, so that the whole nested structure is built at once.
+
+        Items of the last level get an empty `children` list and `has_children` set to False.
+
+        :param tree_alias:
+        :param tree_items:
+        :param navigation_type: sitetree, menu
+        :param depth: Number of levels to build including the level of `tree_items`.
+
+        """
         self.tree_climber(tree_alias, self.get_tree_current_item(tree_alias))
 
-        tree_items = self.get_children(tree_alias, parent_item)
-        tree_items = self.filter_items(tree_items, navigation_type)
-        tree_items = self.apply_hook(tree_items, f'{navigation_type}.children')
-        self.update_has_children(tree_alias, tree_items, navigation_type)
+        get_children = self.get_children
+        filter_items = self.filter_items
+        apply_hook = self.apply_hook
+
+        def attach(items, level):
+            for item in items:
+                children = []
+
+                if level < depth:
+                    children = filter_items(get_children(tree_alias, item), navigation_type)
+                    item.has_children = len(apply_hook(children, f'{navigation_type}.has_children')) > 0
+                    children = apply_hook(children, f'{navigation_type}.children')
+                    attach(children, level + 1)
+
+                else:
+                    item.has_children = False
+
+                item.children = children
+
+        attach(tree_items, 1)
 
-        my_template = get_template(use_template)
+    def detach_children(self, tree_items: List['TreeItemBase']):
+        """Drops children lists attached by `.attach_children()`.
 
-        context.push()
-        context['sitetree_items'] = tree_items
-        rendered = my_template.render(context.flatten())
-        context.pop()
+        :param tree_items:
+
+        """
+        for item in tree_items:
+            children = getattr(item, 'children', None)
+
+            if children:
+                self.detach_children(children)
 
-        return rendered
+            item.children = None
 
     def get_children(self, tree_alias: str, item: Optional['TreeItemBase']) -> List['TreeItemBase']:
         """Returns item's children.
@@ -1169,23 +2862,29 @@ class SiteTree:
 
     def resolve_var(
             self,
-            varname: Union[TypeStrExpr, 'TreeItemBase'],
+            varname: Union[TypeStrExpr, Variable, 'TreeItemBase'],
             context: Context = None
     ) -> Any:
         """Resolves name as a variable in a given context.
 
         If no context specified page context is considered as context.
 
-        :param varname:
+        :param varname: Variable name, `Variable`, `FilterExpression` or `Literal`.
         :param context:
 
         """
         context = context or self.current_page_context
 
-        if isinstance(varname, FilterExpression):
+        if isinstance(varname, (FilterExpression, Literal)):
             varname = varname.resolve(context)
 
-        else:
+        elif isinstance(varname, Variable):
+            try:
+                varname = varname.resolve(context)
+            except VariableDoesNotExist:
+                varname = varname.var
+
+        elif isinstance(varname, str):
             varname = varname.strip()
 
             try:
@@ -1197,3 +2896,4 @@ class SiteTree:
 
 
 _SITETREE_CLS = module_loading.import_string(SITETREE_CLS) if SITETREE_CLS else SiteTree
+_SITETREE_BUILDER_CLS = type('SiteTreeBuilder', (_SITETREE_CLS,), {'cache_cls': BuildCache})
@@ -0,0 +1,313 @@
+import pickle
+from hashlib import blake2b
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from threading import Lock, local
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from django.db import models
+from django.utils.module_loading import import_string
+
+from .exceptions import SiteTreeError
+from .utils import get_tree_item_model, get_tree_model
+
+if False:  # pragma: nocover
+    from .models import TreeItemBase  # noqa
+
+
+SNAPSHOT_SIGNATURE: bytes = b'SITETREE'
+"""Snapshot file signature."""
+
+SNAPSHOT_FORMAT: int = 2
+"""Snapshot format version. Snapshots of other versions are not loaded."""
+
+_FORMAT_OFFSET: int = len(SNAPSHOT_SIGNATURE)
+_VERSION_OFFSET: int = _FORMAT_OFFSET + 2
+_INDEX_LEN_OFFSET: int = _VERSION_OFFSET + 16
+_INDEX_OFFSET: int = _INDEX_LEN_OFFSET + 4
+
+_THREAD_LOCAL = local()
+_SNAPSHOTS: Dict[str, 'Snapshot'] = {}
+
+
+def get_item_fields() -> Tuple[List[str], List[str]]:
+    """Returns a tuple with names of tree item model fields to be stored in a snapshot:
+    (fields values, boolean fields stored as flags).
+
+    """
+    fields = []
+    flags = []
+
+    for field in get_tree_item_model()._meta.concrete_fields:
+
+        if field.is_relation:
+            # Tree and parent are stored as indexes.
+            continue
+
+        (flags if isinstance(field, models.BooleanField) else fields).append(field.attname)
+
+    return fields, flags
+
+
+def dump_snapshot(trees: Dict[str, Sequence['TreeItemBase']]) -> bytes:
+    """Returns snapshot of the given trees.
+
+    Items are expected to be prepared by `SiteTree.get_sitetree()`,
+    thus having depth and permissions calculated.
+
+    Snapshot consists of a header, trees index and trees records addressed
+    by offsets from the index. Tree records are compact structures of plain values:
+    item fields rows, flags bitmasks, precomputed children indexes, depths and permissions.
+
+    :param trees: Tree items indexed by tree aliases.
+
+    """
+    fields, flags = get_item_fields()
+    flags.append('is_dynamic')
+
+    index = {}
+    records = []
+    offset = 0
+
+    for alias, items in trees.items():
+        positions = {item.id: position for position, item in enumerate(items)}
+        roots = []
+        children = [[] for _ in items]
+
+        for position, item in enumerate(items):
+            parent_position = positions.get(getattr(item.parent, 'id', None))
+            (roots if parent_position is None else children[parent_position]).append(position)
+
+        record = pickle.dumps({
+            'rows': [tuple(getattr(item, field) for field in fields) for item in items],
+            'flags': [
+                sum(1 << idx for idx, flag in enumerate(flags) if getattr(item, flag, False))
+                for item in items
+            ],
+            'roots': roots,
+            'children': children,
+            'depth': [item.depth for item in items],
+            'perms': [tuple(sorted(getattr(item, 'perms', ()))) for item in items],
+            'access_check': [
+                f'{item.access_check.__module__}.{item.access_check.__qualname__}'
+                if getattr(item, 'access_check', None) else ''
+                for item in items
+            ],
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+
+        tree = items[0].tree if items else None
+
+        index[alias] = (offset, len(record), getattr(tree, 'id', None), getattr(tree, 'title', ''))
+        records.append(record)
+        offset += len(record)
+
+    index = pickle.dumps({'fields': fields, 'flags': flags, 'trees': index}, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = blake2b(index, digest_size=16)
+
+    for record in records:
+        digest.update(record)
+
+    return b''.join((
+        SNAPSHOT_SIGNATURE,
+        SNAPSHOT_FORMAT.to_bytes(2, 'big'),
+        digest.digest(),
+        len(index).to_bytes(4, 'big'),
+        index,
+        *records,
+    ))
+
+
+class Snapshot:
+    """Trees snapshot compiled with `dump_snapshot()`.
+
+    Only trees index is read on initialization,
+    trees records are decoded on demand.
+
+    """
+    def __init__(self, data: Union[bytes, mmap]):
+
+        if data[:_FORMAT_OFFSET] != SNAPSHOT_SIGNATURE:
+            raise SiteTreeError('Unable to load trees snapshot: unknown format.')
+
+        snapshot_format = int.from_bytes(data[_FORMAT_OFFSET:_VERSION_OFFSET], 'big')
+
+        if snapshot_format != SNAPSHOT_FORMAT:
+            raise SiteTreeError(
+                f'Unable to load trees snapshot: format {snapshot_format} is not supported. '
+                'Please recompile it with `sitetree_snapshot` command.')
+
+        index_len = int.from_bytes(data[_INDEX_LEN_OFFSET:_INDEX_OFFSET], 'big')
+        records_offset = _INDEX_OFFSET + index_len
+
+        index = pickle.loads(data[_INDEX_OFFSET:records_offset])
+
+        self.data = data
+        self.version: str = data[_VERSION_OFFSET:_INDEX_LEN_OFFSET].hex()
+        self.fields: List[str] = index['fields']
+        self.flags: List[str] = index['flags']
+        self.trees: dict = index['trees']
+        self.records_offset = records_offset
+        self.records: Dict[str, dict] = {}
+        self.lock = Lock()
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Snapshot':
+        """Returns snapshot read from the given file.
+
+        File is memory-mapped, so that only requested parts of it are read.
+
+        :param path:
+
+        """
+        try:
+            with Path(path).open('rb') as f:
+                data = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        except (OSError, ValueError) as e:
+            raise SiteTreeError(f'Unable to read trees snapshot from `{path}`: {e}') from None
+
+        return cls(data)
+
+    def get_record(self, alias: str) -> Optional[dict]:
+        """Returns decoded record of the given tree. Returns None if there is no such tree.
+
+        Records are decoded once per process (into process memory) and are shared
+        by all threads of the process, so that items values (titles, URLs, etc.)
+        are not duplicated per thread.
+
+        :param alias:
+
+        """
+        record = self.records.get(alias)
+
+        if record is not None:
+            return record
+
+        tree_index = self.trees.get(alias)
+
+        if tree_index is None:
+            return None
+
+        with self.lock:
+            record = self.records.get(alias)
+
+            if record is None:
+                offset, length, _, _ = tree_index
+                offset += self.records_offset
+                record = self.records[alias] = pickle.loads(self.data[offset:offset + length])
+
+        return record
+
+    def get_tree_items(self, alias: str) -> Optional[List['TreeItemBase']]:
+        """Returns items of the given tree. Returns None if there is no such tree.
+
+        Items are created anew on every call (since they are decorated with request-related data
+        at runtime), while their values are taken from a record shared within the process.
+
+        :param alias:
+
+        """
+        record = self.get_record(alias)
+
+        if record is None:
+            return None
+
+        _, _, tree_id, tree_title = self.trees[alias]
+
+        fields = self.fields
+        flags = self.flags
+
+        tree = get_tree_model()(id=tree_id, alias=alias, title=tree_title)
+        model_item = get_tree_item_model()
+        items = []
+
+        for row, item_flags, depth, perms, access_check in zip(
+            record['rows'], record['flags'], record['depth'], record['perms'], record['access_check']
+        ):
+            item = model_item(**dict(zip(fields, row)))
+            item.tree = tree
+
+            for idx, flag in enumerate(flags):
+                setattr(item, flag, bool(item_flags & (1 << idx)))
+
+            item.depth = depth
+            item.depth_range = range(depth)
+            item.has_children = False
+
+            if item.access_restricted:
+                item.perms = set(perms)
+
+            if access_check:
+                item.access_check = import_string(access_check)
+
+            items.append(item)
+
+        for item, children in zip(items, record['children']):
+            for child in (items[position] for position in children):
+                child.parent = item
+
+        return items
+
+    def get_entries(self) -> dict:
+        """Returns initial sitetree cache entries (see `sitetreeapp.Cache`)
+        for trees from this snapshot. Trees items are not included.
+
+        """
+        return {
+            'sitetrees': {}, 'parents': {}, 'positions': {},
+            'items_by_ids': {}, 'items_by_aliases': {},
+            'tree_aliases': dict.fromkeys(self.trees, 1),
+            'generations': dict.fromkeys(self.trees, self.version),
+        }
+
+    def load_tree(self, entries: dict, alias: str) -> bool:
+        """Decodes items of the given tree into the given cache entries.
+        Returns boolean whether the tree is in snapshot.
+
+        :param entries:
+        :param alias:
+
+        """
+        items = self.get_tree_items(alias)
+
+        if items is None:
+            return False
+
+        entries['sitetrees'][alias] = items
+        entries['items_by_ids'][alias] = {item.id: item for item in items}
+
+        return True
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """Returns snapshot from the given file.
+    File is read once per process.
+
+    :param path:
+
+    """
+    snapshot = _SNAPSHOTS.get(path)
+
+    if snapshot is None:
+        snapshot = _SNAPSHOTS[path] = Snapshot.from_file(path)
+
+    return snapshot
+
+
+def get_snapshot_entries(path: str) -> dict:
+    """Returns sitetree cache entries for the given snapshot file.
+
+    Entries are initialized once per thread, since tree items
+    are decorated with request-related data at runtime.
+
+    :param path:
+
+    """
+    entries = getattr(_THREAD_LOCAL, 'entries', {})
+    path_entries = entries.get(path)
+
+    if path_entries is None:
+        path_entries = entries[path] = read_snapshot(path).get_entries()
+        _THREAD_LOCAL.entries = entries
+
+    return path_entries
@@ -2,10 +2,10 @@ from typing import List, Optional
 
 from django import template
 from django.template import Context
-from django.template.base import FilterExpression, Parser, Token
+from django.template.base import FilterExpression, Parser, Token, Variable
 from django.template.loader import get_template
 
-from ..sitetreeapp import TypeStrExpr, get_sitetree
+from ..sitetreeapp import BranchesSelector, Literal, TypeStrExpr, get_sitetree, render_items
 
 if False:  # pragma: nocover
     from ..models import TreeItemBase  # noqa
@@ -28,14 +28,19 @@ def sitetree_tree(parser: Parser, token: Token) -> 'sitetree_treeNode':
            Used to render tree for "mytree" site tree using specific
            template "sitetree/mytree.html"
 
+    Optional `depth` clause limits the number of levels rendered
+    and builds the whole nested structure at once:
+           {% sitetree_tree from "mytree" depth 3 %}
+
     """
     tokens = token.split_contents()
     use_template = detect_clause(parser, 'template', tokens)
+    depth = detect_clause(parser, 'depth', tokens)
     tokens_num = len(tokens)
 
     if tokens_num in (3, 5):
-        tree_alias = parser.compile_filter(tokens[2])
-        return sitetree_treeNode(tree_alias, use_template)
+        tree_alias = compile_argument(parser, tokens[2])
+        return sitetree_treeNode(tree_alias, use_template, depth)
 
     raise template.TemplateSyntaxError(
         f'{tokens[0]} tag requires two arguments. '
@@ -64,7 +69,7 @@ def sitetree_children(parser: Parser, token: Token) -> 'sitetree_childrenNode':
         tokens_num == 5 and tokens[1] == 'of' and tokens[3] == 'for' and tokens[4] in ('menu', 'sitetree')
     )
     if clauses_in_places and use_template is not None:
-        tree_item = tokens[2]
+        tree_item = Variable(tokens[2])
         navigation_type = tokens[4]
         return sitetree_childrenNode(tree_item, navigation_type, use_template)
 
@@ -93,7 +98,7 @@ def sitetree_breadcrumbs(parser: Parser, token: Token) -> 'sitetree_breadcrumbsN
     tokens_num = len(tokens)
 
     if tokens_num == 3:
-        tree_alias = parser.compile_filter(tokens[2])
+        tree_alias = compile_argument(parser, tokens[2])
         return sitetree_breadcrumbsNode(tree_alias, use_template)
 
     raise template.TemplateSyntaxError(
@@ -119,15 +124,26 @@ def sitetree_menu(parser: Parser, token: Token) -> 'sitetree_menuNode':
 
         {% sitetree_menu from "mytree" include "trunk,1,level3" template "sitetree/mymenu.html" %}
 
+        Optional `depth` clause limits the number of levels rendered
+        and builds the whole nested structure at once:
+
+        {% sitetree_menu from "mytree" include "trunk" depth 3 %}
+
     """
     tokens = token.split_contents()
     use_template = detect_clause(parser, 'template', tokens)
+    depth = detect_clause(parser, 'depth', tokens)
     tokens_num = len(tokens)
 
     if tokens_num == 5 and tokens[3] == 'include':
-        tree_alias = parser.compile_filter(tokens[2])
-        tree_branches = parser.compile_filter(tokens[4])
-        return sitetree_menuNode(tree_alias, tree_branches, use_template)
+        tree_alias = compile_argument(parser, tokens[2])
+        tree_branches = compile_argument(parser, tokens[4])
+
+        if isinstance(tree_branches, Literal):
+            # Branches specification is parsed once.
+            tree_branches = Literal(BranchesSelector(tree_branches.value))
+
+        return sitetree_menuNode(tree_alias, tree_branches, use_template, depth)
 
     raise template.TemplateSyntaxError(
         f'{tokens[0]} tag requires four arguments. '
@@ -161,23 +177,111 @@ def sitetree_page_hint(parser: Parser, token: Token) -> 'sitetree_page_hintNode'
     return sitetree_page_hintNode.for_tag(parser, token, 'from', 'sitetree_page_hint from "mytree"')
 
 
-class sitetree_treeNode(template.Node):
-    """Renders tree items from specified site tree."""
+class TemplateNode(template.Node):
+    """Node rendering items with a template.
+    Template object is memoized if its name is a literal.
+
+    """
+    default_template: str = ''
+    """Template to use if none is given in `template` clause."""
+
+    navigation_type: str = ''
+    """Navigation type to build nested structure for if `depth` clause is used."""
+
+    def __init__(self, use_template: Optional[TypeStrExpr], depth: Optional[TypeStrExpr] = None):
+
+        if isinstance(depth, Literal) and get_depth(depth.value) is None:
+            raise template.TemplateSyntaxError(f'`depth` clause requires a positive integer, got {depth.value!r}.')
 
-    def __init__(self, tree_alias: FilterExpression, use_template: Optional[FilterExpression]):
         self.use_template = use_template
+        self.depth = depth
+        self._template = None
+
+    def get_template(self, context: Context):
+        """Returns a template object to render items with.
+
+        :param context:
+
+        """
+        template_obj = self._template
+
+        if template_obj is None:
+            use_template = self.use_template
+
+            if use_template is None:
+                use_template = self.default_template
+
+            elif isinstance(use_template, Literal):
+                use_template = use_template.value
+
+            else:
+                return get_template(use_template.resolve(context))
+
+            template_obj = get_template(use_template)
+            self._template = template_obj
+
+        return template_obj
+
+    def render_items(self, context: Context, tree_items: List['TreeItemBase'], tree_alias: TypeStrExpr) -> str:
+        """Renders tree items with a template.
+
+        If `depth` clause is used nested items structure is built beforehand,
+        so that `sitetree_children` calls do not need to query sitetree again.
+
+        :param context:
+        :param tree_items:
+        :param tree_alias:
+
+        """
+        depth = self.depth
+
+        if depth is not None:
+            # Invalid depth given in a variable means no depth limit.
+            depth = get_depth(depth.resolve(context))
+
+        if depth is None or not tree_items:
+            return render(context, tree_items, self.get_template(context))
+
+        sitetree = get_sitetree()
+        sitetree.attach_children(
+            tree_alias=sitetree.resolve_var(tree_alias, context),
+            tree_items=tree_items,
+            navigation_type=self.navigation_type,
+            depth=depth,
+        )
+
+        try:
+            return render(context, tree_items, self.get_template(context))
+
+        finally:
+            sitetree.detach_children(tree_items)
+
+
+class sitetree_treeNode(TemplateNode):
+    """Renders tree items from specified site tree."""
+
+    default_template: str = 'sitetree/tree.html'
+    navigation_type: str = 'sitetree'
+
+    def __init__(
+        self,
+        tree_alias: TypeStrExpr,
+        use_template: Optional[TypeStrExpr],
+        depth: Optional[TypeStrExpr] = None
+    ):
+        super().__init__(use_template, depth)
         self.tree_alias = tree_alias
 
     def render(self, context: Context) -> str:
         tree_items = get_sitetree().tree(tree_alias=self.tree_alias, context=context)
-        return render(context, tree_items, self.use_template or 'sitetree/tree.html')
+        return self.render_items(context, tree_items, self.tree_alias)
 
 
-class sitetree_childrenNode(template.Node):
+class sitetree_childrenNode(TemplateNode):
     """Renders tree items under specified parent site tree item."""
 
-    def __init__(self, tree_item: str, navigation_type: str, use_template: Optional[FilterExpression]):
-        self.use_template = use_template
+    def __init__(self, tree_item: Variable, navigation_type: str, use_template: Optional[TypeStrExpr]):
+        super().__init__(use_template)
         self.tree_item = tree_item
         self.navigation_type = navigation_type
 
@@ -185,33 +289,39 @@ class sitetree_childrenNode(template.Node):
         return get_sitetree().children(
             parent_item=self.tree_item,
             navigation_type=self.navigation_type,
-            use_template=self.use_template.resolve(context),
+            use_template=self.get_template(context),
             context=context
         )
 
 
-class sitetree_breadcrumbsNode(template.Node):
+class sitetree_breadcrumbsNode(TemplateNode):
     """Renders breadcrumb trail items from specified site tree."""
 
-    def __init__(self, tree_alias: FilterExpression, use_template: Optional[FilterExpression]):
-        self.use_template = use_template
+    default_template: str = 'sitetree/breadcrumbs.html'
+
+    def __init__(self, tree_alias: TypeStrExpr, use_template: Optional[TypeStrExpr]):
+        super().__init__(use_template)
         self.tree_alias = tree_alias
 
     def render(self, context: Context) -> str:
         tree_items = get_sitetree().breadcrumbs(tree_alias=self.tree_alias, context=context)
-        return render(context, tree_items, self.use_template or 'sitetree/breadcrumbs.html')
+        return render(context, tree_items, self.get_template(context))
 
 
-class sitetree_menuNode(template.Node):
+class sitetree_menuNode(TemplateNode):
     """Renders specified site tree menu items."""
 
+    default_template: str = 'sitetree/menu.html'
+    navigation_type: str = 'menu'
+
     def __init__(
         self,
-        tree_alias: FilterExpression,
-        tree_branches: FilterExpression,
-        use_template: Optional[FilterExpression]
+        tree_alias: TypeStrExpr,
+        tree_branches: TypeStrExpr,
+        use_template: Optional[TypeStrExpr],
+        depth: Optional[TypeStrExpr] = None
     ):
-        self.use_template = use_template
+        super().__init__(use_template, depth)
         self.tree_alias = tree_alias
         self.tree_branches = tree_branches
 
@@ -221,7 +331,7 @@ class sitetree_menuNode(template.Node):
             tree_branches=self.tree_branches,
             context=context
         )
-        return render(context, tree_items, self.use_template or 'sitetree/menu.html')
+        return self.render_items(context, tree_items, self.tree_alias)
 
 
 class SimpleNode(template.Node):
@@ -234,7 +344,7 @@ class SimpleNode(template.Node):
 
         if len(tokens) >= 3 and tokens[1] == preposition:
             as_var = cls.get_as_var(tokens)
-            tree_alias = parser.compile_filter(tokens[2])
+            tree_alias = compile_argument(parser, tokens[2])
             return cls(tree_alias, as_var)
 
         raise template.TemplateSyntaxError(
@@ -255,7 +365,7 @@ class SimpleNode(template.Node):
             tokens[-2:] = []
         return as_var
 
-    def __init__(self, item: FilterExpression, as_var: Optional[str]):
+    def __init__(self, item: TypeStrExpr, as_var: Optional[str]):
         self.item = item
         self.as_var = as_var
 
@@ -300,7 +410,49 @@ class sitetree_page_hintNode(SimpleNode):
 
     def get_value(self, context: Context):
         return get_sitetree().get_current_page_attr('hint', self.item, context)
-    
+
+
+def compile_argument(parser: Parser, token: str) -> TypeStrExpr:
+    """Compiles tag argument.
+
+    Literals (e.g. strings in quotes or numbers) without filters
+    are resolved at once and returned wrapped into `Literal`.
+    Other arguments are returned as filter expressions to be resolved on render.
+
+    :param parser:
+    :param token:
+
+    """
+    expression = parser.compile_filter(token)
+
+    if expression.filters:
+        return expression
+
+    var = expression.var
+
+    if not isinstance(var, Variable):
+        return Literal(var)
+
+    if var.literal is not None and not var.translate:
+        return Literal(var.literal)
+
+    return expression
+
+
+def get_depth(value) -> Optional[int]:
+    """Returns `depth` clause value as a positive integer or None if the value is invalid.
+
+    :param value:
+
+    """
+    try:
+        depth = int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    return depth if depth > 0 else None
+
 
 def detect_clause(parser: Parser, clause_name: str, tokens: List[str]):
     """Helper function detects a certain clause in tag tokens list.
@@ -309,7 +461,7 @@ def detect_clause(parser: Parser, clause_name: str, tokens: List[str]):
     """
     if clause_name in tokens:
         t_index = tokens.index(clause_name)
-        clause_value = parser.compile_filter(tokens[t_index + 1])
+        clause_value = compile_argument(parser, tokens[t_index + 1])
         del tokens[t_index:t_index + 2]
 
     else:
@@ -322,14 +474,15 @@ def render(context: Context, tree_items: List['TreeItemBase'], use_template: Typ
     """Render helper is used by template node functions
     to render given template with given tree items in context.
 
-    """
-    context.push()
-    context['sitetree_items'] = tree_items
+    :param context:
+    :param tree_items:
+    :param use_template: Template name, filter expression or template object.
 
-    if isinstance(use_template, FilterExpression):
+    """
+    if isinstance(use_template, (FilterExpression, Literal)):
         use_template = use_template.resolve(context)
 
-    content = get_template(use_template).render(context.flatten())
-    context.pop()
+    if isinstance(use_template, str):
+        use_template = get_template(use_template)
 
-    return content
+    return render_items(context, tree_items, use_template)
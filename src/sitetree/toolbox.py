@@ -1,5 +1,5 @@
 # Unused imports below are exposed as API.
 from .fields import TreeItemChoiceField  # noqa
 from .forms import TreeItemForm  # noqa
-from .sitetreeapp import register_i18n_trees, register_items_hook, compose_dynamic_tree, register_dynamic_trees, get_dynamic_trees  # noqa
+from .sitetreeapp import register_i18n_trees, register_items_hook, compose_dynamic_tree, register_dynamic_trees, get_dynamic_trees, register_dynamic_provider  # noqa
 from .utils import get_tree_item_model, get_tree_model, tree, item, import_app_sitetree_module, import_project_sitetree_modules  # noqa
@@ -1,15 +1,37 @@
+import json
+import warnings
+import zlib
+from hashlib import blake2b
 from importlib import import_module
+from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable, List, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 
 from django.apps import apps
 from django.contrib.auth.models import Permission
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q, QuerySet
 from django.template.context import Context
-from django.utils.functional import SimpleLazyObject
-from django.utils.module_loading import module_has_submodule
+from django.utils.module_loading import import_string, module_has_submodule
 
 from . import settings
+from .exceptions import SiteTreeError
+
+try:
+    import tomllib
+
+except ImportError:  # pragma: nocover
+    try:
+        import tomli as tomllib
+
+    except ImportError:
+        tomllib = None
+
+try:
+    import lz4.frame as lz4
+
+except ImportError:  # pragma: nocover
+    lz4 = None
 
 if False:  # pragma: nocover
     from .models import TreeItemBase, TreeBase  # noqa
@@ -19,12 +41,100 @@ TypePermission = Union[str, int, Permission]
 
 apps_get_model = apps.get_model
 
+SITETREE_FILE_EXTENSIONS = ('json', 'toml')
+"""Extensions of files with declarative trees definitions supported in apps."""
+
+
+_CODEC_NONE = b'-'
+_CODEC_ZLIB = b'z'
+_CODEC_LZ4 = b'l'
+
+
+def compress(data: bytes, *, enabled: bool = True) -> bytes:
+    """Compresses the given data using lz4 (if installed) or zlib.
+    Compressed data is prefixed with a codec marker for `decompress()`.
+
+    :param data:
+    :param enabled: If False data is not compressed, but only prefixed with a marker.
+
+    """
+    if not enabled:
+        return _CODEC_NONE + data
+
+    if lz4 is None:
+        return _CODEC_ZLIB + zlib.compress(data)
+
+    return _CODEC_LZ4 + lz4.compress(data)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompresses data compressed with `compress()`.
+
+    :param data:
+
+    """
+    codec, data = data[:1], data[1:]
+
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(data)
+
+    if codec == _CODEC_LZ4:
+        if lz4 is None:
+            raise SiteTreeError('Unable to decompress data: `lz4` package is not installed.')
+        return lz4.decompress(data)
+
+    if codec == _CODEC_NONE:
+        return data
+
+    raise SiteTreeError('Unable to decompress data: unknown codec.')
+
 
 def generate_id_for(obj: Any):
     """Generates and returns a unique identifier for the given object."""
     return id(obj)
 
 
+_DYNAMIC_ID_MAX: int = 2 ** 53 - 1
+"""Max absolute value of a dynamic item identifier (JavaScript `Number.MAX_SAFE_INTEGER`)."""
+
+
+def generate_dynamic_id(*path: Any) -> int:
+    """Generates and returns a deterministic identifier for a dynamic tree item
+    addressed by the given path (e.g. tree alias, attachment point, item position).
+
+    Identifiers are negative, so that they do not collide with DB primary keys,
+    and are within JavaScript safe integers range, so that they survive JSON serialization.
+
+    :param path:
+
+    """
+    digest = blake2b('|'.join(f'{part}' for part in path).encode(), digest_size=8).digest()
+    return -(int.from_bytes(digest, 'big') % _DYNAMIC_ID_MAX) - 1
+
+
+def assign_dynamic_ids(items: Sequence['TreeItemBase'], *path: Any):
+    """Assigns deterministic identifiers to the given dynamic tree items
+    depending on their positions in a tree.
+
+    Items are expected to be in a tree order (parents before their children),
+    as in `dynamic_items` attribute of a tree created by `tree()`.
+
+    :param items:
+    :param path: Base path (e.g. tree alias and attachment point) for item paths.
+
+    """
+    paths = {}
+    positions = {}
+
+    for item in items:
+        parent_key = id(item.parent)
+        position = positions.get(parent_key, 0)
+        positions[parent_key] = position + 1
+
+        item_path = paths[id(item)] = (*paths.get(parent_key, path), position)
+        item.id = generate_dynamic_id(*item_path)
+
+
 def tree(alias: str, title: str = '', items: Sequence['TreeItemBase'] = None, **kwargs) -> 'TreeBase':
     """Dynamically creates and returns a sitetree.
 
@@ -53,29 +163,40 @@ def tree(alias: str, title: str = '', items: Sequence['TreeItemBase'] = None, **
     return tree_obj
 
 
-def clean_permission(permission: TypePermission) -> Union[int, Permission]:
-    if isinstance(permission, str):
-        # Get permission object from string
-        try:
-            app, codename = permission.split('.')
+def clean_permission(permission: TypePermission) -> Union[int, str]:
+    """Validates the given permission. Returns permission ID or `<app_label>.<codename>` string.
 
-        except ValueError:
+    :param permission:
+
+    """
+    if isinstance(permission, Permission):
+        return f'{permission.content_type.app_label}.{permission.codename}'
+
+    if isinstance(permission, str):
+        if permission.count('.') != 1:
             raise ValueError(
                 f'Wrong permission string format: supplied - `{permission}`; '
-                'expected - `<app_name>.<permission_name>`.') from None
-        try:
-            return Permission.objects.get(codename=codename, content_type__app_label=app)
+                'expected - `<app_name>.<permission_name>`.')
 
-        except Permission.DoesNotExist:
-            raise ValueError(f'Permission `{app}.{codename}` does not exist.') from None
-
-    elif not isinstance(permission, (int, Permission)):
+    elif not isinstance(permission, int):
         raise ValueError('Permissions must be given as strings, ints, or `Permission` instances.')
 
     return permission
 
 
-def clean_permissions(permissions: Union[TypePermission, List[TypePermission]]) -> List[Permission]:
+def clean_permissions(permissions: Union[TypePermission, List[TypePermission]]) -> List[Union[int, Permission]]:
+    """Validates the given permissions. Returns a list of permission IDs and `Permission` objects.
+
+    .. deprecated:: 1.19.0
+       Use `resolve_permissions()` or `get_permissions_ids()` instead.
+
+    :param permissions:
+
+    """
+    warnings.warn(
+        '`clean_permissions()` is deprecated, please use `resolve_permissions()` instead.',
+        DeprecationWarning, 2)
+
     if permissions is None:
         return []
 
@@ -83,12 +204,126 @@ def clean_permissions(permissions: Union[TypePermission, List[TypePermission]])
     if not isinstance(permissions, list):
         permissions = [permissions]
 
+    ids = get_permissions_ids(permissions)
+    objects = Permission.objects.in_bulk(
+        [permission_id for permission, permission_id in zip(permissions, ids) if isinstance(permission, str)])
+
     return [
-        clean_permission(permission)
-        for permission in permissions
+        objects[permission_id] if isinstance(permission, str) else permission
+        for permission, permission_id in zip(permissions, ids)
     ]
 
 
+def get_permissions_ids(permissions: Sequence[TypePermission]) -> List[int]:
+    """Returns IDs of the given permissions (with a single DB query),
+    e.g. to be set into `access_permissions` of an item.
+
+    :param permissions:
+
+    """
+    cleaned = [clean_permission(permission) for permission in permissions]
+
+    if not cleaned:
+        return []
+
+    existing = {}
+
+    for permission_id, app_label, codename in get_permissions_rows(cleaned):
+        existing[permission_id] = permission_id
+        existing[f'{app_label}.{codename}'] = permission_id
+
+    ids = []
+
+    for permission_cleaned in cleaned:
+        permission_id = existing.get(permission_cleaned)
+
+        if permission_id is None:
+            raise ValueError(f'Permission `{permission_cleaned}` does not exist.')
+
+        ids.append(permission_id)
+
+    return ids
+
+
+def resolve_permissions(permissions: Iterable[TypePermission]) -> Dict[Union[int, str], str]:
+    """Resolves the given permissions in bulk (with a single DB query).
+    Returns a dictionary with `<app_label>.<codename>` strings indexed by permissions as given.
+
+    :param permissions:
+
+    """
+    cleaned = {permission: clean_permission(permission) for permission in set(permissions)}
+
+    if not cleaned:
+        return {}
+
+    return match_permissions(cleaned, get_permissions_rows(cleaned.values()))
+
+
+async def aresolve_permissions(permissions: Iterable[TypePermission]) -> Dict[Union[int, str], str]:
+    """Async variant of `resolve_permissions()`.
+
+    :param permissions:
+
+    """
+    cleaned = {permission: clean_permission(permission) for permission in set(permissions)}
+
+    if not cleaned:
+        return {}
+
+    return match_permissions(cleaned, [row async for row in get_permissions_rows(cleaned.values())])
+
+
+def get_permissions_rows(permissions: Iterable[Union[int, str]]) -> QuerySet:
+    """Returns a queryset of (id, app label, codename) rows for the given cleaned permissions.
+
+    :param permissions:
+
+    """
+    ids = set()
+    names = set()
+
+    for permission in permissions:
+        (names if isinstance(permission, str) else ids).add(permission)
+
+    codenames = {name.split('.')[1] for name in names}
+
+    return Permission.objects.filter(
+        Q(id__in=ids) | Q(codename__in=codenames)
+    ).values_list('id', 'content_type__app_label', 'codename')
+
+
+def match_permissions(
+        cleaned: Dict[TypePermission, Union[int, str]],
+        rows: Iterable[Tuple[int, str, str]]
+) -> Dict[Union[int, str], str]:
+    """Matches cleaned permissions against permissions rows from DB.
+    Returns a dictionary with `<app_label>.<codename>` strings indexed by permissions as given.
+
+    :param cleaned: Cleaned permissions indexed by permissions as given.
+    :param rows: See `get_permissions_rows()`.
+
+    """
+    existing = {}
+
+    for permission_id, app_label, codename in rows:
+        name = f'{app_label}.{codename}'
+        existing[permission_id] = name
+        existing[name] = name
+
+    resolved = {}
+
+    for permission, permission_cleaned in cleaned.items():
+        name = existing.get(permission_cleaned)
+
+        if name is None:
+            raise ValueError(f'Permission `{permission_cleaned}` does not exist.')
+
+        resolved[permission] = name
+
+    return resolved
+
+
 def item(
         title: str,
         url: str,
@@ -168,7 +403,17 @@ def item(
     item_obj.is_dynamic = True
     item_obj.dynamic_children = []
 
-    item_obj.permissions = SimpleLazyObject(lambda: clean_permissions(access_by_perms))
+    # Permissions are validated and resolved in bulk on tree build.
+    if access_by_perms is None:
+        access_by_perms = []
+
+    elif not isinstance(access_by_perms, list):
+        access_by_perms = [access_by_perms]
+
+    item_obj.permissions = [
+        clean_permission(permission) if isinstance(permission, Permission) else permission
+        for permission in access_by_perms
+    ]
     item_obj.access_perm_type = item_obj.PERM_TYPE_ALL if perms_mode_all else item_obj.PERM_TYPE_ANY
 
     if access_by_perms:
@@ -192,6 +437,10 @@ def item(
 def import_app_sitetree_module(app: str) -> Optional[ModuleType]:
     """Imports sitetree module from a given app.
 
+    If there is no such module, but the app contains a sitetree file
+    (e.g. `sitetrees.json` or `sitetrees.toml`), a module with trees
+    loaded from that file is returned.
+
     :param app: Application name
 
     """
@@ -205,7 +454,91 @@ def import_app_sitetree_module(app: str) -> Optional[ModuleType]:
     except ImportError:
         if module_has_submodule(module, module_name):
             raise
-        return None
+
+    for module_path in getattr(module, '__path__', []):
+        for extension in SITETREE_FILE_EXTENSIONS:
+            path = Path(module_path) / f'{module_name}.{extension}'
+
+            if path.is_file():
+                sub_module = ModuleType(f'{app}.{module_name}')
+                sub_module.__package__ = app
+                sub_module.__file__ = f'{path}'
+                sub_module.sitetrees = load_sitetree_file(path)
+                return sub_module
+
+    return None
+
+
+def load_sitetree_file(path: Union[str, Path]) -> List['TreeBase']:
+    """Loads trees from a file with declarative trees definitions.
+    Supported formats are JSON (`.json`) and TOML (`.toml`).
+
+    Expects a list of trees (or a mapping with such a list under `sitetrees` key).
+    Each tree is described with `tree()` arguments, each item - with `item()` arguments,
+    where `access_check` may be given as a dotted path to a callable.
+
+    Example (JSON)::
+
+        [{"alias": "main", "items": [
+            {"title": "Home", "url": "/", "url_as_pattern": false, "children": [
+                {"title": "About", "url": "about"}
+            ]}
+        ]}]
+
+    Example (TOML)::
+
+        [[sitetrees]]
+        alias = "main"
+
+        [[sitetrees.items]]
+        title = "Home"
+        url = "/"
+        url_as_pattern = false
+
+        [[sitetrees.items.children]]
+        title = "About"
+        url = "about"
+
+    :param path:
+
+    """
+    path = Path(path)
+    extension = path.suffix.lstrip('.')
+
+    if extension == 'json':
+        trees = json.loads(path.read_text(encoding='utf-8'))
+
+    elif extension == 'toml':
+        if tomllib is None:
+            raise ImproperlyConfigured(f'Unable to load `{path}`: TOML support requires Python 3.11+ or `tomli`.')
+
+        trees = tomllib.loads(path.read_text(encoding='utf-8'))
+
+    else:
+        raise ImproperlyConfigured(f'Unable to load `{path}`: unsupported sitetree file format.')
+
+    if isinstance(trees, dict):
+        trees = trees.get('sitetrees', [])
+
+    def make_items(items: List[dict]) -> List['TreeItemBase']:
+        result = []
+
+        for item_kwargs in items:
+            item_kwargs = dict(item_kwargs)
+            children = make_items(item_kwargs.pop('children', []))
+
+            access_check = item_kwargs.get('access_check')
+            if isinstance(access_check, str):
+                item_kwargs['access_check'] = import_string(access_check)
+
+            result.append(item(children=children, **item_kwargs))
+
+        return result
+
+    return [
+        tree(items=make_items(tree_kwargs.pop('items', [])), **tree_kwargs)
+        for tree_kwargs in (dict(tree_kwargs) for tree_kwargs in trees)
+    ]
 
 
 def import_project_sitetree_modules() -> List[ModuleType]:
@@ -0,0 +1,313 @@
+import json
+from copy import copy
+from hashlib import blake2b
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+from urllib.parse import urlsplit
+
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
+from django.template.context import Context
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.html import escape
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from django.views.decorators.http import require_safe
+
+from . import sitemaps
+from .settings import NAVIGATION_STREAM_THRESHOLD
+from .sitetreeapp import BranchesSelector, Literal, get_sitetree
+
+if False:  # pragma: nocover
+    from .models import TreeItemBase  # noqa
+    from .sitetreeapp import SiteTree  # noqa
+
+
+NAVIGATION_TYPES = {'menu': 'menu', 'tree': 'sitetree', 'breadcrumbs': 'breadcrumbs'}
+"""Navigation types supported by `navigation()` view mapped to items filtering types."""
+
+
+@require_safe
+def navigation(request: HttpRequest, tree_alias: str) -> HttpResponse:
+    """Returns navigation structure of the given tree serialized into JSON.
+
+    Query string parameters:
+
+        * `type` - menu, tree (default), breadcrumbs
+        * `branches` - branches specification for menu (default: trunk). E.g.: `trunk,1,level3`.
+        * `url` - URL of a page to resolve current item for (default: the URL requested).
+
+    Response is:
+
+        {"items": [{"id": "1", "title": "Home", "url": "/", "hint": "", "description": "",
+                    "alias": "home", "is_current": false, "in_current_branch": true,
+                    "children": [...]}]}
+
+    Response ETag is derived from tree generation, current language,
+    current user access signature and query string parameters,
+    so that a request with a matching `If-None-Match` header gets `304 Not Modified`.
+
+    Items ids are strings, so that clients treat them as opaque identifiers
+    (not subject to JavaScript numbers precision).
+
+    Trees larger than `SITETREE_NAVIGATION_STREAM_THRESHOLD` items are streamed.
+
+    :param request:
+    :param tree_alias:
+
+    """
+    params = request.GET
+
+    navigation_type = params.get('type', 'tree')
+
+    if navigation_type not in NAVIGATION_TYPES:
+        return HttpResponseBadRequest(f'Unsupported navigation type: {navigation_type}.')
+
+    branches = params.get('branches', 'trunk')
+    page_url = params.get('url')
+
+    if page_url:
+        request = get_page_request(request, page_url)
+
+    sitetree = get_sitetree()
+    context = sitetree.init_request(request)
+
+    # Alias comes from URL: unknown trees are not to be fetched and cached.
+    if not sitetree.tree_exists(tree_alias):
+        raise Http404('Site tree is not found.')
+
+    tree_alias, sitetree_items = sitetree.init_tree(Literal(tree_alias), context)
+
+    if not sitetree_items:
+        raise Http404('Site tree is not found.')
+
+    etag = get_navigation_etag(sitetree, tree_alias, f'{navigation_type}|{branches}|{page_url or ""}')
+
+    response = get_conditional_response(request, etag=etag) if etag else None
+
+    if response is None:
+
+        if navigation_type == 'menu':
+            tree_items = sitetree.menu(Literal(tree_alias), Literal(BranchesSelector(branches)), context)
+
+        elif navigation_type == 'breadcrumbs':
+            tree_items = sitetree.breadcrumbs(Literal(tree_alias), context)
+
+        else:
+            tree_items = sitetree.tree(Literal(tree_alias), context)
+
+        chunks = dump_items(sitetree, context, tree_items, NAVIGATION_TYPES[navigation_type])
+
+        if len(sitetree_items) >= NAVIGATION_STREAM_THRESHOLD:
+            response = StreamingHttpResponse(chunks, content_type='application/json')
+
+        else:
+            response = HttpResponse(''.join(chunks), content_type='application/json')
+
+    if etag:
+        response['ETag'] = etag
+
+    # Items access depends on a user identified by session, titles depend on language.
+    patch_vary_headers(response, ['Cookie', 'Accept-Language'])
+
+    return response
+
+
+def get_page_request(request: HttpRequest, url: str) -> HttpRequest:
+    """Returns a copy of the given request pretending to be made for the given page URL,
+    so that current tree item is resolved for that page.
+
+    :param request:
+    :param url:
+
+    """
+    path = urlsplit(url).path or '/'
+
+    page_request = copy(request)
+    page_request.path = path
+
+    try:
+        page_request.resolver_match = resolve(path)
+
+    except Resolver404:
+        page_request.resolver_match = None
+
+    return page_request
+
+
+def get_navigation_etag(sitetree: 'SiteTree', tree_alias: str, params: str) -> str:
+    """Returns a strong ETag for navigation of the given tree
+    or an empty string if tree generation is unknown.
+
+    :param sitetree:
+    :param tree_alias: Resolved tree alias.
+    :param params: Navigation parameters (type, branches, page URL).
+
+    """
+    generation = sitetree.get_tree_generation(tree_alias)
+
+    if not generation:
+        return ''
+
+    signature = sitetree.get_access_signature(tree_alias)
+
+    digest = blake2b(
+        f'{tree_alias}|{generation}|{get_language()}|{signature}|{params}'.encode(),
+        digest_size=16
+    )
+
+    return quote_etag(digest.hexdigest())
+
+
+def dump_items(
+        sitetree: 'SiteTree',
+        context: Context,
+        tree_items: List['TreeItemBase'],
+        navigation_type: str
+) -> Iterator[str]:
+    """Yields JSON chunks for the given tree items with their children nested.
+
+    :param sitetree:
+    :param context:
+    :param tree_items:
+    :param navigation_type: menu, sitetree, breadcrumbs
+
+    """
+    url = sitetree.url
+    children_items = sitetree.children_items
+    dumps = json.dumps
+
+    def dump(items: List['TreeItemBase']) -> Iterator[str]:
+        yield '['
+
+        for idx, item in enumerate(items):
+
+            if idx:
+                yield ','
+
+            head = dumps({
+                'id': f'{item.id}',
+                'title': f'{item.title_resolved}',
+                'url': url(item, context),
+                'hint': item.hint,
+                'description': item.description,
+                'alias': item.alias,
+                'is_current': item.is_current,
+                'in_current_branch': item.in_current_branch,
+            })
+
+            if navigation_type == 'breadcrumbs' or not item.has_children:
+                yield f'{head[:-1]}, "children": []}}'
+                continue
+
+            yield f'{head[:-1]}, "children": '
+            yield from dump(children_items(item, navigation_type, context))
+            yield '}'
+
+        yield ']'
+
+    yield '{"items": '
+    yield from dump(tree_items)
+    yield '}'
+
+
+@require_safe
+def sitemap(request: HttpRequest, tree_alias: str) -> StreamingHttpResponse:
+    """Streams sitemap XML listing URLs of the given tree items
+    (see `sitetree.sitemaps.get_sitemap_urls()`).
+
+    If there are more URLs than a sitemap file may contain (50k),
+    sitemap index is streamed instead, referencing sitemap pages
+    by `p` query string parameter (e.g. `/sitemap.xml?p=2`).
+
+    :param request:
+    :param tree_alias:
+
+    """
+    limit = sitemaps.SITEMAP_LIMIT
+    page = request.GET.get('p')
+
+    urls = sitemaps.get_sitemap_urls(tree_alias, request)
+
+    if page is None:
+        head = list(islice(urls, limit + 1))
+
+        if not head:
+            raise Http404('Sitemap is empty.')
+
+        if len(head) > limit:
+            count = len(head) + sum(1 for _ in urls)
+            pages = range(1, (count + limit - 1) // limit + 1)
+
+            return StreamingHttpResponse(
+                dump_sitemap_index(request, pages), content_type='application/xml')
+
+        urls = head
+
+    else:
+        try:
+            page = int(page)
+
+        except ValueError:
+            raise Http404('Invalid sitemap page.') from None
+
+        if page < 1:
+            raise Http404('Invalid sitemap page.')
+
+        urls = islice(urls, (page - 1) * limit, page * limit)
+        first = next(urls, None)
+
+        if first is None:
+            raise Http404('Sitemap page is empty.')
+
+        urls = chain((first,), urls)
+
+    return StreamingHttpResponse(dump_sitemap(request, urls), content_type='application/xml')
+
+
+def dump_sitemap(request: HttpRequest, urls: Iterable[str], batch_size: int = 1000) -> Iterator[str]:
+    """Yields sitemap XML chunks for the given site URLs.
+
+    :param request:
+    :param urls:
+    :param batch_size: Number of URLs per chunk.
+
+    """
+    base_url = f'{request.scheme}://{request.get_host()}'
+
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+    batch = []
+
+    for url in urls:
+        batch.append(f'<url><loc>{escape(base_url + url)}</loc></url>\n')
+
+        if len(batch) == batch_size:
+            yield ''.join(batch)
+            batch = []
+
+    if batch:
+        yield ''.join(batch)
+
+    yield '</urlset>\n'
+
+
+def dump_sitemap_index(request: HttpRequest, pages: Iterable[int]) -> Iterator[str]:
+    """Yields sitemap index XML chunks for the given sitemap pages.
+
+    :param request:
+    :param pages:
+
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+    for page in pages:
+        yield f'<sitemap><loc>{escape(request.build_absolute_uri(f"{request.path}?p={page}"))}</loc></sitemap>\n'
+
+    yield '</sitemapindex>\n'
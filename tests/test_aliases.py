@@ -0,0 +1,28 @@
+def test_item_by_alias(template_render_tag, template_context, template_strip_tags, common_tree):
+
+    from sitetree.sitetreeapp import _DYNAMIC_TREES, get_sitetree
+    from sitetree.toolbox import compose_dynamic_tree, item, register_dynamic_trees, tree
+
+    register_dynamic_trees(
+        compose_dynamic_tree([tree('dynamic', items=[
+            item('dynamic_1', '/dynamic_1_url', url_as_pattern=False, alias='dyn1', children=[
+                item('dynamic_1_child', '/dynamic_1_child_url', url_as_pattern=False),
+            ]),
+        ])], target_tree_alias='mytree', parent_tree_item_alias='ruweb'),
+        reset_cache=True
+    )
+
+    try:
+        result = template_strip_tags(template_render_tag(
+            'sitetree', 'sitetree_menu from "mytree" include "dyn1"', template_context(request='/')))
+        assert result == 'dynamic_1_child'
+
+        sitetree = get_sitetree()
+
+        # Static and dynamic items are indexed.
+        assert sitetree.get_item_by_alias('mytree', 'ruweb').title == 'Web'
+        assert sitetree.get_item_by_alias('mytree', 'dyn1').title == 'dynamic_1'
+        assert sitetree.get_item_by_alias('mytree', 'unknown') is None
+
+    finally:
+        _DYNAMIC_TREES.clear()
@@ -0,0 +1,79 @@
+import pytest
+
+
+def test_cache_chunks(monkeypatch, common_tree):
+    from sitetree import sitetreeapp
+    from sitetree.sitetreeapp import Cache, cache, warm
+    from sitetree.utils import compress, decompress
+
+    assert decompress(compress(b'data')) == b'data'
+    assert decompress(compress(b'data', enabled=False)) == b'data'
+
+    monkeypatch.setattr(sitetreeapp, 'CACHE_CHUNK_SIZE', 1024)
+
+    assert warm(['mytree'], workers=1) == ['mytree']
+
+    version, chunks_count = cache.get('sitetrees')
+    assert chunks_count > 1
+    assert Cache().get_entry('sitetrees', 'mytree')
+
+    # Chunks of previous data are deleted on rewrite.
+    assert warm(['mytree'], workers=1) == ['mytree']
+    assert not cache.get_many([f'sitetrees|{version}|{idx}' for idx in range(chunks_count)])
+
+    version, chunks_count = cache.get('sitetrees')
+
+    # And on emptying.
+    Cache().empty(init=False)
+    assert not cache.get_many([f'sitetrees|{version}|{idx}' for idx in range(chunks_count)])
+
+    assert warm(['mytree'], workers=1) == ['mytree']
+    version, _ = cache.get('sitetrees')
+
+    # Evicted chunk invalidates data.
+    cache.delete(f'sitetrees|{version}|0')
+    assert Cache().get_entry('sitetrees', 'mytree') is False
+
+
+def test_cache_breaker(monkeypatch, common_tree):
+    from sitetree import sitetreeapp
+    from sitetree.sitetreeapp import Cache, CacheBreaker, warm
+
+    class Backend:
+
+        calls = 0
+
+        def get_many(self, keys):
+            self.calls += 1
+            raise ConnectionError('down')
+
+        def set(self, key, value, timeout):
+            self.calls += 1
+            raise ConnectionError('down')
+
+    backend = Backend()
+    breaker = CacheBreaker(backend, threshold=2, retry_timeout=60)
+
+    assert breaker.get_many(['a']) == {}
+    assert not breaker.is_open
+
+    with pytest.warns(UserWarning, match='ConnectionError: down'):
+        assert breaker.call('get_many', ['a'], fallback='fallback') == 'fallback'
+
+    assert breaker.is_open
+    breaker.get_many(['a'])
+    assert backend.calls == 2  # Backend is not called while circuit is open.
+
+    # Probing after retry timeout.
+    breaker.opened_at -= 60
+    breaker.get_many(['a'])
+    assert backend.calls == 3
+    assert breaker.is_open
+
+    # Trees are served from process-local copy when cache is down.
+    assert warm(['mytree'], workers=1) == ['mytree']
+
+    breaker.opened_at -= 60
+    monkeypatch.setattr(sitetreeapp, 'cache', breaker)
+
+    assert Cache().get_entry('sitetrees', 'mytree')
@@ -0,0 +1,55 @@
+def test_current_item_resolver_match(monkeypatch, template_context, request_get, common_tree):
+
+    from django.urls import resolve
+
+    from sitetree import sitetreeapp
+    from sitetree.sitetreeapp import get_sitetree
+
+    request = request_get('/contacts/australia/x/')
+    request.resolver_match = resolve('/contacts/australia/x/')
+
+    def reverse_failing(*args, **kwargs):
+        raise AssertionError('URL reversal is not expected')
+
+    monkeypatch.setattr(sitetreeapp, 'reverse', reverse_failing)
+
+    sitetree = get_sitetree()
+    context = template_context(context_dict={'australia_var': 'x'}, request=request)
+    tree_alias, _ = sitetree.init_tree('mytree', context)
+
+    current_item = sitetree.get_tree_current_item(tree_alias)
+    assert current_item.title == 'Australia'
+    assert current_item.is_current
+
+    # Arguments mismatch.
+    context = template_context(context_dict={'australia_var': 'y'}, request=request_get('/contacts/australia/x/'))
+    context['request'].resolver_match = request.resolver_match
+    tree_alias, _ = sitetree.init_tree('mytree', context)
+    assert sitetree.get_tree_current_item(tree_alias) is None
+
+
+def test_current_item_prefix_match(monkeypatch, template_context, build_tree, common_tree):
+
+    from sitetree import sitetreeapp
+    from sitetree.sitetreeapp import get_sitetree
+
+    sitetree = get_sitetree()
+
+    def get_current(url):
+        tree_alias, _ = sitetree.init_tree('mytree', template_context(request=url))
+        return sitetree.get_tree_current_item(tree_alias)
+
+    assert get_current('/contacts/russia/web/public/page/2/') is None
+
+    monkeypatch.setattr(sitetreeapp, 'CURRENT_ITEM_PREFIX_MATCH', True)
+
+    assert get_current('/contacts/russia/web/public/page/2/').url == '/contacts/russia/web/public/'
+    assert get_current('/contacts/russia/web').url == '/contacts/russia/web/'
+    assert get_current('/contacts/russia/other/').url == '/contacts/russia/'
+    # Site root is not a prefix.
+    assert get_current('/unknown/') is None
+
+    # Items with URL patterns having no arguments.
+    build_tree({'alias': 'patterntree'}, [{'title': 'Raiser', 'urlaspattern': True, 'url': 'raiser'}])
+    tree_alias, _ = sitetree.init_tree('patterntree', template_context(request='/raiser/page/2/'))
+    assert sitetree.get_tree_current_item(tree_alias).title == 'Raiser'
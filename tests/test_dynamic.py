@@ -114,3 +114,154 @@ def test_dynamic_attach_from_module(template_render_tag, template_context, templ
 
     from sitetree.sitetreeapp import _DYNAMIC_TREES
     _DYNAMIC_TREES.clear()
+
+
+provider_calls = []
+
+
+def provide_items():
+    from sitetree.toolbox import item
+
+    provider_calls.append(1)
+    return [
+        item(f'provided_{len(provider_calls)}', '/provided_url', url_as_pattern=False, children=[
+            item('provided_child', '/provided_child_url', url_as_pattern=False),
+        ]),
+    ]
+
+
+def test_dynamic_provider(
+    monkeypatch, template_render_tag, template_context, template_strip_tags, db_queries, common_tree
+):
+    from time import monotonic
+
+    from sitetree.sitetreeapp import _DYNAMIC_PROVIDERS, cache, get_sitetree
+    from sitetree.toolbox import register_dynamic_provider
+
+    provider_calls.clear()
+    provider = register_dynamic_provider(provide_items, 'mytree', 'ruweb', timeout=60)
+    provider.invalidate()
+
+    def render():
+        return template_strip_tags(template_render_tag(
+            'sitetree', 'sitetree_tree from "mytree"', template_context(request='/provided_child_url')))
+
+    result = render()
+    assert 'Web|provided_1|provided_child' in result
+    assert 'Public' in result
+    assert len(provider_calls) == 1
+
+    # Provided items are cached.
+    assert render() == result
+    assert len(provider_calls) == 1
+
+    # Static tree is not rebuilt on invalidation.
+    provider.invalidate()
+    with db_queries.scope(expect=0):
+        result = render()
+    assert 'Web|provided_2|provided_child' in result
+    assert 'provided_1' not in result
+    assert len(provider_calls) == 2
+
+    current_item = get_sitetree().get_tree_current_item('mytree')
+    assert current_item.title == 'provided_child'
+    assert current_item.parent.title == 'provided_2'
+    assert current_item.depth == current_item.parent.depth + 1
+
+    # Stamps are read once per request.
+    gets = []
+    cache_get = cache.get
+    monkeypatch.setattr(cache, 'get', lambda key, default=None: gets.append(key) or cache_get(key, default))
+    render()
+    assert gets == [provider.cache_key]
+    monkeypatch.undo()
+
+    # URLs trie is rebuilt on reindex.
+    sitetree = get_sitetree()
+    assert get_trie_titles(sitetree) == ['provided_2']
+    provider.invalidate()
+    sitetree.init_context(template_context(request='/'))
+    sitetree.get_sitetree('mytree')
+    assert get_trie_titles(sitetree) == ['provided_3']
+
+    # Provided items are considered unchanged while cache is unavailable.
+    render()
+    calls_count = len(provider_calls)
+    monkeypatch.setattr(cache, 'failures', cache.threshold)
+    monkeypatch.setattr(cache, 'opened_at', monotonic())
+    assert 'provided_3' in render()
+    assert 'provided_3' in render()
+    assert len(provider_calls) == calls_count
+    monkeypatch.undo()
+
+    provider.invalidate()
+    _DYNAMIC_PROVIDERS.clear()
+
+
+def test_dynamic_provider_async(common_tree):
+    from threading import get_ident
+
+    from asgiref.sync import async_to_sync
+
+    from sitetree.sitetreeapp import _DYNAMIC_PROVIDERS, get_sitetree
+    from sitetree.toolbox import register_dynamic_provider
+
+    threads = []
+
+    def provide():
+        threads.append(get_ident())
+        return provide_items()
+
+    provider = register_dynamic_provider(provide, 'mytree', 'ruweb', timeout=60)
+    provider.invalidate()
+
+    try:
+        # Provider is not called in event loop thread.
+        _, items = async_to_sync(get_sitetree().aget_sitetree)('mytree')
+        assert 'provided_child' in [item.title for item in items]
+        assert threads == [get_ident()]
+
+    finally:
+        provider.invalidate()
+        _DYNAMIC_PROVIDERS.clear()
+
+
+def get_trie_titles(sitetree):
+    return [item.title for item in sitetree.get_urls_trie('mytree')['provided_url'][None]]
+
+
+def test_dynamic_ids(common_tree):
+
+    from sitetree.sitetreeapp import _DYNAMIC_TREES, get_sitetree
+    from sitetree.toolbox import compose_dynamic_tree, item, register_dynamic_trees, tree
+
+    def get_tree():
+        return tree('dynamic', items=[
+            item('dynamic_1', '/dynamic_1_url', url_as_pattern=False, children=[
+                item('dynamic_1_1', '/dynamic_1_1_url', url_as_pattern=False),
+            ]),
+            item('dynamic_2', '/dynamic_2_url', url_as_pattern=False),
+        ])
+
+    register_dynamic_trees(
+        compose_dynamic_tree([get_tree()], target_tree_alias='mytree', parent_tree_item_alias='ruweb'),
+        compose_dynamic_tree([get_tree()], target_tree_alias='mytree', parent_tree_item_alias='ruweb'),
+        reset_cache=True
+    )
+
+    sitetree = get_sitetree()
+
+    def get_ids():
+        sitetree.cache.empty()
+        _, items = sitetree.get_sitetree('mytree')
+        return {item.id: item for item in items if getattr(item, 'is_dynamic', False)}
+
+    ids = get_ids()
+    assert len(ids) == 6
+    assert all(item_id < 0 for item_id in ids)
+    assert [item.title for item in ids.values()] == ['dynamic_1', 'dynamic_1_1', 'dynamic_2'] * 2
+
+    # The same for a rebuilt tree.
+    assert list(get_ids()) == list(ids)
+
+    _DYNAMIC_TREES.clear()
@@ -77,3 +77,126 @@ def test_sitetree_resync_apps(capsys, command_run):
 
     assert 'Sitetrees found in' in out
     assert len(TreeItem.objects.all()) == 2
+
+
+def test_sitetree_resync_apps_permissions(monkeypatch, command_run):
+    from django.contrib.auth.models import Permission
+
+    from sitetree.models import TreeItem
+    from sitetree.toolbox import item, tree
+    from tests.testapp import sitetrees
+
+    permission = Permission.objects.get(codename='change_user', content_type__app_label='auth')
+
+    monkeypatch.setattr(sitetrees, 'sitetrees', [
+        tree('permstree', items=[
+            item('Restricted', '/restricted/', url_as_pattern=False, access_by_perms=[
+                'auth.add_user', permission.id, permission]),
+        ]),
+    ])
+
+    command_run('sitetree_resync_apps', ['tests.testapp'])
+
+    restricted = TreeItem.objects.get(title='Restricted')
+    assert restricted.access_restricted
+    assert {
+        f'{perm.content_type.app_label}.{perm.codename}' for perm in restricted.access_permissions.all()
+    } == {'auth.add_user', 'auth.change_user'}
+
+
+def test_sitetree_snapshot(tmp_path, capsys, monkeypatch, common_tree, command_run, db_queries,
+                           template_render_tag, template_context, template_strip_tags):
+    from threading import Thread
+
+    from sitetree import sitetreeapp
+    from sitetree.snapshot import get_snapshot_entries, read_snapshot
+
+    with pytest.raises(CommandError):
+        command_run('sitetree_snapshot')
+
+    path = f"{tmp_path / 'sitetrees.snapshot'}"
+    command_run('sitetree_snapshot', options={'output': path})
+
+    out, _ = capsys.readouterr()
+    assert '`mytree`: ' in out
+    assert '`dynamic3`: 1 item(s)' in out
+    assert read_snapshot(path).version in out
+
+    def render():
+        return template_strip_tags(template_render_tag(
+            'sitetree', 'sitetree_breadcrumbs from "mytree"', template_context(request='/contacts/russia/web/public/')))
+
+    expected = render()
+
+    monkeypatch.setattr(sitetreeapp, 'SNAPSHOT_PATH', path)
+    monkeypatch.setattr(sitetreeapp.SiteTree, 'cache_cls', sitetreeapp.SnapshotCache)
+
+    with db_queries.scope(expect=0):
+        assert render() == expected
+        result = template_strip_tags(template_render_tag(
+            'sitetree', 'sitetree_tree from "dynamic3"', template_context(request='/')))
+
+    assert 'dynamic3_1' in result
+
+    # Trees are decoded on demand.
+    entries = get_snapshot_entries(path)
+    assert set(entries['sitetrees']) == {'mytree', 'dynamic3'}
+    assert entries['tree_aliases'] == {'dynamic3': 1, 'dynamic4': 1, 'mytree': 1}
+
+    # Decoded records are shared by threads, items are not.
+    snapshot = read_snapshot(path)
+    items = snapshot.get_tree_items('mytree')
+    items_thread = []
+    thread = Thread(target=lambda: items_thread.extend(snapshot.get_tree_items('mytree')))
+    thread.start()
+    thread.join()
+
+    assert items_thread[0] is not items[0]
+    assert items_thread[0].title is items[0].title
+    assert set(snapshot.records) == {'mytree', 'dynamic3'}
+
+    sitetreeapp._DYNAMIC_TREES.clear()
+
+
+def test_sitetree_warm(capsys, build_tree, command_run):
+    import sitetree
+    from sitetree.toolbox import register_i18n_trees
+
+    build_tree({'alias': 'i18tree'}, [{'title': 'My title', 'url': '/url_default/'}])
+    build_tree({'alias': 'i18tree_ru'}, [{'title': 'Заголовок', 'url': '/url_ru/'}])
+    build_tree({'alias': 'other'}, [{'title': 'Other', 'url': '/other/'}])
+
+    command_run('sitetree_warm')
+    out, _ = capsys.readouterr()
+    assert 'Trees loaded: 3.' in out
+
+    register_i18n_trees(['i18tree'])
+
+    try:
+        assert sitetree.warm(['i18tree', 'other'], ['en', 'ru', 'de']) == ['i18tree', 'other', 'i18tree_ru']
+
+        command_run('sitetree_warm', ['i18tree'], {'languages': ['ru'], 'workers': 1})
+        out, _ = capsys.readouterr()
+        assert '`i18tree_ru` is loaded' in out
+        assert 'Trees loaded: 1.' in out
+
+    finally:
+        register_i18n_trees([])
+
+
+def test_sitetree_warm_urlconf(capsys, settings, monkeypatch, command_run):
+    import sys
+
+    from sitetree import sitetreeapp
+
+    # Dynamic tree is registered on URLconf import.
+    monkeypatch.delitem(sys.modules, 'tests.testapp.urls_dynamic', raising=False)
+    settings.ROOT_URLCONF = 'tests.testapp.urls_dynamic'
+
+    try:
+        command_run('sitetree_warm', options={'workers': 1})
+        out, _ = capsys.readouterr()
+        assert '`urlconftree` is loaded' in out
+
+    finally:
+        sitetreeapp._DYNAMIC_TREES.clear()
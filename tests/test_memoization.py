@@ -0,0 +1,30 @@
+from sitetree.settings import ALIAS_TRUNK
+
+
+def test_request_memoization(monkeypatch, template_render_tag, template_context, common_tree):
+
+    from sitetree.sitetreeapp import SiteTree
+
+    checked = []
+    check_access = SiteTree.check_access
+
+    def check_access_counted(self, item, context):
+        checked.append(item)
+        return check_access(self, item, context)
+
+    monkeypatch.setattr(SiteTree, 'check_access', check_access_counted)
+
+    context = template_context(request='/contacts/russia/web/')
+    menu = template_render_tag('sitetree', f'sitetree_menu from "mytree" include "{ALIAS_TRUNK}"', context)
+    checked_count = len(checked)
+    checked.clear()
+
+    # Postal is shown in a menu but not in a sitetree.
+    tree = template_render_tag('sitetree', 'sitetree_tree from "mytree"', context)
+    assert 'Postal' not in tree
+
+    checked.clear()
+    assert template_render_tag('sitetree', f'sitetree_menu from "mytree" include "{ALIAS_TRUNK}"', context) == menu
+    assert 'Postal' in menu
+    assert checked_count
+    assert not checked
@@ -0,0 +1,51 @@
+from django.contrib.auth.models import AnonymousUser
+
+from sitetree.middleware import RequestNavigation, SitetreeMiddleware
+from sitetree.sitetreeapp import get_sitetree
+
+
+def test_navigation(request_get, template_render_tag, template_context, common_tree):
+
+    request = request_get('/contacts/russia/web/private/', user=AnonymousUser())
+
+    def get_response(request):
+        return request.sitetree
+
+    navigation = SitetreeMiddleware(get_response)(request)
+    assert isinstance(navigation, RequestNavigation)
+
+    tree = navigation['mytree']
+    assert tree is navigation['mytree']
+
+    assert tree.current_item.title == 'Private'
+    assert tree.title == 'Private'
+    assert [item.title for item in tree.ancestors] == ['Home', 'Contacts', 'Russia', 'Web']
+    assert [item.title for item in tree.breadcrumbs] == ['Home', 'Russia', 'Web', 'Private']
+
+    # Template tags reuse handler state for the same request.
+    context = template_context({'subtitle': 'sub'})
+    context['request'] = request
+    result = template_render_tag('sitetree', 'sitetree_menu from "mytree" include "ruweb"', context)
+    assert 'Public sub' in result
+    assert 'current_item current_branch">Private' in result
+
+    # Navigation memoized for the request is kept when page context is bound.
+    memoized = get_sitetree()._results[('breadcrumbs', 'mytree')]
+    result = template_render_tag('sitetree', 'sitetree_breadcrumbs from "mytree"', context)
+    assert 'Private' in result
+    assert get_sitetree()._results[('breadcrumbs', 'mytree')] is memoized
+
+    navigation = RequestNavigation(request_get('/unknown/', user=AnonymousUser()))
+    assert navigation['mytree'].current_item is None
+    assert navigation['mytree'].title == ''
+    assert navigation['mytree'].ancestors == []
+    assert navigation['notree'].current_item is None
+
+
+def test_navigation_alias_literal(request_get, build_tree):
+    # Alias matching a context variable name.
+    build_tree({'alias': 'request'}, [{'title': 'Requested', 'url': '/requested/'}])
+
+    navigation = RequestNavigation(request_get('/requested/', user=AnonymousUser()))
+    assert navigation['request'].title == 'Requested'
+    assert [item.title for item in navigation['request'].breadcrumbs] == ['Requested']
@@ -90,3 +90,54 @@ def test_urlquote(request_client, build_tree, template_render_tag, template_stri
         template_render_tag('sitetree', 'sitetree_breadcrumbs from "bogustree"', context))
 
     assert name in breadcrumbs
+
+
+def test_async(monkeypatch, build_tree, user_create, template_context):
+    from contextvars import Context
+
+    from asgiref.sync import async_to_sync
+
+    from sitetree.sitetreeapp import CacheBreaker, aget_sitetree, get_sitetree
+
+    build_tree(
+        {'alias': 'async_tree'},
+        [
+            {'title': 'Home', 'url': '/', 'children': [
+                {'title': 'About', 'url': '/about/'},
+                {'title': 'Private', 'url': '/private/', 'access_restricted': True,
+                 'access_permissions': ['add_tree']},
+            ]},
+        ],
+    )
+
+    # Handlers are bound to contexts.
+    assert Context().run(get_sitetree) is not get_sitetree()
+
+    sitetree = Context().run(get_sitetree)
+    context = template_context(user=user_create(superuser=True), request='/about/')
+
+    # No blocking DB calls are allowed in async code, so those would fail.
+    menu = async_to_sync(sitetree.amenu)('async_tree', f'"{ALIAS_TRUNK}"', context)
+    assert [item.title for item in menu] == ['Home']
+
+    breadcrumbs = async_to_sync(sitetree.abreadcrumbs)('async_tree', context)
+    assert [item.title for item in breadcrumbs] == ['Home', 'About']
+
+    # No blocking cache calls are made by a new handler.
+    calls = []
+    monkeypatch.setattr(CacheBreaker, 'call', lambda self, method, *args, **kwargs: calls.append(method))
+
+    async def get_menu():
+        sitetree = await aget_sitetree()
+        return await sitetree.amenu('async_tree', f'"{ALIAS_TRUNK}"', context)
+
+    menu = Context().run(async_to_sync(get_menu))
+    assert [item.title for item in menu] == ['Home']
+    assert not calls
+    monkeypatch.undo()
+
+    # Restricted items are hidden for users without permissions.
+    sitetree = Context().run(get_sitetree)
+    context = template_context(user=user_create(), request='/')
+    tree_alias, items = async_to_sync(sitetree.ainit_tree)('async_tree', context)
+    assert [item.title for item in items if sitetree.check_access(item, context)] == ['Home', 'About']
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sitetree.sitemaps import SitetreeSitemap, get_sitemap_urls
+
+
+def test_sitemap(monkeypatch, common_tree):
+    from django.contrib.sitemaps import Sitemap
+
+    from sitetree.sitetreeapp import Cache
+
+    urls = list(get_sitemap_urls('mytree'))
+    assert urls[:4] == ['/home/', '/users/', '/users/moderators/', '/users/ordinary/']
+    assert len(urls) == len(set(urls))
+    assert list(get_sitemap_urls('notree')) == []
+
+    # Unknown trees are not cached.
+    assert Cache().get_entry('sitetrees', 'notree') is False
+
+    class MySitemap(SitetreeSitemap):
+        tree_alias = 'mytree'
+
+    for sitemap in (SitetreeSitemap('mytree'), MySitemap()):
+        items = sitemap.items()
+        assert list(items) == urls
+        assert len(items) == len(urls)
+        assert items[1] == urls[1]
+        assert items[-1] == urls[-1]
+        assert items[2:4] == urls[2:4]
+        assert items[-2:] == urls[-2:]
+
+        with pytest.raises(IndexError):
+            items[len(urls)]
+
+        entries = sitemap.get_urls(site=SimpleNamespace(domain='example.com'), protocol='https')
+        assert entries[0]['location'] == 'https://example.com/home/'
+        assert len(entries) == len(urls)
+
+    # Paginator gets only URLs of a page.
+    monkeypatch.setattr(Sitemap, 'limit', 5)
+    sitemap = SitetreeSitemap('mytree')
+    assert sitemap.paginator.num_pages == (len(urls) + 4) // 5
+    assert list(sitemap.paginator.page(2).object_list) == urls[5:10]
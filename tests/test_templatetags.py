@@ -152,6 +152,11 @@ def test_title_vars(template_render_tag, template_context, common_tree, request_
     result = template_render_tag('sitetree', 'sitetree_tree from "mytree"', context)
     assert 'Public title_from_var' in result
 
+    # Variables are escaped once.
+    context = template_context({'subtitle': 'A & B'})
+    result = template_render_tag('sitetree', 'sitetree_tree from "mytree"', context)
+    assert '>Public A &amp; B<' in result
+
 
 def test_tpl_render(request_client, common_tree):
     client = request_client()
@@ -373,3 +378,206 @@ def test_sitetree_menu(template_render_tag, template_context, common_tree):
 
     assert '"/home/"' not in result
     assert '"/contacts/russia/web/public/"' in result
+
+
+def test_template_memoized(template_context, common_tree):
+    from django.template import Template
+
+    tpl = Template('{% load sitetree %}{% sitetree_tree from "mytree" template "sitetree/tree.html" %}')
+    node = tpl.nodelist[-1]
+
+    context = template_context()
+    result = tpl.render(context)
+
+    assert '"/users/moderators/"' in result
+    assert node._template is not None
+    assert 'sitetree_items' not in context
+
+    template_obj = node._template
+    tpl.render(context)
+    assert node._template is template_obj
+
+    # Variable template names are not memoized.
+    tpl = Template('{% load sitetree %}{% sitetree_tree from "mytree" template tpl_name %}')
+    node = tpl.nodelist[-1]
+    result = tpl.render(template_context({'tpl_name': 'sitetree/menu.html'}))
+
+    assert '"/users/moderators/"' in result
+    assert node._template is None
+
+
+def test_depth(template_render_tag, template_context, template_strip_tags, common_tree):
+
+    context = template_context(request='/articles/cats/')
+
+    result = template_render_tag('sitetree', f'sitetree_menu from "mytree" include "{ALIAS_TRUNK}" depth 2', context)
+    assert template_strip_tags(result) == 'Home|Users|Articles|Contacts'
+    assert 'class="current_branch">Articles' in result
+
+    result = template_render_tag('sitetree', f'sitetree_menu from "mytree" include "{ALIAS_TRUNK}" depth 1', context)
+    assert template_strip_tags(result) == 'Home'
+
+    result = template_render_tag(
+        'sitetree', 'sitetree_tree from "mytree" template "sitetree/tree.html" depth 3', context)
+    assert template_strip_tags(result) == (
+        'Home|Users|Moderators|Ordinary|Articles|About cats|About dogs|About mice|Contacts|Russia|Australia|China')
+
+    # Prepared children are dropped after rendering.
+    result = template_strip_tags(template_render_tag('sitetree', 'sitetree_tree from "mytree"', context))
+    assert 'About cats|Good|Bad|Ugly' in result
+
+    # Invalid depth in a variable means no depth limit.
+    for depth in ('undefined', 'bogus'):
+        context = template_context(context_dict={'bogus': 'x'}, request='/articles/cats/')
+        result = template_render_tag('sitetree', f'sitetree_tree from "mytree" depth {depth}', context)
+        result = template_strip_tags(result)
+        assert 'About cats|Good|Bad|Ugly' in result
+
+    with pytest.raises(TemplateSyntaxError):
+        template_render_tag('sitetree', 'sitetree_tree from "mytree" depth "x"', context)
+
+
+def test_literal_arguments(template_render_tag, template_context, common_tree):
+    from django.template import Template
+
+    from sitetree.sitetreeapp import BranchesSelector, Literal
+
+    tpl = Template(
+        '{% load sitetree %}'
+        '{% sitetree_menu from "mytree" include "trunk, this-children,10 ,footer" template "sitetree/menu.html" %}'
+    )
+    node = tpl.nodelist[-1]
+
+    assert isinstance(node.tree_alias, Literal)
+    assert node.tree_alias.value == 'mytree'
+    assert isinstance(node.use_template, Literal)
+
+    selector = node.tree_branches.value
+    assert isinstance(selector, BranchesSelector)
+    assert selector.trunk
+    assert selector.ids == [10]
+    assert selector.aliases == ['footer']
+    assert selector.reserved == [ALIAS_THIS_CHILDREN]
+
+    tpl = Template('{% load sitetree %}{% sitetree_menu from tree_var include branches_var %}')
+    node = tpl.nodelist[-1]
+
+    assert not isinstance(node.tree_alias, Literal)
+    assert not isinstance(node.tree_branches, Literal)
+
+    result = tpl.render(template_context({'tree_var': 'mytree', 'branches_var': 'ruweb'}, request='/'))
+    assert '"/contacts/russia/web/public/"' in result
+
+
+def test_menu_branches_lookup(monkeypatch, template_render_tag, template_context, template_strip_tags, common_tree):
+    from sitetree.sitetreeapp import SiteTree
+
+    checked = []
+    check_access = SiteTree.check_access
+
+    def check_access_counted(self, item, context):
+        checked.append(item.title)
+        return check_access(self, item, context)
+
+    monkeypatch.setattr(SiteTree, 'check_access', check_access_counted)
+
+    context = template_context(request='/')
+    result = template_render_tag(
+        'sitetree', f'sitetree_menu from "mytree" include "ruweb,{ALIAS_TRUNK},ruweb" depth 1', context)
+
+    # Access is checked only for children of the selected parents (and theirs for `has_children`).
+    assert checked[:4] == ['Home', 'Public {{ subtitle }}', 'my model {{ model }}', 'Private']
+    assert 'About cats' not in checked
+    # Tree order is preserved.
+    assert template_strip_tags(result) == 'Home|Public|my model|Private'
+
+
+def test_jinja(request_get, template_strip_tags, common_tree):
+    pytest.importorskip('jinja2')
+
+    from django.contrib.auth.models import AnonymousUser
+    from jinja2 import ChoiceLoader, DictLoader, Environment, PackageLoader
+
+    from sitetree.jinja import SitetreeExtension
+
+    env = Environment(
+        loader=ChoiceLoader([
+            DictLoader({
+                'page.html':
+                    "{{ sitetree_menu('mytree', 'trunk,ruweb') }}"
+                    "|{{ sitetree_breadcrumbs('mytree') }}"
+                    "|{{ sitetree_tree('mytree') }}"
+                    "|{{ sitetree_page_title('mytree') }}",
+            }),
+            PackageLoader('sitetree', 'jinja2'),
+        ]),
+        autoescape=True,
+        extensions=[SitetreeExtension],
+    )
+
+    request = request_get('/contacts/russia/web/public/')
+    request.user = AnonymousUser()
+
+    result = env.get_template('page.html').render(request=request, subtitle='sub')
+    menu, breadcrumbs, tree, title = result.split('|')
+
+    assert 'href="/home/"' in menu
+    assert 'class="current_item current_branch">Public sub<' in menu
+    assert 'class="current_branch"' in menu
+    assert template_strip_tags(breadcrumbs) == 'Home|&gt;|Russia|&gt;|Web|&gt;|Public sub'
+    assert 'Moderators' in tree
+    assert 'Hidden' not in tree
+    assert title == 'Public sub'
+
+    # Resolved titles are not escaped twice.
+    request = request_get('/contacts/russia/web/public/')
+    request.user = AnonymousUser()
+
+    result = env.get_template('page.html').render(request=request, subtitle='A & B')
+    menu, breadcrumbs, tree, title = result.split('|')
+
+    assert '>Public A &amp; B<' in menu
+    assert template_strip_tags(breadcrumbs).endswith('|Public A &amp; B')
+    assert title == 'Public A &amp; B'
+
+
+def test_native_renderers(monkeypatch, template_render_tag, template_context, user_create, common_tree):
+    from django.contrib.auth.models import AnonymousUser
+
+    from sitetree import sitetreeapp
+    from sitetree.renderers import RENDERERS, get_renderer
+
+    tags = []
+
+    for template_name in RENDERERS:
+        if 'breadcrumbs' in template_name:
+            tags.append(f'sitetree_breadcrumbs from "mytree" template "{template_name}"')
+
+        elif 'tree' in template_name:
+            tags.append(f'sitetree_tree from "mytree" template "{template_name}"')
+
+        elif 'dropdown' not in template_name:
+            tags.append(f'sitetree_menu from "mytree" include "trunk,ruweb" template "{template_name}"')
+
+    def render_all(native):
+        monkeypatch.setattr(sitetreeapp, 'NATIVE_RENDERERS', native)
+
+        return [
+            template_render_tag('sitetree', tag, template_context(
+                context_dict={'subtitle': '<sub>', 'extra_class_ul': 'extra'}, request=url, user=user))
+            for user in (AnonymousUser(), user_create())
+            for url in ('/', '/home/', '/contacts/russia/web/public/', '/articles/cats/good/')
+            for tag in tags
+        ]
+
+    assert render_all(native=True) == render_all(native=False)
+
+    # Overridden templates are rendered by the engine.
+    class Origin:
+        name = '/project/templates/sitetree/menu.html'
+        template_name = 'sitetree/menu.html'
+
+    class Template:
+        origin = Origin()
+
+    assert get_renderer(Template()) is None
@@ -0,0 +1,25 @@
+def test_url_compiled(template_render_tag, template_context, common_tree):
+
+    from django.urls import clear_url_caches
+
+    from sitetree.sitetreeapp import SiteTree, _reverse_url_cached, reverse_url
+
+    view_path, arguments = SiteTree.compile_url(common_tree['contacts_australia australia_var'])
+    assert view_path == 'contacts_australia'
+    assert [argument.var for argument in arguments] == ['australia_var']
+
+    _reverse_url_cached.cache_clear()
+
+    assert reverse_url('contacts_australia', ['one'], '') == '/contacts/australia/one/'
+    assert reverse_url('contacts_australia', ['one'], '') == '/contacts/australia/one/'
+    assert reverse_url('contacts_australia', [], '') is None
+    assert _reverse_url_cached.cache_info().hits == 1
+
+    # Not cached for complex arguments.
+    assert reverse_url('contacts_australia', [['one']], '') == "/contacts/australia/%5B'one'%5D/"
+    assert _reverse_url_cached.cache_info().currsize == 2
+
+    # Not reused after URL caches are cleared (e.g. on URLconf reload).
+    clear_url_caches()
+    assert reverse_url('contacts_australia', ['one'], '') == '/contacts/australia/one/'
+    assert _reverse_url_cached.cache_info().hits == 1
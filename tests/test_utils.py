@@ -32,6 +32,46 @@ def test_import_app_sitetree_module():
         import_app_sitetree_module('sitetre')
 
 
+def test_import_app_sitetree_file(tmp_path, monkeypatch):
+
+    from sitetree.utils import import_app_sitetree_module, load_sitetree_file
+
+    package = tmp_path / 'filetreesapp'
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    (package / 'sitetrees.json').write_text(
+        '[{"alias": "filetree", "items": ['
+        '{"title": "Home", "url": "/", "url_as_pattern": false, "alias": "home", "children": ['
+        '{"title": "About", "url": "/about/", "url_as_pattern": false}]}]}]')
+
+    monkeypatch.syspath_prepend(f'{tmp_path}')
+
+    module = import_app_sitetree_module('filetreesapp')
+    assert module.__package__ == 'filetreesapp'
+
+    tree = module.sitetrees[0]
+    assert tree.alias == 'filetree'
+    assert [item.title for item in tree.dynamic_items] == ['Home', 'About']
+    assert tree.dynamic_items[1].parent is tree.dynamic_items[0]
+    assert tree.dynamic_items[0].alias == 'home'
+
+    path = tmp_path / 'sitetrees.toml'
+    path.write_text(
+        '[[sitetrees]]\nalias = "filetree"\n\n'
+        '[[sitetrees.items]]\ntitle = "Home"\nurl = "/"\n\n'
+        '[[sitetrees.items.children]]\ntitle = "About"\nurl = "about"\n')
+
+    tree = load_sitetree_file(path)[0]
+    assert [item.title for item in tree.dynamic_items] == ['Home', 'About']
+    assert tree.dynamic_items[1].urlaspattern
+
+    path = tmp_path / 'sitetrees.yml'
+    path.write_text('')
+
+    with pytest.raises(ImproperlyConfigured):
+        load_sitetree_file(path)
+
+
 def test_import_project_sitetree_modules():
 
     from sitetree import settings
@@ -87,15 +127,15 @@ class TestPermissions:
         perm, perm_name = get_permission_and_name()
 
         i1 = item('root', 'url', access_by_perms=perm_name)
-        assert i1.permissions == [perm]
+        assert i1.permissions == [perm_name]
 
     def test_perm_obj_permissions(self):
         from sitetree.toolbox import item
 
-        perm, __ = get_permission_and_name()
+        perm, perm_name = get_permission_and_name()
 
         i1 = item('root', 'url', access_by_perms=perm)
-        assert i1.permissions == [perm]
+        assert i1.permissions == [perm_name]
 
     def test_bad_string_permissions(self, template_context, template_render_tag):
         from sitetree.toolbox import compose_dynamic_tree, item, register_dynamic_trees, tree
@@ -143,3 +183,43 @@ class TestPermissions:
         # True is respected
         i1 = item('root', 'url')
         assert not i1.access_restricted
+
+    def test_resolve_permissions(self, db_queries):
+        import pickle
+
+        from sitetree.toolbox import item
+        from sitetree.utils import resolve_permissions
+
+        perm, perm_name = get_permission_and_name()
+
+        i1 = item('root', 'url', access_by_perms=[perm.id, perm_name])
+        i1 = pickle.loads(pickle.dumps(i1))
+
+        with db_queries.scope(expect=1):
+            assert resolve_permissions(i1.permissions) == {perm.id: perm_name, perm_name: perm_name}
+
+        with pytest.raises(ValueError, match='does not exist'):
+            resolve_permissions([perm_name, -1])
+
+    def test_get_permissions_ids(self, db_queries):
+        from sitetree.utils import clean_permissions, get_permissions_ids
+
+        perm, perm_name = get_permission_and_name()
+
+        with db_queries.scope(expect=1):
+            assert get_permissions_ids([perm_name, perm.id, perm]) == [perm.id] * 3
+
+        with pytest.raises(ValueError, match='does not exist'):
+            get_permissions_ids([perm_name, -1])
+
+        with pytest.warns(DeprecationWarning, match='is deprecated'):
+            assert clean_permissions(perm_name) == [perm]
+
+
+def test_generate_dynamic_id():
+    from sitetree.utils import generate_dynamic_id
+
+    ids = {generate_dynamic_id('mytree', 'parent', idx) for idx in range(1000)}
+    assert len(ids) == 1000
+    assert all(-(2 ** 53 - 1) <= item_id < 0 for item_id in ids)
+    assert generate_dynamic_id('mytree', 1) == generate_dynamic_id('mytree', 1)
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+
+from sitetree.views import navigation, sitemap
+
+
+def test_navigation(monkeypatch, request_get, user_create, common_tree):
+    from sitetree.sitetreeapp import Cache
+
+    def get(*, user=None, etag=None, **params):
+        request = request_get('/navigation/', user=user or AnonymousUser(), data=params)
+
+        if etag:
+            request.META['HTTP_IF_NONE_MATCH'] = etag
+
+        return navigation(request, 'mytree')
+
+    response = get(type='menu', branches='trunk', url='/contacts/russia/web/private/')
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/json'
+    assert 'Cookie' in response['Vary']
+    assert 'Accept-Language' in response['Vary']
+
+    etag = response['ETag']
+    assert etag.startswith('"')
+
+    items = json.loads(response.content)['items']
+    assert [item['title'] for item in items] == ['Home']
+
+    home = items[0]
+    assert home['url'] == '/home/'
+    assert isinstance(home['id'], str)
+    assert home['in_current_branch']
+    assert [item['title'] for item in home['children']] == ['Users', 'Articles', 'Contacts']
+
+    contacts = home['children'][2]
+    russia = contacts['children'][0]
+    assert russia['hint'] == 'The place'
+
+    private = russia['children'][0]['children'][2]
+    assert private['title'] == 'Private'
+    assert private['is_current']
+
+    # Not modified.
+    response = get(etag=etag, type='menu', branches='trunk', url='/contacts/russia/web/private/')
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+    # Different page.
+    response = get(etag=etag, type='menu', branches='trunk', url='/articles/')
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+    # Different access.
+    response = get(etag=etag, user=user_create(), type='menu', branches='trunk', url='/contacts/russia/web/private/')
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+    response = get(type='breadcrumbs', url='/contacts/russia/web/private/')
+    items = json.loads(response.content)['items']
+    assert [item['title'] for item in items] == ['Home', 'Russia', 'Web', 'Private']
+    assert all(not item['children'] for item in items)
+
+    response = get(type='tree')
+    items = json.loads(response.content)['items']
+    assert 'Postal' not in response.content.decode()
+    assert len(items[0]['children']) == 3
+
+    # Tree rebuilt.
+    common_tree['/home/'].save()
+    assert get(etag=etag, type='menu', branches='trunk', url='/contacts/russia/web/private/').status_code == 200
+
+    assert get(type='unknown').status_code == 400
+
+    # Unknown trees are not cached.
+    cache_save = []
+    monkeypatch.setattr(Cache, 'save', lambda self: cache_save.append(1))
+
+    for alias in ('notree', 'notree'):
+        with pytest.raises(Http404):
+            navigation(request_get('/navigation/', user=AnonymousUser()), alias)
+
+    assert Cache().get_entry('sitetrees', 'notree') is False
+    assert not cache_save
+
+
+def test_navigation_stream(monkeypatch, request_get, common_tree):
+    from sitetree import views
+
+    monkeypatch.setattr(views, 'NAVIGATION_STREAM_THRESHOLD', 1)
+
+    response = navigation(request_get('/navigation/', user=AnonymousUser()), 'mytree')
+    assert response.streaming
+
+    items = json.loads(b''.join(response.streaming_content))['items']
+    assert items[0]['title'] == 'Home'
+
+
+def test_sitemap(monkeypatch, request_get, user_create, common_tree):
+    from sitetree import sitemaps
+
+    def get(**params):
+        response = sitemap(request_get('/sitemap.xml', user=user_create(), data=params), 'mytree')
+        assert response.streaming
+        assert response['Content-Type'] == 'application/xml'
+        return b''.join(response.streaming_content).decode()
+
+    content = get()
+    assert content.startswith('<?xml')
+    assert '<urlset' in content
+    assert '<url><loc>http://testserver/home/</loc></url>' in content
+    assert '/contacts/australia/darwin/' in content  # Guest access.
+    assert '/contacts/australia/alice/' not in content  # Logged in access.
+    assert '/users/hidden/' not in content
+    assert '/contacts/russia/postal/' not in content  # Not in site tree.
+    assert content.count('<url>') == 19
+
+    monkeypatch.setattr(sitemaps, 'SITEMAP_LIMIT', 6)
+
+    content = get()
+    assert '<sitemapindex' in content
+    assert content.count('<sitemap>') == 4
+    assert '<loc>http://testserver/sitemap.xml?p=4</loc>' in content
+
+    content = get(p=4)
+    assert '<urlset' in content
+    assert content.count('<url>') == 1
+
+    for page in ('5', '0', 'x'):
+        with pytest.raises(Http404):
+            get(p=page)
+
+    with pytest.raises(Http404):
+        sitemap(request_get('/sitemap.xml'), 'notree')
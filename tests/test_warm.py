@@ -0,0 +1,54 @@
+import pytest
+
+
+def test_warm(monkeypatch, common_tree):
+    import gc
+
+    from django.apps import apps
+    from django.db import DatabaseError
+
+    from sitetree import middleware, sitetreeapp
+    from sitetree.middleware import SitetreeMiddleware
+    from sitetree.sitetreeapp import Cache, compile_title, get_tree_aliases, warm
+
+    # Dynamic trees registered by other tests are not taken into account.
+    monkeypatch.setattr(sitetreeapp, '_DYNAMIC_TREES', {})
+
+    assert get_tree_aliases() == ['mytree']
+
+    assert warm(['mytree'], workers=1) == ['mytree']
+    assert Cache().get_entry('sitetrees', 'mytree')
+    Cache().empty()
+
+    compile_title.cache_clear()
+
+    assert warm(['mytree', 'unknown']) == ['mytree']
+    assert compile_title.cache_info().currsize == 2  # Public {{ subtitle }}, my model {{ model }}
+
+    # Data decoded in a thread is reused while it is not changed.
+    assert Cache().cache is Cache().cache
+
+    config = apps.get_app_config('sitetree')
+
+    # Warmed up on application handler creation.
+    monkeypatch.setattr(middleware, 'WARMUP', True)
+    monkeypatch.setattr(config, 'warmed', False)
+
+    try:
+        SitetreeMiddleware(lambda request: None)
+        assert config.warmed
+        assert gc.get_freeze_count()
+
+    finally:
+        gc.unfreeze()
+
+    # Not frozen if failed.
+    def warm_failing():
+        raise DatabaseError('no table')
+
+    monkeypatch.setattr(sitetreeapp, 'warm', warm_failing)
+
+    with pytest.warns(UserWarning, match='no table'):
+        assert not config.warm()
+
+    assert not gc.get_freeze_count()
@@ -0,0 +1,7 @@
+from sitetree.toolbox import compose_dynamic_tree, item, register_dynamic_trees, tree
+
+from .urls import urlpatterns  # noqa
+
+register_dynamic_trees(compose_dynamic_tree([tree('urlconftree', items=[
+    item('Registered in URLconf', '/urlconf/', url_as_pattern=False),
+])]), reset_cache=True)